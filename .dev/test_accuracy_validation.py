@@ -80,7 +80,8 @@ class AccuracyValidator:
     
     def __init__(self):
         self.results = defaultdict(lambda: defaultdict(list))
-        self.task_sense = TaskSense()
+        # Measure live labeling, not results cached by an earlier run
+        self.task_sense = TaskSense(label_cache_path=None)
         
     def calculate_accuracy(self, predicted_labels: List[str], expected_labels: List[str]) -> float:
         """Calculate accuracy as intersection over union (Jaccard index)"""
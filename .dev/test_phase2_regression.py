@@ -87,7 +87,7 @@ class TestModeConsistency:
     
     def test_work_mode_preferences(self):
         """Test that work mode prefers work-related labels"""
-        task_sense = TaskSense()
+        task_sense = TaskSense(label_cache_path=None)  # Label for real, not from a previous run
         
         # Test work mode with work-related task
         result = task_sense.label("Prepare quarterly report", mode="work", dry_run=False)
@@ -98,7 +98,7 @@ class TestModeConsistency:
         
     def test_personal_mode_preferences(self):
         """Test that personal mode prefers personal-related labels"""
-        task_sense = TaskSense()
+        task_sense = TaskSense(label_cache_path=None)  # Label for real, not from a previous run
         
         # Test personal mode with personal task
         result = task_sense.label("Schedule dentist appointment", mode="personal", dry_run=False)
@@ -109,7 +109,7 @@ class TestModeConsistency:
         
     def test_weekend_mode_preferences(self):
         """Test that weekend mode prefers home/family-related labels"""
-        task_sense = TaskSense()
+        task_sense = TaskSense(label_cache_path=None)  # Label for real, not from a previous run
         
         # Test weekend mode with home task
         result = task_sense.label("Clean garage", mode="weekend", dry_run=False)
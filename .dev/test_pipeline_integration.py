@@ -102,6 +102,28 @@ def test_labeling_result():
     print("✅ LabelingResult successful")
 
 
+def test_source_summary():
+    """Test the distinct label source string used in task log lines"""
+    print("Testing LabelingResult source summary...")
+    
+    result = LabelingResult(task_id="123", task_content="Test task content")
+    assert result.get_source_summary() == ""
+    
+    # Domain labels are reported as 'domain' even when a rule also produced them
+    result.applied_rules = [
+        {"label": "work", "source": "rule"},
+        {"label": "urgent", "source": "tasksense"},
+        {"label": "github", "source": "rule"}
+    ]
+    result.domain_labels = {"github"}
+    assert result.get_source_summary() == "domain,rule,tasksense"
+    
+    result.applied_rules = [{"label": "github", "source": "rule"}]
+    assert result.get_source_summary() == "domain"
+    
+    print("✅ LabelingResult source summary successful")
+
+
 def test_pipeline_stages():
     """Test pipeline stages with mock data"""
     print("Testing pipeline stages...")
@@ -230,6 +252,7 @@ def main():
         test_pipeline_creation,
         test_pipeline_factory,
         test_labeling_result,
+        test_source_summary,
         test_pipeline_stages,
         test_soft_matching,
         test_feedback_system
@@ -0,0 +1,55 @@
+"""
+Unit tests for the token-bucket rate limiter used to pace bulk Todoist API calls.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the parent directory to sys.path to import main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_does_not_block(self):
+        """Acquiring up to capacity should never sleep"""
+        bucket = main.TokenBucket(rate=0.5, capacity=5)
+
+        with patch('main.time.sleep') as mock_sleep:
+            for _ in range(5):
+                bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_empty_bucket_blocks_until_refill(self):
+        """Acquiring past capacity should wait for a refill"""
+        bucket = main.TokenBucket(rate=2.0, capacity=1)
+        bucket.acquire()
+
+        clock = [bucket.last_refill]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch('main.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('main.time.sleep', side_effect=fake_sleep) as mock_sleep:
+            bucket.acquire()
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_tokens_capped_at_capacity(self):
+        """Idle time should not accumulate more than capacity tokens"""
+        bucket = main.TokenBucket(rate=10.0, capacity=3)
+
+        with patch('main.time.monotonic', return_value=bucket.last_refill + 100):
+            bucket._refill()
+
+        self.assertEqual(bucket.tokens, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import json
 
 # Add the parent directory to sys.path to import main.py
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -34,7 +35,7 @@ class TestSectionCaching(unittest.TestCase):
         """Clean up after each test"""
         main.clear_section_cache()
     
-    @patch('main.requests.get')
+    @patch('main.SESSION.get')
     @patch('main.create_section_sync_api')
     def test_section_cache_prevents_duplicate_creation(self, mock_create_section, mock_get):
         """Test that section cache prevents duplicate section creation"""
@@ -42,6 +43,7 @@ class TestSectionCaching(unittest.TestCase):
         # Mock the initial API response - no sections exist
         mock_response = Mock()
         mock_response.json.return_value = []
+        mock_response.content = b'[]'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -75,7 +77,7 @@ class TestSectionCaching(unittest.TestCase):
             f"SECTIONS_CACHE: Using cached sections for project {self.project_id}"
         )
     
-    @patch('main.requests.get')
+    @patch('main.SESSION.get')
     def test_section_cache_finds_existing_section(self, mock_get):
         """Test that section cache correctly finds existing sections"""
         
@@ -84,6 +86,7 @@ class TestSectionCaching(unittest.TestCase):
         mock_response.json.return_value = [
             {"name": "Links", "id": self.section_id}
         ]
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -112,7 +115,7 @@ class TestSectionCaching(unittest.TestCase):
             f"SECTION_EXISTS: Section '{self.section_name}' already exists (ID: {self.section_id})"
         )
     
-    @patch('main.requests.get')
+    @patch('main.SESSION.get')
     @patch('main.create_section_sync_api')
     def test_multiple_tasks_same_section_single_creation(self, mock_create_section, mock_get):
         """Test that multiple tasks requiring the same section only create it once"""
@@ -120,6 +123,7 @@ class TestSectionCaching(unittest.TestCase):
         # Mock the initial API response - no sections exist
         mock_response = Mock()
         mock_response.json.return_value = []
+        mock_response.content = b'[]'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -201,6 +205,70 @@ class TestSectionCaching(unittest.TestCase):
         self.assertIn(normalized_name, sections)
         self.assertEqual(sections[normalized_name], self.section_id)
 
+    @patch('main.SESSION.get')
+    @patch('main.create_section_sync_api')
+    def test_created_section_reused_when_section_list_unavailable(self, mock_create_section, mock_get):
+        """A section created this run should be reused even if the section list fetch failed"""
+        mock_get.side_effect = Exception("network down")
+        mock_create_section.return_value = self.section_id
+
+        first = main.create_section_if_missing_sync(self.section_name, self.project_id, self.mock_logger)
+        second = main.create_section_if_missing_sync(self.section_name, self.project_id, self.mock_logger)
+
+        self.assertEqual(first, self.section_id)
+        self.assertEqual(second, self.section_id)
+        self.assertEqual(mock_create_section.call_count, 1)
+
+    @patch('main.get_project_sections')
+    def test_priority_section_selection_is_reused_for_same_labels(self, mock_get_sections):
+        """Tasks with the same labels in the same project should reuse the section selection"""
+        mock_get_sections.return_value = {"Links": self.section_id}
+        rules = [{"label": "link", "move_to": "Links", "priority": 1}]
+
+        first = main.select_priority_section({"link"}, rules, self.project_id, self.mock_logger)
+        second = main.select_priority_section(frozenset(["link"]), rules, self.project_id, self.mock_logger)
+
+        self.assertEqual(first["section_name"], "Links")
+        self.assertIs(first, second)
+        self.assertEqual(mock_get_sections.call_count, 1)
+
+    def test_clear_section_cache_resets_priority_selections(self):
+        """Clearing the section cache should also drop memoized section selections"""
+        main._section_cache[self.project_id] = {"Links": self.section_id}
+        rules = [{"label": "link", "move_to": "Links", "priority": 1}]
+        main.select_priority_section({"link"}, rules, self.project_id, self.mock_logger)
+
+        main.clear_section_cache()
+
+        self.assertEqual(len(main._priority_section_cache[1]), 0)
+
+    @patch('main.SESSION.get')
+    @patch('main.SESSION.post')
+    def test_sync_read_primes_section_and_label_caches(self, mock_post, mock_get):
+        """One Sync API read should answer later section and label lookups"""
+        sync_data = {
+            "labels": [{"id": "label_1", "name": "Work"}, {"id": "label_2", "name": "Old", "is_deleted": True}],
+            "sections": [
+                {"id": self.section_id, "name": " Links ", "project_id": self.project_id},
+                {"id": "section_archived", "name": "Archive", "project_id": self.project_id, "is_archived": True},
+            ],
+        }
+        mock_response = Mock()
+        mock_response.content = json.dumps(sync_data).encode()
+        mock_response.json.return_value = sync_data
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+
+        try:
+            self.assertTrue(main.prime_caches_from_sync([self.project_id, "empty_project"], self.mock_logger))
+
+            self.assertEqual(main.get_project_sections(self.project_id), {self.section_name: self.section_id})
+            self.assertEqual(main.get_project_sections("empty_project"), {})
+            self.assertEqual(main.get_existing_labels(), {"work": "label_1"})
+            mock_get.assert_not_called()
+        finally:
+            main.clear_label_cache()
+
 
 if __name__ == '__main__':
     # Run the tests
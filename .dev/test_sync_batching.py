@@ -0,0 +1,103 @@
+"""
+Unit tests for batching task updates and section moves through the Sync API.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import json
+
+# Add the parent directory to sys.path to import main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+def _sync_response(sync_status):
+    """Build a mock Sync API response with the given sync_status map"""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"sync_status": sync_status}
+    response.content = json.dumps({"sync_status": sync_status}).encode()
+    return response
+
+
+class TestSyncCommandBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_logger = Mock()
+        self.buffer = main.SyncCommandBuffer(self.mock_logger)
+
+    @patch('main.SESSION.post')
+    def test_flush_sends_commands_in_chunks(self, mock_post):
+        """Commands should be sent at most MAX_COMMANDS_PER_REQUEST per request"""
+        uuids = [self.buffer.queue_move(str(i), "section_1") for i in range(150)]
+        mock_post.side_effect = lambda url, headers, json: _sync_response(
+            {command["uuid"]: "ok" for command in json["commands"]})
+
+        results = self.buffer.flush()
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(len(mock_post.call_args_list[0].kwargs["json"]["commands"]), 100)
+        self.assertEqual(len(mock_post.call_args_list[1].kwargs["json"]["commands"]), 50)
+        self.assertTrue(all(results[u] for u in uuids))
+        self.assertEqual(len(self.buffer), 0)
+
+    @patch('main.log_task_action')
+    @patch('main.SESSION.post')
+    def test_failed_command_is_logged_against_its_task(self, mock_post, mock_log_action):
+        """A rejected command should be reported for the task it belonged to"""
+        ok_uuid = self.buffer.queue_update("1", "First task", labels=["work"])
+        failed_uuid = self.buffer.queue_move("2", "section_1", "Second task")
+        mock_post.return_value = _sync_response({ok_uuid: "ok", failed_uuid: {"error": "Item not found"}})
+
+        results = self.buffer.flush()
+
+        self.assertTrue(results[ok_uuid])
+        self.assertFalse(results[failed_uuid])
+        mock_log_action.assert_called_once()
+        args = mock_log_action.call_args.args
+        self.assertEqual(args[1:4], ("2", "Second task", "MOVE_FAILED"))
+
+    @patch('main.SESSION.post')
+    def test_rejected_commands_are_counted_as_failed(self, mock_post):
+        """Rejected commands should show up as failures in the run summary"""
+        summary = main.TaskSummary()
+        buffer = main.SyncCommandBuffer(self.mock_logger, summary=summary)
+        ok_uuid = buffer.queue_update("1", "First task", content="[Title](https://example.com)")
+        buffer.queue_update("2", "Second task", content="[Other](https://example.org)")
+        mock_post.return_value = _sync_response({ok_uuid: "ok"})
+
+        buffer.flush()
+
+        self.assertEqual(summary.tasks_failed, 1)
+
+    @patch('main.SESSION.post')
+    def test_update_task_queues_instead_of_posting(self, mock_post):
+        """update_task with a command buffer should not make its own request"""
+        task = {"id": "1", "content": "Read article", "labels": []}
+
+        success = main.update_task(task, labels_to_add=["media"], command_buffer=self.buffer)
+
+        self.assertTrue(success)
+        mock_post.assert_not_called()
+        self.assertEqual(len(self.buffer), 1)
+        command = self.buffer.commands[0]
+        self.assertEqual(command["type"], "item_update")
+        self.assertEqual(command["args"]["labels"], ["media"])
+
+    def test_queued_move_updates_current_section(self):
+        """A queued move should be visible to later routing checks in the same run"""
+        main.clear_section_cache()
+        task = {"id": "7", "content": "Read article", "section_id": None}
+
+        main.move_task_to_section(task["id"], "section_1", command_buffer=self.buffer)
+
+        self.assertEqual(main.get_current_section_id(task), "section_1")
+        main.clear_section_cache()
+        self.assertIsNone(main.get_current_section_id(task))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,56 @@ def test_mock_mode():
         if 'GPT_MOCK_MODE' in os.environ:
             del os.environ['GPT_MOCK_MODE']
 
+def test_batch_response_parsing():
+    """Test parsing a batched GPT reply."""
+    print("\n🧪 Testing batch response parsing...")
+    try:
+        task_sense = TaskSense()
+        response = '```json\n{"results": [{"i": 2, "labels": ["Work", "unknown"], "explanation": "Client call", "confidence": 0.9}, {"i": 7, "labels": ["home"]}]}\n```'
+        parsed = task_sense._parse_gpt_batch_response(response, 3, ['work', 'home'], 'personal')
+        
+        if list(parsed) != [1]:
+            print(f"❌ Unexpected task indexes: {list(parsed)}")
+            return False
+        if parsed[1]['labels'] != ['work'] or parsed[1]['confidence'] != 0.9:
+            print(f"❌ Unexpected result: {parsed[1]}")
+            return False
+        
+        print("✅ Batch response parsed correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Batch response parsing failed: {e}")
+        return False
+
+def test_label_cache():
+    """Test that GPT label results are reused for an unchanged task."""
+    print("\n🧪 Testing label cache...")
+    import tempfile
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, 'labels.db')
+            task_sense = TaskSense(label_cache_path=cache_path)
+            cache_key = task_sense._label_cache_key('Book dentist', ['health', 'admin'], 'personal')
+            
+            if task_sense._get_cached_label(cache_key) is not None or os.path.exists(cache_path):
+                print("❌ Lookup before any write should miss without creating the cache file")
+                return False
+            
+            task_sense._cache_label(cache_key, {'labels': ['health'], 'explanation': 'Appointment'})
+            
+            if task_sense._get_cached_label(cache_key) != {'labels': ['health'], 'explanation': 'Appointment'}:
+                print("❌ Cached label result not returned")
+                return False
+            if task_sense._label_cache_key('Book dentist', ['admin', 'health'], 'work') == cache_key:
+                print("❌ Cache key ignores the mode")
+                return False
+        
+        print("✅ Label cache working correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Label cache failed: {e}")
+        return False
+
 def test_config_loading():
     """Test configuration loading."""
     print("\n🧪 Testing configuration loading...")
@@ -164,6 +214,8 @@ def main():
         test_prompt_templates,
         test_dry_run_mode,
         test_mock_mode,
+        test_batch_response_parsing,
+        test_label_cache,
         test_main_integration
     ]
     
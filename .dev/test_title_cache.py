@@ -0,0 +1,65 @@
+"""
+Unit tests for the on-disk page title cache shared across runs.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+from datetime import timedelta
+
+# Add the parent directory to sys.path to import main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+class TestTitleCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "titles.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_title_survives_across_runs(self):
+        """Titles committed on close should be returned by a fresh cache"""
+        cache = main.TitleCache(self.path)
+        cache.put("https://example.com", "Example Domain")
+        cache.close()
+
+        cache = main.TitleCache(self.path)
+        self.assertEqual(cache.get("https://example.com"), "Example Domain")
+        self.assertIsNone(cache.get("https://example.org"))
+        cache.close()
+
+    def test_expired_title_is_ignored(self):
+        """Titles older than the TTL should be fetched again"""
+        cache = main.TitleCache(self.path, ttl=timedelta(days=30))
+        with patch('main.time.time', return_value=0):
+            cache.put("https://example.com", "Example Domain")
+
+        self.assertIsNone(cache.get("https://example.com"))
+        cache.close()
+
+    @patch('main._fetch_page_title', return_value="Fresh Title")
+    def test_fetch_page_title_uses_disk_cache(self, mock_fetch):
+        """A cached title should be returned without fetching the page"""
+        cache = main.TitleCache(self.path)
+        cache.put("https://example.com/cached", "Cached Title")
+        main.fetch_page_title.cache_clear()
+
+        with patch('main.TITLE_CACHE', cache):
+            self.assertEqual(main.fetch_page_title("https://example.com/cached"), "Cached Title")
+            self.assertEqual(main.fetch_page_title("https://example.com/new"), "Fresh Title")
+
+        mock_fetch.assert_called_once_with("https://example.com/new")
+        self.assertEqual(cache.get("https://example.com/new"), "Fresh Title")
+        cache.close()
+        main.fetch_page_title.cache_clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
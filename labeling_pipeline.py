@@ -5,14 +5,17 @@ This module provides a clean, modular architecture for task labeling that separa
 concerns and makes the system more maintainable and testable.
 """
 
-import re
 import logging
+import threading
 from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 # Import existing components
-from main import apply_rules_to_task, extract_all_urls, get_domain_label, create_label_if_missing, update_task, log_task_action
+from main import (apply_rules_to_task, extract_all_urls, get_domain_label, ensure_labels_exist, update_task, log_task_action, URL_RE,
+                  new_task_sense, TASKSENSE_AVAILABLE)
+if TASKSENSE_AVAILABLE:
+    from task_sense import TaskSenseBatcher
 
 
 @dataclass
@@ -24,6 +27,7 @@ class LabelingResult:
     domain_labels: Set[str] = field(default_factory=set)
     rule_labels: Set[str] = field(default_factory=set)
     applied_rules: List[Dict[str, Any]] = field(default_factory=list)
+    applied_rule_labels: Set[str] = field(default_factory=set)
     urls_found: List[Dict[str, str]] = field(default_factory=list)
     sections_to_move: List[Dict[str, Any]] = field(default_factory=list)
     success: bool = True
@@ -55,6 +59,13 @@ class LabelingResult:
         for label in self.domain_labels:
             sources[label] = 'domain'
         return sources
+    
+    def get_source_summary(self) -> str:
+        """Get the distinct label source types as a comma-separated string"""
+        sources = {rule.get('source', 'unknown') for rule in self.applied_rules if rule['label'] not in self.domain_labels}
+        if self.domain_labels:
+            sources.add('domain')
+        return ','.join(sorted(sources))
 
 
 class LabelingPipeline:
@@ -78,7 +89,9 @@ class LabelingPipeline:
                  verbose: bool = False,
                  confidence_threshold: float = 0.6,
                  soft_matching: bool = False,
-                 interactive_feedback: bool = False):
+                 interactive_feedback: bool = False,
+                 command_buffer: Optional[Any] = None,
+                 dry_run_with_network: bool = False):
         """
         Initialize the labeling pipeline.
         
@@ -93,6 +106,8 @@ class LabelingPipeline:
             confidence_threshold: Minimum confidence for label acceptance
             soft_matching: If True, suggest labels not in available_labels
             interactive_feedback: If True, enable interactive feedback loops
+            command_buffer: Optional SyncCommandBuffer to queue label updates on
+            dry_run_with_network: If True, still call TaskSense/GPT during dry runs
         """
         self.rules = rules
         self.gpt_fallback = gpt_fallback
@@ -104,8 +119,17 @@ class LabelingPipeline:
         self.confidence_threshold = confidence_threshold
         self.soft_matching = soft_matching
         self.interactive_feedback = interactive_feedback
+        self.command_buffer = command_buffer
+        self.dry_run_with_network = dry_run_with_network
+        
+        # Concurrent run() calls share TaskSense requests through the batcher
+        self.task_sense = None
+        if TASKSENSE_AVAILABLE and gpt_fallback and gpt_fallback.get('enabled'):
+            self.task_sense = TaskSenseBatcher(new_task_sense(tasksense_config))
         
-        # Statistics
+        # Statistics (run() may be called from worker threads)
+        self._stats_lock = threading.Lock()
+        self._label_lock = threading.Lock()
         self.stats = {
             'tasks_processed': 0,
             'labels_applied': 0,
@@ -116,6 +140,11 @@ class LabelingPipeline:
             'soft_matched': 0
         }
     
+    def _count(self, stat: str, amount: int = 1):
+        """Increment a pipeline statistic"""
+        with self._stats_lock:
+            self.stats[stat] += amount
+    
     def run(self, task: Dict[str, Any]) -> LabelingResult:
         """
         Execute the complete labeling pipeline for a task.
@@ -150,7 +179,7 @@ class LabelingPipeline:
             if self.interactive_feedback:
                 result = self._check_feedback_needed(task, result)
             
-            self.stats['tasks_processed'] += 1
+            self._count('tasks_processed')
             
         except Exception as e:
             result.success = False
@@ -167,14 +196,20 @@ class LabelingPipeline:
         Stage 1: Apply TaskSense and rule-based labeling
         """
         try:
+            # Dry runs preview rule matches only, unless AI calls were explicitly requested
+            gpt_fallback = self.gpt_fallback
+            if self.dry_run and not self.dry_run_with_network:
+                gpt_fallback = None
+            
             # Use existing apply_rules_to_task function but capture more details
             rule_labels, applied_rules = apply_rules_to_task(
-                task, self.rules, self.gpt_fallback, self.logger, 
-                self.mode, self.tasksense_config
+                task, self.rules, gpt_fallback, self.logger, 
+                self.mode, self.tasksense_config, task_sense=self.task_sense
             )
             
             result.rule_labels = set(rule_labels)
             result.applied_rules = applied_rules
+            result.applied_rule_labels = {rule['label'] for rule in applied_rules if rule.get('label')}
             
             # Extract confidence scores and explanations
             for rule in applied_rules:
@@ -186,9 +221,9 @@ class LabelingPipeline:
             
             # Track statistics
             if any(rule.get('source') == 'tasksense' for rule in applied_rules):
-                self.stats['tasksense_used'] += 1
+                self._count('tasksense_used')
             if any(rule.get('source') == 'rule' for rule in applied_rules):
-                self.stats['rules_used'] += 1
+                self._count('rules_used')
             
             if self.verbose:
                 self.logger.info(f"Intelligent labeling found {len(rule_labels)} labels for task {task['id']}")
@@ -206,7 +241,7 @@ class LabelingPipeline:
         """
         try:
             content = task['content']
-            has_any_link = re.search(r'https?://\S+', content)
+            has_any_link = URL_RE.search(content)
             
             if has_any_link:
                 urls = extract_all_urls(content)
@@ -224,7 +259,7 @@ class LabelingPipeline:
                         result.confidence_scores[domain_label] = 0.95  # High confidence for domain detection
                         result.explanations[domain_label] = f"Detected from URL: {url_info['url']}"
                 
-                self.stats['domains_detected'] += len(result.domain_labels)
+                self._count('domains_detected', len(result.domain_labels))
                 
         except Exception as e:
             self.logger.error(f"Domain detection failed for task {task['id']}: {e}")
@@ -248,7 +283,7 @@ class LabelingPipeline:
                 if confidence >= self.confidence_threshold:
                     filtered_labels.add(label)
                 else:
-                    self.stats['confidence_filtered'] += 1
+                    self._count('confidence_filtered')
                     if self.verbose:
                         self.logger.info(f"Filtered label '{label}' due to low confidence: {confidence:.2f}")
             
@@ -261,7 +296,7 @@ class LabelingPipeline:
                 for label in filtered_labels:
                     if label not in available_labels and result.confidence_scores.get(label, 0.8) >= self.confidence_threshold:
                         soft_matches.append(label)
-                        self.stats['soft_matched'] += 1
+                        self._count('soft_matched')
                 
                 result.soft_matched_labels = soft_matches
                 
@@ -312,17 +347,20 @@ class LabelingPipeline:
         try:
             if result.labels_applied:
                 # Handle label creation for rules that require it
-                for rule_info in result.applied_rules:
-                    if rule_info.get('create_if_missing', False) and rule_info['label'] in result.labels_applied:
-                        if not self.dry_run:
-                            create_label_if_missing(rule_info['label'], self.logger)
+                labels_to_create = {rule_info['label'] for rule_info in result.applied_rules
+                                    if rule_info.get('create_if_missing', False) and rule_info['label'] in result.labels_applied}
+                if labels_to_create and not self.dry_run:
+                    # Serialize creation so concurrent tasks don't create the same label twice
+                    with self._label_lock:
+                        ensure_labels_exist(labels_to_create, self.logger)
                 
                 # Apply labels to task
-                success = update_task(task, None, None, result.labels_applied, None, self.dry_run)
+                success = update_task(task, None, None, result.labels_applied, None, self.dry_run,
+                                      command_buffer=self.command_buffer)
                 result.success = success
                 
                 if success:
-                    self.stats['labels_applied'] += len(result.labels_applied)
+                    self._count('labels_applied', len(result.labels_applied))
                     
                     # Log the labeling action
                     action = "LABELED_DRY_RUN" if self.dry_run else "LABELED"
@@ -465,7 +503,8 @@ class PipelineFactory:
                           gpt_fallback: Optional[Dict[str, Any]] = None,
                           tasksense_config: Optional[Dict[str, Any]] = None,
                           cli_args: Optional[Any] = None,
-                          logger: Optional[logging.Logger] = None) -> LabelingPipeline:
+                          logger: Optional[logging.Logger] = None,
+                          command_buffer: Optional[Any] = None) -> LabelingPipeline:
         """
         Create a LabelingPipeline from configuration and CLI arguments.
         
@@ -475,6 +514,7 @@ class PipelineFactory:
             tasksense_config: TaskSense configuration
             cli_args: Parsed CLI arguments
             logger: Logger instance
+            command_buffer: Optional SyncCommandBuffer to queue label updates on
             
         Returns:
             Configured LabelingPipeline instance
@@ -494,6 +534,7 @@ class PipelineFactory:
         
         # Get soft matching from CLI args
         soft_matching = getattr(cli_args, 'soft_matching', False)
+        dry_run_with_network = getattr(cli_args, 'dry_run_with_network', False)
         
         return LabelingPipeline(
             rules=rules,
@@ -504,5 +545,7 @@ class PipelineFactory:
             dry_run=dry_run,
             verbose=verbose,
             confidence_threshold=confidence_threshold,
-            soft_matching=soft_matching
+            soft_matching=soft_matching,
+            command_buffer=command_buffer,
+            dry_run_with_network=dry_run_with_network
         )
\ No newline at end of file
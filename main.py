@@ -4,11 +4,25 @@ from dotenv import load_dotenv
 load_dotenv()
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import argparse
 import logging
+import threading
+import time
+import uuid
+import functools
+import heapq
+import itertools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from urllib.parse import urlparse
 from datetime import datetime, timezone, timedelta
 import json
+import html
+import importlib.util
 # OpenAI import - fallback to requests if package has issues
 try:
     from openai import OpenAI
@@ -16,6 +30,20 @@ try:
 except Exception:
     OPENAI_AVAILABLE = False
 
+# orjson import - faster decoding of Todoist API responses, fallback to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyahocorasick import - single-pass "contains" keyword matching, fallback to per-rule scans
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # TaskSense AI Engine import
 try:
     from task_sense import TaskSense
@@ -30,6 +58,9 @@ try:
 except ImportError:
     PIPELINE_AVAILABLE = False
 
+# lxml - C HTML parser for BeautifulSoup when installed, fallback to the pure-Python html.parser
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
 # Try to import rich for colored output, fallback to regular print
 try:
     from rich.console import Console
@@ -39,13 +70,26 @@ except ImportError:
     console = None
     HAS_RICH = False
 
+# Matches any http(s) URL in task content
+URL_RE = re.compile(r'https?://\S+')
+
 # Module-level section cache to prevent duplicate section creation within a single run
 _section_cache = {}
 
+# Task ID -> section the task was moved to during this run, since fetched task dicts go stale
+_moved_task_sections = {}
+
+# (project_id, section name) -> ID of sections created during this run
+_created_sections = {}
+_section_create_lock = threading.Lock()
+
 def clear_section_cache():
     """Clear section cache for new execution run"""
     global _section_cache
     _section_cache.clear()
+    _moved_task_sections.clear()
+    _created_sections.clear()
+    _priority_section_cache[1].clear()
 
 class TaskSummary:
     def __init__(self):
@@ -53,9 +97,9 @@ class TaskSummary:
         self.tasks_labeled = 0
         self.tasks_skipped = 0
         self.tasks_failed = 0
-        self.skipped_reasons = []
-        self.failed_reasons = []
-        self.domain_labels_added = {}  # Track domain-specific labels
+        self.skipped_reasons = Counter()
+        self.failed_reasons = Counter()
+        self.domain_labels_added = Counter()  # Track domain-specific labels
     
     def updated(self):
         self.tasks_updated += 1
@@ -63,15 +107,15 @@ class TaskSummary:
     def labeled(self, domain_label=None):
         self.tasks_labeled += 1
         if domain_label and domain_label != "link":
-            self.domain_labels_added[domain_label] = self.domain_labels_added.get(domain_label, 0) + 1
+            self.domain_labels_added[domain_label] += 1
     
     def skipped(self, reason):
         self.tasks_skipped += 1
-        self.skipped_reasons.append(reason)
+        self.skipped_reasons[reason] += 1
     
     def failed(self, reason):
         self.tasks_failed += 1
-        self.failed_reasons.append(reason)
+        self.failed_reasons[reason] += 1
     
     def print_summary(self, dry_run=False):
         """Print a clean summary of the processing results"""
@@ -92,13 +136,11 @@ class TaskSummary:
                         console.print(f"   • {count}x #{domain} labels added", style="dim blue")
             if self.tasks_skipped > 0:
                 console.print(f"⚠️  {self.tasks_skipped} tasks skipped", style="yellow")
-                for reason in set(self.skipped_reasons):
-                    count = self.skipped_reasons.count(reason)
+                for reason, count in self.skipped_reasons.items():
                     console.print(f"   • {count}x {reason}", style="dim yellow")
             if self.tasks_failed > 0:
                 console.print(f"❌ {self.tasks_failed} tasks failed", style="red")
-                for reason in set(self.failed_reasons):
-                    count = self.failed_reasons.count(reason)
+                for reason, count in self.failed_reasons.items():
                     console.print(f"   • {count}x {reason}", style="dim red")
         else:
             print("\n" + "="*50)
@@ -117,13 +159,11 @@ class TaskSummary:
                         print(f"   • {count}x #{domain} labels added")
             if self.tasks_skipped > 0:
                 print(f"⚠️  {self.tasks_skipped} tasks skipped")
-                for reason in set(self.skipped_reasons):
-                    count = self.skipped_reasons.count(reason)
+                for reason, count in self.skipped_reasons.items():
                     print(f"   • {count}x {reason}")
             if self.tasks_failed > 0:
                 print(f"❌ {self.tasks_failed} tasks failed")
-                for reason in set(self.failed_reasons):
-                    count = self.failed_reasons.count(reason)
+                for reason, count in self.failed_reasons.items():
                     print(f"   • {count}x {reason}")
 
 def log_info(message, style="white"):
@@ -148,6 +188,41 @@ def log_error(message):
     """Print error message"""
     log_info(message, "red")
 
+def truncate_text(text, length, ellipsis="..."):
+    """Shorten text to length characters, adding an ellipsis if anything was cut"""
+    return text if len(text) <= length else text[:length] + ellipsis
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets a large write buffer coalesce records.
+    
+    logging.FileHandler flushes after every record, which means one write syscall per
+    log line. Here records are only flushed at flush_level and above, when the buffer
+    fills, and when the handler is flushed or closed (logging flushes on exit).
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, buffer_size=64 * 1024, flush_level=logging.ERROR):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 def setup_task_logging():
     """Setup file logging for task processing"""
@@ -159,8 +234,8 @@ def setup_task_logging():
     for handler in task_logger.handlers[:]:
         task_logger.removeHandler(handler)
     
-    # Create file handler
-    file_handler = logging.FileHandler('task_log.txt', mode='a', encoding='utf-8')
+    # Create buffered file handler (dozens of records per task; flushed on errors and at exit)
+    file_handler = BufferedFileHandler('task_log.txt', mode='a', encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     
     # Create formatter with timestamp
@@ -211,7 +286,7 @@ def setup_feedback_logging(config=None):
 def log_feedback_action(feedback_logger, task_id, task_content, action, **kwargs):
     """Log feedback action with structured data for future analysis"""
     # Truncate very long content for readability
-    content_preview = task_content[:100] + "..." if len(task_content) > 100 else task_content
+    content_preview = truncate_text(task_content, 100)
     
     log_parts = [
         f"FEEDBACK",
@@ -231,7 +306,7 @@ def log_feedback_action(feedback_logger, task_id, task_content, action, **kwargs
         log_parts.append(f"Confidence: {kwargs['confidence']:.2f}")
     
     if 'explanation' in kwargs and kwargs['explanation']:
-        explanation_preview = kwargs['explanation'][:100] + "..." if len(kwargs['explanation']) > 100 else kwargs['explanation']
+        explanation_preview = truncate_text(kwargs['explanation'], 100)
         log_parts.append(f"Explanation: {repr(explanation_preview)}")
     
     if 'section' in kwargs and kwargs['section']:
@@ -260,12 +335,16 @@ def get_last_run_timestamp():
         return datetime.now(timezone.utc) - timedelta(hours=1)
 
 
-def save_last_run_timestamp():
-    """Save the current timestamp as the last successful run"""
+def save_last_run_timestamp(run_time=None):
+    """Save the given time (default: now) as the last successful run"""
     try:
-        timestamp = datetime.now(timezone.utc).isoformat()
-        with open('last_run.txt', 'w') as f:
+        timestamp = (run_time or datetime.now(timezone.utc)).isoformat()
+        # Write a temp file and swap it in, so a crash mid-write never leaves a torn timestamp
+        with open('last_run.txt.tmp', 'w') as f:
             f.write(timestamp)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace('last_run.txt.tmp', 'last_run.txt')
     except Exception as e:
         log_warning(f"Failed to save last run timestamp: {e}")
 
@@ -281,7 +360,12 @@ def parse_todoist_datetime(date_str):
         return None
 
 
-def should_process_task(task, last_run_time, task_logger=None, fix_sections=False, rules=None):
+def get_section_rule_labels(rules):
+    """Return the set of rule labels that route tasks to a section (rules with move_to)"""
+    return frozenset(get_rule_section_index(rules))
+
+
+def should_process_task(task, last_run_time, task_logger=None, fix_sections=False, rules=None, section_rule_labels=None):
     """Determine if a task should be processed based on creation time and existing labels"""
     task_id = task['id']
     content = task['content']
@@ -302,25 +386,32 @@ def should_process_task(task, last_run_time, task_logger=None, fix_sections=Fals
         if rules is None:
             rules, _, _ = load_unified_config()
         
-        for rule in rules:
-            rule_label = rule.get('label')
-            rule_move_to = rule.get('move_to')
-            if rule_label and rule_move_to and rule_label in existing_labels:
-                # This task has a label that should be moved to a section
-                # Check if it's missing a section or in the wrong section
-                if not section_id:
+        # Fast path: none of the task's labels route to a section
+        if section_rule_labels is None:
+            section_rule_labels = get_section_rule_labels(rules)
+        if existing_labels.isdisjoint(section_rule_labels):
+            if task_logger:
+                task_logger.info(f"Task {task_id} | Skipping: no section fixes needed")
+            return False, "no section fixes needed"
+        
+        for rule in get_section_rules_for_labels(existing_labels, rules):
+            rule_label = rule['label']
+            rule_move_to = rule['move_to']
+            # This task has a label that should be moved to a section
+            # Check if it's missing a section or in the wrong section
+            if not section_id:
+                if task_logger:
+                    task_logger.info(f"Task {task_id} | Processing: has '{rule_label}' label but missing section (should be in '{rule_move_to}')")
+                return True, "needs section routing"
+            else:
+                # Check if task is in wrong section
+                current_section_name = get_section_name_by_id(section_id, task.get('project_id'), task_logger)
+                target_section_name = rule_move_to
+                
+                if current_section_name and current_section_name != target_section_name:
                     if task_logger:
-                        task_logger.info(f"Task {task_id} | Processing: has '{rule_label}' label but missing section (should be in '{rule_move_to}')")
-                    return True, "needs section routing"
-                else:
-                    # Check if task is in wrong section
-                    current_section_name = get_section_name_by_id(section_id, task.get('project_id'), task_logger)
-                    target_section_name = rule_move_to
-                    
-                    if current_section_name and current_section_name != target_section_name:
-                        if task_logger:
-                            task_logger.info(f"Task {task_id} | Processing: has '{rule_label}' label in wrong section ('{current_section_name}' → '{target_section_name}')")
-                        return True, f"needs section routing: {current_section_name} → {target_section_name}"
+                        task_logger.info(f"Task {task_id} | Processing: has '{rule_label}' label in wrong section ('{current_section_name}' → '{target_section_name}')")
+                    return True, f"needs section routing: {current_section_name} → {target_section_name}"
         
         # In fix_sections mode, skip tasks that don't need section fixes
         if task_logger:
@@ -337,10 +428,19 @@ def should_process_task(task, last_run_time, task_logger=None, fix_sections=Fals
     # Get task labels for processing
     existing_labels = set(task.get('labels', []))
     
-    # Check if task has URLs
-    has_any_link = re.search(r'https?://\S+', content)
+    # Check if task has URLs (substring test first so link-free tasks skip the regex)
+    has_any_link = 'http' in content and URL_RE.search(content)
     
     if has_any_link:
+        # Already tagged as a link and no known domain appears anywhere in the content:
+        # no domain label could be missing, so skip without extracting the URLs
+        if 'link' in existing_labels:
+            content_lower = content.lower()
+            if not any(domain in content_lower for domain in DOMAIN_LABELS):
+                if task_logger:
+                    task_logger.info(f"Task {task_id} | SKIP_ALREADY_LABELED: already has all expected URL labels {{'link'}} | Content: {content[:60]}...")
+                return False, "already fully labeled"
+        
         # For URL tasks, check if they have expected URL labels
         urls = extract_all_urls(content)
         expected_labels = set(['link'])
@@ -363,8 +463,7 @@ def should_process_task(task, last_run_time, task_logger=None, fix_sections=Fals
 def load_rules(rules_file='rules.json'):
     """Load labeling rules and GPT fallback config from JSON file"""
     try:
-        with open(rules_file, 'r') as f:
-            config = json.load(f)
+        config = _load_json_file(rules_file)
         
         # Handle both old format (array) and new format (object with rules and gpt_fallback)
         if isinstance(config, list):
@@ -405,8 +504,7 @@ def load_unified_config(cli_args=None):
     # 1. Load TaskSense config (primary source)
     config_path = os.getenv('TASK_SENSE_CONFIG_PATH', 'task_sense_config.json')
     try:
-        with open(config_path, 'r') as f:
-            tasksense_config = json.load(f)
+        tasksense_config = _load_json_file(config_path)
             
         # Extract GPT fallback from TaskSense config
         gpt_fallback = tasksense_config.get('gpt_fallback')
@@ -427,8 +525,7 @@ def load_unified_config(cli_args=None):
     # 2. Load rules.json (for labeling rules and fallback GPT config)
     rules_path = os.getenv('RULES_CONFIG_PATH', 'rules.json')
     try:
-        with open(rules_path, 'r') as f:
-            rules_config = json.load(f)
+        rules_config = _load_json_file(rules_path)
             
         # Handle both old format (array) and new format (object with rules and gpt_fallback)
         if isinstance(rules_config, list):
@@ -469,48 +566,172 @@ def load_unified_config(cli_args=None):
     return rules, gpt_fallback, tasksense_config
 
 
-def evaluate_rule(rule, task_content):
-    """Evaluate a single rule against task content"""
-    content_lower = task_content.lower()
+def compile_rule(rule):
+    """
+    Specialize a rule into a matcher function taking (content, content_lower, content_stripped).
     
+    Keywords are lowercased and regexes compiled once, and the lowercased and stripped
+    content are computed once per task by the caller, so matching only does the work
+    specific to that rule type.
+    """
     # URL matcher
     if rule.get("match") == "url":
-        return bool(re.search(r'https?://\S+', task_content))
+        return lambda content, content_lower, content_stripped: URL_RE.search(content) is not None
     
     # Contains matcher
     if "contains" in rule:
         keywords = rule["contains"]
         if isinstance(keywords, str):
             keywords = [keywords]
-        return any(keyword.lower() in content_lower for keyword in keywords)
+        keywords = tuple(keyword.lower() for keyword in keywords)
+        return lambda content, content_lower, content_stripped: any(keyword in content_lower for keyword in keywords)
     
     # Prefix matcher
     if "prefix" in rule:
         prefix = rule["prefix"]
-        return task_content.strip().startswith(prefix)
+        return lambda content, content_lower, content_stripped: content_stripped.startswith(prefix)
     
     # Regex matcher
     if "regex" in rule:
+        pattern = rule["regex"]
         try:
-            pattern = rule["regex"]
-            return bool(re.search(pattern, task_content, re.IGNORECASE))
+            compiled = re.compile(pattern, re.IGNORECASE)
         except re.error as e:
             log_warning(f"Invalid regex pattern '{pattern}': {e}")
-            return False
+            return lambda content, content_lower, content_stripped: False
+        return lambda content, content_lower, content_stripped: compiled.search(content) is not None
     
-    return False
+    return lambda content, content_lower, content_stripped: False
+
+
+# Compiled matchers for the current rules list, rebuilt only when a different list is passed in
+_compiled_rules = (None, [], None)
+
+
+def is_contains_rule(rule):
+    """Whether compile_rule treats this rule as a keyword "contains" matcher"""
+    return rule.get("match") != "url" and "contains" in rule
+
+
+def build_contains_automaton(rules):
+    """
+    Build one Aho-Corasick automaton over every "contains" keyword in the rules.
+    
+    Each keyword maps to the indexes of the rules that list it, so a single pass over
+    the lowercased content finds every matching contains-rule. Returns None when
+    pyahocorasick is not installed or no rule has keywords.
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    
+    keyword_rules = {}
+    for i, rule in enumerate(rules):
+        if not is_contains_rule(rule):
+            continue
+        keywords = rule["contains"]
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        for keyword in keywords:
+            if keyword:
+                keyword_rules.setdefault(keyword.lower(), set()).add(i)
+    
+    if not keyword_rules:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, rule_indexes in keyword_rules.items():
+        automaton.add_word(keyword, frozenset(rule_indexes))
+    automaton.make_automaton()
+    return automaton
+
+
+def _compile_rules(rules):
+    """Compile matchers and the contains-keyword automaton once per rules list"""
+    global _compiled_rules
+    if _compiled_rules[0] is not rules:
+        compiled = [(i, rule, compile_rule(rule)) for i, rule in enumerate(rules)]
+        _compiled_rules = (rules, compiled, build_contains_automaton(rules))
+    return _compiled_rules
+
+
+def get_compiled_rules(rules):
+    """Return (rule index, rule, matcher) for every rule, compiling them once per rules list"""
+    return _compile_rules(rules)[1]
+
+
+def get_contains_automaton(rules):
+    """Return the Aho-Corasick automaton for the rules' contains keywords, or None"""
+    return _compile_rules(rules)[2]
+
+
+def evaluate_rule(rule, task_content):
+    """Evaluate a single rule against task content"""
+    return compile_rule(rule)(task_content, task_content.lower(), task_content.strip())
+
+
+def new_task_sense(tasksense_config=None):
+    """Create a TaskSense engine, using the already loaded config when there is one"""
+    if tasksense_config:
+        task_sense = TaskSense(config_path=None)
+        task_sense.config = tasksense_config
+        return task_sense
+    return TaskSense()
+
+
+def prelabel_with_tasksense(contents, tasksense_config=None, mode=None, task_logger=None):
+    """
+    Label the contents of tasks no rule matched with batched TaskSense requests.
+    
+    Returns {content: TaskSense result} for apply_ai_fallback, so the AI fallback
+    costs one request per batch of tasks instead of one per task.
+    """
+    # Identical tasks share one result
+    pending = list(dict.fromkeys(contents))
+    if not pending:
+        return {}
+    
+    try:
+        results = new_task_sense(tasksense_config).label_batch(pending, dry_run=False, mode=mode)
+    except Exception as e:
+        if task_logger:
+            task_logger.warning(f"TASKSENSE_BATCH_ERROR: {str(e)}, labeling tasks individually")
+        return {}
+    
+    if task_logger:
+        task_logger.info(f"TASKSENSE_BATCH: Labeled {len(pending)} unmatched tasks in batches")
+    return dict(zip(pending, results))
 
 
-def apply_rules_to_task(task, rules, gpt_fallback=None, task_logger=None, mode=None, tasksense_config=None):
-    """Apply all matching rules to a task and return labels to add, with TaskSense and GPT fallback"""
+def apply_rules_to_task(task, rules, gpt_fallback=None, task_logger=None, mode=None, tasksense_config=None, tasksense_results=None,
+                        task_sense=None):
+    """
+    Apply all matching rules to a task and return labels to add, with TaskSense and GPT fallback.
+    
+    task_sense may be a shared TaskSense or TaskSenseBatcher; otherwise one is created from tasksense_config.
+    """
     content = task['content']
     task_id = task['id']
     labels_to_add = []
     applied_rules = []
     
     # First, try rule-based matching
-    for i, rule in enumerate(rules):
-        if evaluate_rule(rule, content):
+    content_lower = content.lower()
+    content_stripped = content.strip()
+    
+    # With an automaton, every contains-rule is decided in one pass over the content
+    automaton = get_contains_automaton(rules)
+    contains_hits = None
+    if automaton is not None:
+        contains_hits = set()
+        for _, rule_indexes in automaton.iter(content_lower):
+            contains_hits.update(rule_indexes)
+    
+    for i, rule, matcher in get_compiled_rules(rules):
+        if contains_hits is not None and is_contains_rule(rule):
+            matched = i in contains_hits
+        else:
+            matched = matcher(content, content_lower, content_stripped)
+        if matched:
             label = rule.get("label")
             if label:
                 labels_to_add.append(label)
@@ -530,60 +751,74 @@ def apply_rules_to_task(task, rules, gpt_fallback=None, task_logger=None, mode=N
     
     # If no rules matched and AI fallback is enabled, try TaskSense first, then GPT
     if not labels_to_add and gpt_fallback and gpt_fallback.get('enabled'):
-        # Try TaskSense first if available
-        if TASKSENSE_AVAILABLE:
-            try:
-                # Initialize TaskSense with updated config
-                if tasksense_config:
-                    task_sense = TaskSense(config_path=None)
-                    task_sense.config = tasksense_config
-                else:
-                    task_sense = TaskSense()
-                    
-                result = task_sense.label(content, dry_run=False, mode=mode)
+        return apply_ai_fallback(task, gpt_fallback, task_logger, mode, tasksense_config, tasksense_results, task_sense)
+    
+    return labels_to_add, applied_rules
+
+
+def apply_ai_fallback(task, gpt_fallback, task_logger=None, mode=None, tasksense_config=None, tasksense_results=None,
+                      task_sense=None):
+    """
+    Label a task no rule matched: TaskSense first, then GPT. Returns (labels, applied rule infos).
+    
+    tasksense_results holds batched TaskSense results by content (see prelabel_with_tasksense).
+    """
+    content = task['content']
+    task_id = task['id']
+    labels_to_add = []
+    applied_rules = []
+    
+    # Try TaskSense first if available
+    if TASKSENSE_AVAILABLE:
+        try:
+            # Use the batched result when the task was prelabeled
+            if tasksense_results and content in tasksense_results:
+                result = tasksense_results[content]
+            else:
+                result = (task_sense or new_task_sense(tasksense_config)).label(content, dry_run=False, mode=mode)
+            
+            if result and result.get('labels'):
+                tasksense_labels = result['labels']
+                labels_to_add.extend(tasksense_labels)
                 
-                if result and result.get('labels'):
-                    tasksense_labels = result['labels']
-                    labels_to_add.extend(tasksense_labels)
-                    
-                    for label in tasksense_labels:
-                        rule_info = {
-                            "label": label,
-                            "matcher": "tasksense",
-                            "create_if_missing": gpt_fallback.get("create_if_missing", False),
-                            "source": "tasksense",
-                            "explanation": result.get('explanation', ''),
-                            "confidence": result.get('confidence', 0.8),
-                            "engine_meta": result.get('engine_meta', {})
-                        }
-                        applied_rules.append(rule_info)
-                        
-                        if task_logger:
-                            explanation = result.get('explanation', '')
-                            confidence = result.get('confidence', 0.8)
-                            version = result.get('engine_meta', {}).get('version', 'unknown')
-                            task_logger.info(f"Task {task_id} | TASKSENSE_MATCH: TaskSense ({version}) suggested label → #{label} (confidence: {confidence:.2f}) | {explanation}")
-                            
-            except Exception as e:
-                if task_logger:
-                    task_logger.warning(f"Task {task_id} | TASKSENSE_ERROR: {str(e)}, falling back to GPT")
-        
-        # Fallback to original GPT if TaskSense failed or unavailable
-        if not labels_to_add:
-            gpt_labels = get_gpt_labels(content, gpt_fallback, task_logger, task_id)
-            if gpt_labels:
-                labels_to_add.extend(gpt_labels)
-                for label in gpt_labels:
+                for label in tasksense_labels:
                     rule_info = {
                         "label": label,
-                        "matcher": "gpt",
+                        "matcher": "tasksense",
                         "create_if_missing": gpt_fallback.get("create_if_missing", False),
-                        "source": "gpt"
+                        "source": "tasksense",
+                        "explanation": result.get('explanation', ''),
+                        "confidence": result.get('confidence', 0.8),
+                        "engine_meta": result.get('engine_meta', {})
                     }
                     applied_rules.append(rule_info)
                     
                     if task_logger:
-                        task_logger.info(f"Task {task_id} | GPT_MATCH: GPT suggested label → #{label}")
+                        explanation = result.get('explanation', '')
+                        confidence = result.get('confidence', 0.8)
+                        version = result.get('engine_meta', {}).get('version', 'unknown')
+                        task_logger.info(f"Task {task_id} | TASKSENSE_MATCH: TaskSense ({version}) suggested label → #{label} (confidence: {confidence:.2f}) | {explanation}")
+                        
+        except Exception as e:
+            if task_logger:
+                task_logger.warning(f"Task {task_id} | TASKSENSE_ERROR: {str(e)}, falling back to GPT")
+    
+    # Fallback to original GPT if TaskSense failed or unavailable
+    if not labels_to_add:
+        gpt_labels = get_gpt_labels(content, gpt_fallback, task_logger, task_id)
+        if gpt_labels:
+            labels_to_add.extend(gpt_labels)
+            for label in gpt_labels:
+                rule_info = {
+                    "label": label,
+                    "matcher": "gpt",
+                    "create_if_missing": gpt_fallback.get("create_if_missing", False),
+                    "source": "gpt"
+                }
+                applied_rules.append(rule_info)
+                
+                if task_logger:
+                    task_logger.info(f"Task {task_id} | GPT_MATCH: GPT suggested label → #{label}")
     
     return labels_to_add, applied_rules
 
@@ -623,22 +858,43 @@ def get_rule_description(rule):
         return "unknown rule"
 
 
+# Lowercased label name -> label ID, fetched once per run and kept current as labels are created
+_label_cache = None
+
+
+def clear_label_cache():
+    """Clear label cache for new execution run"""
+    global _label_cache
+    _label_cache = None
+
+
+def get_existing_labels(task_logger=None):
+    """Return {lowercased name: id} for the account's labels, fetching them on first use"""
+    global _label_cache
+    if _label_cache is None:
+        r = SESSION.get(TODOIST_LABELS_URL, headers=HEADERS)
+        r.raise_for_status()
+        _label_cache = {label['name'].lower(): label['id'] for label in _loads(r)}
+        if task_logger:
+            task_logger.info(f"LABELS: Retrieved {len(_label_cache)} labels")
+    return _label_cache
+
+
 def create_label_if_missing(label_name, task_logger=None):
     """Create a label if it doesn't exist"""
     try:
         # Check if label already exists
-        r = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
-        r.raise_for_status()
-        existing_labels = {label['name'].lower(): label['id'] for label in r.json()}
+        existing_labels = get_existing_labels(task_logger)
         
         if label_name.lower() in existing_labels:
             return existing_labels[label_name.lower()]
         
         # Create new label
-        create_resp = requests.post(f"{TODOIST_API}/labels", headers=HEADERS, 
+        create_resp = SESSION.post(TODOIST_LABELS_URL, headers=HEADERS, 
                                   json={"name": label_name})
         if create_resp.status_code in (200, 201):
-            label_data = create_resp.json()
+            label_data = _loads(create_resp)
+            existing_labels[label_name.lower()] = label_data['id']
             if task_logger:
                 task_logger.info(f"LABEL_CREATED: Created new label '#{label_name}' (ID: {label_data['id']})")
             log_info(f"📝 Created new label: #{label_name}")
@@ -654,6 +910,21 @@ def create_label_if_missing(label_name, task_logger=None):
         return None
 
 
+def ensure_labels_exist(label_names, task_logger=None):
+    """
+    Make sure every label in label_names exists, creating only the missing ones.
+    
+    Returns:
+        dict: label name -> label ID for the labels that exist (or were created)
+    """
+    label_ids = {}
+    for label_name in set(label_names):
+        label_id = create_label_if_missing(label_name, task_logger)
+        if label_id:
+            label_ids[label_name] = label_id
+    return label_ids
+
+
 def get_gpt_labels(content, gpt_config, task_logger=None, task_id=None):
     """Get label suggestions from GPT for a task"""
     try:
@@ -723,10 +994,10 @@ def get_gpt_labels(content, gpt_config, task_logger=None, task_id=None):
             "temperature": 0.3
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = SESSION.post(url, headers=headers, json=data, timeout=30)
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response)
             if result.get('choices') and result['choices'][0].get('message', {}).get('content'):
                 raw_response = result['choices'][0]['message']['content'].strip()
                 
@@ -770,6 +1041,11 @@ def _get_mock_gpt_labels(content):
         return ['personal']
 
 
+def get_current_section_id(task):
+    """Return the task's section, accounting for moves made earlier in this run"""
+    return _moved_task_sections.get(task['id'], task.get('section_id'))
+
+
 def get_project_sections(project_id, task_logger=None, use_cache=True):
     """Get all sections for a project with optional caching"""
     global _section_cache
@@ -781,9 +1057,9 @@ def get_project_sections(project_id, task_logger=None, use_cache=True):
         return _section_cache[project_id]
     
     try:
-        response = requests.get(f"{TODOIST_API}/sections?project_id={project_id}", headers=HEADERS)
+        response = SESSION.get(f"{TODOIST_SECTIONS_URL}?project_id={project_id}", headers=HEADERS)
         response.raise_for_status()
-        sections = response.json()
+        sections = _loads(response)
         
         if task_logger:
             task_logger.info(f"SECTIONS: Retrieved {len(sections)} sections for project {project_id}")
@@ -794,6 +1070,7 @@ def get_project_sections(project_id, task_logger=None, use_cache=True):
         # Cache the result
         if use_cache:
             _section_cache[project_id] = section_dict
+            _priority_section_cache[1].clear()
         
         return section_dict
     except Exception as e:
@@ -803,33 +1080,132 @@ def get_project_sections(project_id, task_logger=None, use_cache=True):
         return {}
 
 
+def prime_caches_from_sync(project_ids, task_logger=None):
+    """
+    Load every label and the given projects' sections with a single Sync API read.
+    
+    Fills the label and section caches up front so later lookups don't each cost a
+    GET. Projects without sections are cached as empty. Returns False (caches left to
+    fill lazily over REST) if the read fails.
+    """
+    global _label_cache
+    try:
+        response = SESSION.post(TODOIST_SYNC_API, headers=HEADERS,
+                                json={"sync_token": "*", "resource_types": ["labels", "sections"]})
+        response.raise_for_status()
+        data = _loads(response)
+    except Exception as e:
+        if task_logger:
+            task_logger.warning(f"SYNC_READ_ERROR: Falling back to per-request label and section lookups: {e}")
+        return False
+    
+    _label_cache = {label['name'].lower(): label['id'] for label in data.get('labels', []) if not label.get('is_deleted')}
+    
+    sections_by_project = {project_id: {} for project_id in project_ids}
+    for section in data.get('sections', []):
+        if section.get('is_deleted') or section.get('is_archived'):
+            continue
+        project_sections = sections_by_project.get(section['project_id'])
+        if project_sections is not None:
+            project_sections[section['name'].strip()] = section['id']
+    _section_cache.update(sections_by_project)
+    _priority_section_cache[1].clear()
+    
+    if task_logger:
+        task_logger.info("SYNC_READ: Loaded %d labels and sections for %d projects", len(_label_cache), len(sections_by_project))
+    return True
+
+
 def get_section_name_by_id(section_id, project_id, task_logger=None):
     """Get section name from section_id for a specific project"""
     if not section_id:
         return None
         
     try:
-        response = requests.get(f"{TODOIST_API}/sections?project_id={project_id}", headers=HEADERS)
-        response.raise_for_status()
-        sections = response.json()
+        # Reuse the per-run section cache instead of refetching sections for every task
+        sections = get_project_sections(project_id, task_logger)
         
         # Find section by ID
-        for section in sections:
-            if section['id'] == section_id:
-                return section['name']
+        for section_name, cached_section_id in sections.items():
+            if cached_section_id == section_id:
+                return section_name
         
         # Section ID not found in this project
         if task_logger:
-            task_logger.warning(f"SECTION_NOT_FOUND: Section ID {section_id} not found in project {project_id}")
+            task_logger.warning("SECTION_NOT_FOUND: Section ID %s not found in project %s", section_id, project_id)
         return None
         
     except Exception as e:
         if task_logger:
-            task_logger.error(f"SECTION_NAME_ERROR: Failed to get section name for ID {section_id}: {e}")
+            task_logger.error("SECTION_NAME_ERROR: Failed to get section name for ID %s: %s", section_id, e)
         return None
 
 
+# Label -> section-routing rules index, rebuilt only when a different rules list is passed in
+_rule_section_index = (None, {})
+
+# (frozenset(labels), project_id) -> selected section for the current rules list; cleared
+# whenever the section cache changes, since selection depends on which sections exist
+_priority_section_cache = (None, {})
+
+
+def get_rule_section_index(rules):
+    """
+    Map each rule label to its section-routing rules (rules with move_to).
+    
+    Entries are (priority, rule position, rule), kept sorted per label, so the
+    candidates for several labels can be merged in priority order (ties broken
+    by rules-file order) without sorting them per task.
+    """
+    global _rule_section_index
+    indexed_rules, index = _rule_section_index
+    if indexed_rules is not rules:
+        index = {}
+        for position, rule in enumerate(rules):
+            if rule.get('label') and rule.get('move_to'):
+                # Default to low priority if not specified
+                index.setdefault(rule['label'], []).append((rule.get('priority', 999), position, rule))
+        for entries in index.values():
+            entries.sort(key=lambda entry: entry[:2])
+        _rule_section_index = (rules, index)
+    return index
+
+
+def get_section_rules_for_labels(labels, rules):
+    """Return the section-routing rules for the given labels, in rules-file order"""
+    rule_index = get_rule_section_index(rules)
+    entries = [entry for label in labels for entry in rule_index.get(label, ())]
+    return [rule for _, _, rule in sorted(entries, key=lambda entry: entry[1])]
+
+
 def select_priority_section(task_labels, rules, project_id, task_logger=None):
+    """
+    Select the best section for a task, reusing the result for tasks with the same labels.
+    
+    Many tasks in a run share an identical label set, so selections are memoized per
+    (labels, project) for the current rules list. See _select_priority_section for details.
+    """
+    global _priority_section_cache
+    if not task_labels:
+        return None
+    
+    cached_rules, selections = _priority_section_cache
+    if cached_rules is not rules:
+        selections = {}
+        _priority_section_cache = (rules, selections)
+    
+    key = (frozenset(task_labels), project_id)
+    if key in selections:
+        if task_logger:
+            task_logger.debug("SECTION_SELECTION_CACHE: Reusing selection for labels %s", key[0])
+        return selections[key]
+    
+    selected_section = _select_priority_section(task_labels, rules, project_id, task_logger)
+    selections[key] = selected_section
+    return selected_section
+
+
+def _select_priority_section(task_labels, rules, project_id, task_logger=None):
     """
     Select the best section for a task based on label priorities and section availability.
     
@@ -853,84 +1229,82 @@ def select_priority_section(task_labels, rules, project_id, task_logger=None):
     if not task_labels:
         return None
     
-    # Collect all candidate sections from task labels
-    candidates = []
-    existing_sections = {}
-    
     try:
         # Get existing sections for this project
         existing_sections = get_project_sections(project_id, task_logger)
     except Exception as e:
         if task_logger:
-            task_logger.error(f"PRIORITY_SECTION_ERROR: Failed to get project sections: {e}")
-        return None
-    
-    # Find all rules that match task labels and have move_to
-    for rule in rules:
-        rule_label = rule.get('label')
-        rule_move_to = rule.get('move_to')
-        
-        if rule_label and rule_move_to and rule_label in task_labels:
-            priority = rule.get('priority', 999)  # Default to low priority if not specified
-            create_if_missing = rule.get('create_if_missing', False)
-            section_exists = rule_move_to in existing_sections
-            
-            candidates.append({
-                'section_name': rule_move_to,
-                'create_if_missing': create_if_missing,
-                'priority': priority,
-                'label': rule_label,
-                'exists': section_exists,
-                'rule': rule
-            })
-    
-    if not candidates:
-        if task_logger:
-            task_logger.debug(f"PRIORITY_SECTION: No section candidates found for labels: {task_labels}")
+            task_logger.error("PRIORITY_SECTION_ERROR: Failed to get project sections: %s", e)
         return None
     
-    # Sort candidates by priority (lower number = higher priority)
-    candidates.sort(key=lambda x: x['priority'])
-    
-    # Log all candidates for transparency
-    if task_logger:
-        candidate_info = []
-        for c in candidates:
-            status = "exists" if c['exists'] else ("create" if c['create_if_missing'] else "missing")
-            candidate_info.append(f"{c['label']}→{c['section_name']}(p:{c['priority']},{status})")
-        task_logger.info(f"SECTION_CANDIDATES: Found {len(candidates)} candidates: {', '.join(candidate_info)}")
-    
-    # Select best viable candidate
-    for candidate in candidates:
-        section_name = candidate['section_name']
-        exists = candidate['exists']
-        create_if_missing = candidate['create_if_missing']
+    # Walk the matching rules in priority order (lower number = higher priority) and
+    # stop at the first viable section instead of collecting and sorting every candidate
+    rule_index = get_rule_section_index(rules)
+    candidates_seen = 0
+    for priority, _, rule in heapq.merge(*(rule_index.get(label, ()) for label in task_labels),
+                                         key=lambda entry: entry[:2]):
+        candidates_seen += 1
+        section_name = rule['move_to']
+        create_if_missing = rule.get('create_if_missing', False)
+        exists = section_name in existing_sections
         
+        if not exists and not create_if_missing:
+            # Section doesn't exist and can't be created - skip
+            if task_logger:
+                task_logger.info("SECTION_SKIPPED: '%s' (priority:%s, missing, create_if_missing=false)", section_name, priority)
+            continue
+        
+        candidate = {
+            'section_name': section_name,
+            'create_if_missing': create_if_missing,
+            'priority': priority,
+            'label': rule['label'],
+            'exists': exists,
+            'rule': rule
+        }
         if exists:
             # Section exists - this is our best choice
-            candidate['reason'] = f"highest priority existing section"
+            candidate['reason'] = "highest priority existing section"
             if task_logger:
-                task_logger.info(f"SECTION_SELECTED: Chose '{section_name}' (priority:{candidate['priority']}, exists:true)")
-            return candidate
-        elif create_if_missing:
-            # Section doesn't exist but can be created
-            candidate['reason'] = f"highest priority with create_if_missing=true"
-            if task_logger:
-                task_logger.info(f"SECTION_SELECTED: Chose '{section_name}' (priority:{candidate['priority']}, will_create:true)")
-            return candidate
+                task_logger.info("SECTION_SELECTED: Chose '%s' (priority:%s, exists:true)", section_name, priority)
         else:
-            # Section doesn't exist and can't be created - skip
+            # Section doesn't exist but can be created
+            candidate['reason'] = "highest priority with create_if_missing=true"
             if task_logger:
-                task_logger.info(f"SECTION_SKIPPED: '{section_name}' (priority:{candidate['priority']}, missing, create_if_missing=false)")
-            continue
+                task_logger.info("SECTION_SELECTED: Chose '%s' (priority:%s, will_create:true)", section_name, priority)
+        return candidate
+    
+    if not candidates_seen:
+        if task_logger:
+            task_logger.debug("PRIORITY_SECTION: No section candidates found for labels: %s", task_labels)
+        return None
     
     # No viable candidates found
     if task_logger:
-        task_logger.warning(f"SECTION_NO_VIABLE: No viable sections found from {len(candidates)} candidates")
+        task_logger.warning("SECTION_NO_VIABLE: No viable sections found from %s candidates", candidates_seen)
     return None
 
 
-def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mode=False, context="UNIVERSAL"):
+def resolve_or_create_section(section_name, project_id, create_if_missing, task_logger=None):
+    """
+    Look up a section by name, creating it first when the rule allows it.
+    
+    Returns:
+        tuple: (section_id, None) on success, or (None, reason) if the section is unavailable
+    """
+    if create_if_missing:
+        section_id = create_section_if_missing_sync(section_name, project_id, task_logger)
+        if section_id:
+            return section_id, None
+        return None, f"Section '{section_name}' could not be created"
+    
+    section_id = get_project_sections(project_id, task_logger).get(section_name)
+    if section_id:
+        return section_id, None
+    return None, f"Section '{section_name}' not found and create_if_missing=False"
+
+
+def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mode=False, context="UNIVERSAL", command_buffer=None):
     """
     Universal section routing for any task with existing labels.
     
@@ -941,17 +1315,18 @@ def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mod
         dry_run: If True, only log what would happen
         bulk_mode: If True, use bulk API operations
         context: String context for logging (e.g., "UNIVERSAL", "PRE_LABELED")
+        command_buffer: Optional SyncCommandBuffer to queue the move on instead of sending it
     
     Returns:
         bool: True if routing succeeded or no routing needed, False if failed
     """
     existing_labels = set(task.get('labels', []))
-    current_section_id = task.get('section_id')
+    current_section_id = get_current_section_id(task)
     project_id = task.get('project_id')
     
     if not project_id:
         if task_logger:
-            task_logger.error(f"{context}_ROUTE_ERROR: Task {task['id']} has no project_id")
+            task_logger.error("%s_ROUTE_ERROR: Task %s has no project_id", context, task['id'])
         return False
     
     if not existing_labels:
@@ -961,7 +1336,7 @@ def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mod
     if current_section_id is not None:
         if task_logger:
             current_section_name = get_section_name_by_id(current_section_id, project_id, task_logger)
-            task_logger.info(f"SECTION_SKIP: Task {task['id']} already in section {current_section_name} (section_id: {current_section_id})")
+            task_logger.info("SECTION_SKIP: Task %s already in section %s (section_id: %s)", task['id'], current_section_name, current_section_id)
         return True  # Skip tasks that already have a section
     
     # Use priority-based section selection
@@ -969,7 +1344,7 @@ def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mod
     
     if not selected_section:
         if task_logger:
-            task_logger.debug(f"{context}_NO_SECTION: Task {task['id']} has no viable section candidates")
+            task_logger.debug("%s_NO_SECTION: Task %s has no viable section candidates", context, task['id'])
         return True  # No routing needed
     
     target_section_name = selected_section['section_name']
@@ -978,53 +1353,142 @@ def route_task_to_section(task, rules, task_logger=None, dry_run=False, bulk_mod
     # Check if task needs to be moved
     if current_section_name == target_section_name:
         if task_logger:
-            task_logger.info(f"{context}_SKIP: Task {task['id']} already in target section '{target_section_name}' (priority:{selected_section['priority']}, reason: {selected_section['reason']})")
+            task_logger.info("%s_SKIP: Task %s already in target section '%s' (priority:%s, reason: %s)", context, task['id'], target_section_name, selected_section['priority'], selected_section['reason'])
         return True
     
     if task_logger:
-        task_logger.info(f"{context}_ROUTE: Task {task['id']} with '{selected_section['label']}' label needs routing: '{current_section_name}' → '{target_section_name}' (priority:{selected_section['priority']}, reason: {selected_section['reason']})")
+        task_logger.info("%s_ROUTE: Task %s with '%s' label needs routing: '%s' → '%s' (priority:%s, reason: %s)", context, task['id'], selected_section['label'], current_section_name, target_section_name, selected_section['priority'], selected_section['reason'])
     
     if dry_run:
         if task_logger:
-            task_logger.info(f"DRY_RUN: Would move task {task['id']} to section {target_section_name}")
+            task_logger.info("DRY_RUN: Would move task %s to section %s", task['id'], target_section_name)
         return True
     
     # Get or create target section
-    section_id = None
-    create_if_missing = selected_section['create_if_missing']
-    
-    if create_if_missing:
-        section_id = create_section_if_missing_sync(target_section_name, project_id, task_logger)
-    else:
-        sections = get_project_sections(project_id, task_logger)
-        section_id = sections.get(target_section_name)
+    section_id, _ = resolve_or_create_section(target_section_name, project_id,
+                                              selected_section['create_if_missing'], task_logger)
     
     if section_id:
         # Check if already in target section (defensive check)
         if current_section_id == section_id:
             if task_logger:
-                task_logger.info(f"{context}_SKIP: Task {task['id']} already in target section {target_section_name}")
+                task_logger.info("%s_SKIP: Task %s already in target section %s", context, task['id'], target_section_name)
             return True
         
         # Move task to correct section
-        move_success = move_task_to_section(task['id'], section_id, task_logger, task['content'], bulk_mode)
+        move_success = move_task_to_section(task['id'], section_id, task_logger, task['content'], bulk_mode, command_buffer)
         if move_success:
             if task_logger:
-                task_logger.info(f"{context}_MOVED: Task {task['id']} moved to section {target_section_name} (priority:{selected_section['priority']})")
+                task_logger.info("%s_MOVED: Task %s moved to section %s (priority:%s)", context, task['id'], target_section_name, selected_section['priority'])
             return True
         else:
             if task_logger:
-                task_logger.error(f"{context}_MOVE_FAILED: Failed to move task {task['id']} to section {target_section_name}")
+                task_logger.error("%s_MOVE_FAILED: Failed to move task %s to section %s", context, task['id'], target_section_name)
             return False
     else:
         if task_logger:
-            task_logger.error(f"{context}_SECTION_ERROR: Section {target_section_name} not found or could not be created")
+            task_logger.error("%s_SECTION_ERROR: Section %s not found or could not be created", context, target_section_name)
         return False
 
 
-def route_pre_labeled_task(task, rules, task_logger=None, dry_run=False, bulk_mode=False):
+def route_pre_labeled_task(task, rules, task_logger=None, dry_run=False, bulk_mode=False, command_buffer=None):
     """Handle section routing for tasks that already have labels (fix-sections mode)"""
-    return route_task_to_section(task, rules, task_logger, dry_run, bulk_mode, context="PRE_LABELED")
+    return route_task_to_section(task, rules, task_logger, dry_run, bulk_mode, context="PRE_LABELED", command_buffer=command_buffer)
+
+
+def resolve_target_section(task, task_labels, rules, sections_to_move, task_logger=None):
+    """
+    Pick the section a task should be moved to after its rules were applied.
+    
+    Returns:
+        tuple: (section_name, selected_section, fallback_info). selected_section is the
+        priority-selected candidate when the task has a project and rule labels;
+        otherwise fallback_info is the first requested move. section_name is None
+        when no viable section was found.
+    """
+    project_id = task.get('project_id')
+    if project_id and task_labels:
+        selected_section = select_priority_section(task_labels, rules, project_id, task_logger)
+        if selected_section:
+            return selected_section['section_name'], selected_section, None
+        return None, None, None
+    
+    fallback_info = sections_to_move[0]
+    return fallback_info['section_name'], None, fallback_info
+
+
+def route_task_by_rule_sections(task, task_labels, rules, sections_to_move, task_logger=None, dry_run=False,
+                                bulk_mode=False, verbose=False, command_buffer=None):
+    """
+    Move a task to the section requested by its matching rules (or log the move in dry-run mode).
+    
+    Returns:
+        bool: True if the task was routed (moved, queued, previewed, or already in place)
+    """
+    section_name, selected_section, fallback_info = resolve_target_section(
+        task, task_labels, rules, sections_to_move, task_logger)
+    
+    if section_name is None:
+        log_task_action(task_logger, task['id'], task['content'], "NO_VIABLE_SECTION",
+                      error="No viable section found from candidates")
+        return False
+    
+    if selected_section:
+        create_if_missing = selected_section['create_if_missing']
+        log_fields = {'priority': selected_section['priority'], 'rule_source': selected_section['label']}
+    else:
+        create_if_missing = fallback_info['create_if_missing']
+        log_fields = {'rule_source': fallback_info['rule_source']}
+    
+    if dry_run:
+        if verbose:
+            if selected_section:
+                log_info(f"📂 Would move task to section: {section_name} (priority: {selected_section['priority']})", "cyan")
+            else:
+                log_info(f"📂 Would move task to section: {section_name}", "cyan")
+        log_task_action(task_logger, task['id'], task['content'], "WOULD_MOVE_TO_SECTION",
+                      section=section_name, **log_fields)
+        return True
+    
+    project_id = task.get('project_id')
+    if not project_id:
+        log_task_action(task_logger, task['id'], task['content'], "NO_PROJECT_ID",
+                      error="Cannot move task without project_id")
+        return False
+    
+    section_id, error = resolve_or_create_section(section_name, project_id, create_if_missing, task_logger)
+    if not section_id:
+        log_task_action(task_logger, task['id'], task['content'], "SECTION_NOT_FOUND", error=error)
+        return False
+    
+    # Check if task is already in target section to avoid duplicate moves
+    current_section = get_current_section_id(task)
+    if current_section == section_id:
+        if task_logger:
+            task_logger.info("SECTION_SKIP: Task %s already in target section %s | Content: %s", task['id'], section_name, truncate_text(task['content'], 60))
+        if verbose:
+            log_info(f"⚠️  Task already in correct section: {section_name}")
+        return True
+    
+    # Check if task is in Today section - if so, don't move it
+    today_section_id = get_project_sections(project_id, task_logger).get('Today')
+    if today_section_id and current_section == today_section_id:
+        if task_logger:
+            task_logger.info("TODAY_SECTION_PROTECTED: Task %s is in Today section, skipping move to %s", task['id'], section_name)
+        log_task_action(task_logger, task['id'], task['content'], "TODAY_SECTION_PROTECTED",
+                      section=section_name, note="Task in Today section, move skipped")
+        return True
+    
+    if move_task_to_section(task['id'], section_id, task_logger, task['content'], bulk_mode, command_buffer):
+        if verbose:
+            log_success(f"📂 Moved task to section: {section_name}")
+        log_task_action(task_logger, task['id'], task['content'], "MOVED_TO_SECTION",
+                      section=section_name, **log_fields)
+        return True
+    
+    log_task_action(task_logger, task['id'], task['content'], "MOVE_FAILED",
+                  error=f"Failed to move to section: {section_name}")
+    return False
 
 
 def create_section_if_missing(section_name, project_id, task_logger=None):
@@ -1041,15 +1505,20 @@ def create_section_if_missing(section_name, project_id, task_logger=None):
             "project_id": project_id
         }
         
-        response = requests.post(f"{TODOIST_API}/sections", headers=HEADERS, json=create_data)
+        response = SESSION.post(TODOIST_SECTIONS_URL, headers=HEADERS, json=create_data)
         if response.status_code in (200, 201):
-            section_data = response.json()
+            section_data = _loads(response)
             section_id = section_data['id']
             
             if task_logger:
                 task_logger.info(f"SECTION_CREATED: Created section '{section_name}' (ID: {section_id}) in project {project_id}")
             log_info(f"📂 Created section: {section_name}")
             
+            # Keep the per-run section cache in step with the new section
+            if project_id in _section_cache:
+                _section_cache[project_id][section_name] = section_id
+                _priority_section_cache[1].clear()
+            
             return section_id
         else:
             if task_logger:
@@ -1065,10 +1534,8 @@ def create_section_if_missing(section_name, project_id, task_logger=None):
 
 def create_section_sync_api(section_name, project_id, task_logger=None):
     """Create a section using Sync API v9"""
-    import uuid
-    
     try:
-        sync_url = "https://api.todoist.com/sync/v9/sync"
+        sync_url = TODOIST_SYNC_API
         
         # Create a command to add the section
         temp_id = str(uuid.uuid4())
@@ -1091,13 +1558,13 @@ def create_section_sync_api(section_name, project_id, task_logger=None):
         
         headers = {"Authorization": f"Bearer {os.environ['TODOIST_API_TOKEN'].strip()}",
                   "Content-Type": "application/json"}
-        response = requests.post(sync_url, json=sync_data, headers=headers)
+        response = SESSION.post(sync_url, json=sync_data, headers=headers)
         
         if task_logger:
             task_logger.info(f"SYNC_SECTION_RESPONSE: status={response.status_code}, content={response.text}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response)
             
             # Check if the command was successful
             command_uuid = command["uuid"]
@@ -1139,21 +1606,32 @@ def create_section_if_missing_sync(section_name, project_id, task_logger=None):
         # Normalize section name for consistent comparison
         normalized_name = section_name.strip()
         
-        # First check if section already exists
-        sections = get_project_sections(project_id, task_logger)
-        if normalized_name in sections:
-            if task_logger:
-                task_logger.info(f"SECTION_EXISTS: Section '{normalized_name}' already exists (ID: {sections[normalized_name]})")
-            return sections[normalized_name]
-        
-        # Create new section using Sync API
-        section_id = create_section_sync_api(normalized_name, project_id, task_logger)
-        
-        # Update cache with new section
-        if section_id and project_id in _section_cache:
-            _section_cache[project_id][normalized_name] = section_id
-            if task_logger:
-                task_logger.info(f"SECTION_CACHE_UPDATE: Added '{normalized_name}' to cache (ID: {section_id})")
+        # Check and create under one lock so concurrent callers can't both create the section
+        with _section_create_lock:
+            # First check if section already exists
+            sections = get_project_sections(project_id, task_logger)
+            if normalized_name in sections:
+                if task_logger:
+                    task_logger.info(f"SECTION_EXISTS: Section '{normalized_name}' already exists (ID: {sections[normalized_name]})")
+                return sections[normalized_name]
+            
+            # Sections created earlier in this run, even if the section list couldn't be cached
+            section_id = _created_sections.get((project_id, normalized_name))
+            if section_id:
+                return section_id
+            
+            # Create new section using Sync API
+            section_id = create_section_sync_api(normalized_name, project_id, task_logger)
+            if not section_id:
+                return None
+            _created_sections[(project_id, normalized_name)] = section_id
+            
+            # Update cache with new section
+            if project_id in _section_cache:
+                _section_cache[project_id][normalized_name] = section_id
+                _priority_section_cache[1].clear()
+                if task_logger:
+                    task_logger.info(f"SECTION_CACHE_UPDATE: Added '{normalized_name}' to cache (ID: {section_id})")
         
         return section_id
             
@@ -1166,12 +1644,9 @@ def create_section_if_missing_sync(section_name, project_id, task_logger=None):
 
 def move_task_to_section_sync_api(task_id, section_id, task_logger=None, bulk_mode=False):
     """Move a task to a specific section using Sync API v9 with rate limiting"""
-    import uuid
-    import time
-    
     try:
         # Use Sync API v9 for task movement
-        sync_url = "https://api.todoist.com/sync/v9/sync"
+        sync_url = TODOIST_SYNC_API
         
         # Create a command to move the task
         command = {
@@ -1196,13 +1671,13 @@ def move_task_to_section_sync_api(task_id, section_id, task_logger=None, bulk_mo
         else:
             time.sleep(1.0)  # 1 second for normal processing
         
-        response = requests.post(sync_url, headers=HEADERS, json=sync_data)
+        response = SESSION.post(sync_url, headers=HEADERS, json=sync_data)
         
         if task_logger:
             task_logger.info(f"SYNC_MOVE_RESPONSE: status={response.status_code}, content={response.text[:300]}")
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = _loads(response)
             
             # Check if the command was successful
             if "sync_status" in response_data:
@@ -1224,7 +1699,7 @@ def move_task_to_section_sync_api(task_id, section_id, task_logger=None, bulk_mo
         elif response.status_code == 429:
             # Rate limit hit - implement retry with shorter wait in bulk mode
             try:
-                error_data = response.json()
+                error_data = _loads(response)
                 retry_after = error_data.get('error_extra', {}).get('retry_after', 60)
                 
                 # In bulk mode, use shorter retry delays to avoid falling back to broken REST API
@@ -1235,9 +1710,9 @@ def move_task_to_section_sync_api(task_id, section_id, task_logger=None, bulk_mo
                     time.sleep(wait_time)
                     
                     # Retry once with Sync API
-                    retry_response = requests.post(sync_url, headers=HEADERS, json=sync_data)
+                    retry_response = SESSION.post(sync_url, headers=HEADERS, json=sync_data)
                     if retry_response.status_code == 200:
-                        retry_data = retry_response.json()
+                        retry_data = _loads(retry_response)
                         command_uuid = command["uuid"]
                         if retry_data.get("sync_status", {}).get(command_uuid) == "ok":
                             if task_logger:
@@ -1267,13 +1742,23 @@ def move_task_to_section_sync_api(task_id, section_id, task_logger=None, bulk_mo
         return False
 
 
-def move_task_to_section(task_id, section_id, task_logger=None, task_content=None, bulk_mode=False):
+def move_task_to_section(task_id, section_id, task_logger=None, task_content=None, bulk_mode=False, command_buffer=None):
     """Move a task to a specific section using Sync API v9 with retry logic"""
     
+    # Defer the move to a batched Sync API request if a command buffer is provided
+    if command_buffer is not None:
+        command_buffer.queue_move(task_id, section_id, task_content)
+        _moved_task_sections[task_id] = section_id
+        if task_logger:
+            task_logger.info(f"SYNC_MOVE_QUEUED: Task {task_id} to section {section_id}")
+        return True
+    
     # Use Sync API v9 exclusively - no fallback to broken REST API v2
     success = move_task_to_section_sync_api(task_id, section_id, task_logger, bulk_mode)
     
-    if not success and task_logger:
+    if success:
+        _moved_task_sections[task_id] = section_id
+    elif task_logger:
         task_logger.warning(f"TASK_MOVE_SKIPPED: Task {task_id} skipped due to rate limits - will retry in next run")
     
     return success
@@ -1301,13 +1786,13 @@ def add_task_comment(task_id, comment, task_logger=None, dry_run=False):
         return True
     
     try:
-        url = f"{TODOIST_API}/comments"
+        url = TODOIST_COMMENTS_URL
         payload = {
             "task_id": task_id,
             "content": comment
         }
         
-        response = requests.post(url, headers=HEADERS, json=payload, timeout=30)
+        response = SESSION.post(url, headers=HEADERS, json=payload, timeout=30)
         
         if response.status_code == 200:
             if task_logger:
@@ -1326,8 +1811,12 @@ def add_task_comment(task_id, comment, task_logger=None, dry_run=False):
 
 def log_task_action(task_logger, task_id, task_content, action, **kwargs):
     """Log task processing action with details"""
+    # Skip building the message entirely if it would be dropped
+    if not task_logger.isEnabledFor(logging.INFO):
+        return
+    
     # Truncate very long content for readability
-    content_preview = task_content[:100] + "..." if len(task_content) > 100 else task_content
+    content_preview = truncate_text(task_content, 100)
     
     log_parts = [
         f"Task {task_id}",
@@ -1337,7 +1826,7 @@ def log_task_action(task_logger, task_id, task_content, action, **kwargs):
     
     # Add optional details
     if 'title' in kwargs and kwargs['title']:
-        title_preview = kwargs['title'][:80] + "..." if len(kwargs['title']) > 80 else kwargs['title']
+        title_preview = truncate_text(kwargs['title'], 80)
         log_parts.append(f"Title: {repr(title_preview)}")
     
     if 'labels' in kwargs and kwargs['labels']:
@@ -1380,33 +1869,254 @@ def log_task_action(task_logger, task_id, task_content, action, **kwargs):
                 for label, explanation in explanations.items():
                     log_parts.append(f"Explanation[{label}]: {explanation}")
         
-        # Add processing time
-        if 'processing_time' in ts_data:
-            log_parts.append(f"ProcessingTime: {ts_data['processing_time']:.3f}s")
+        # Add processing time
+        if 'processing_time' in ts_data:
+            log_parts.append(f"ProcessingTime: {ts_data['processing_time']:.3f}s")
+        
+        # Add mode information
+        if 'mode' in ts_data:
+            log_parts.append(f"Mode: {ts_data['mode']}")
+        
+        # Add version tracking
+        if 'version' in ts_data:
+            log_parts.append(f"Version: {ts_data['version']}")
+    
+    log_message = " | ".join(log_parts)
+    task_logger.info(log_message)
+
+# Using REST API v2 for basic operations (projects, tasks, labels, sections)
+# Sync API v9 is used for task movement operations
+TODOIST_API = "https://api.todoist.com/rest/v2"
+TODOIST_SYNC_API = "https://api.todoist.com/sync/v9/sync"
+# REST v2 collection endpoints, joined once
+TODOIST_PROJECTS_URL = f"{TODOIST_API}/projects"
+TODOIST_TASKS_URL = f"{TODOIST_API}/tasks"
+TODOIST_LABELS_URL = f"{TODOIST_API}/labels"
+TODOIST_SECTIONS_URL = f"{TODOIST_API}/sections"
+TODOIST_COMMENTS_URL = f"{TODOIST_API}/comments"
+
+# Check if API token is available
+if not os.environ.get('TODOIST_API_TOKEN'):
+    print("❌ TODOIST_API_TOKEN environment variable is not set!")
+    print("Please set your Todoist API token in your environment variables.")
+    exit(1)
+
+HEADERS = {"Authorization": f"Bearer {os.environ['TODOIST_API_TOKEN'].strip()}",
+           "Content-Type": "application/json"}
+
+# Shared HTTP session so Todoist, OpenAI and page-title requests reuse pooled keep-alive
+# connections. Auth headers stay per request since the same session also fetches arbitrary sites.
+HTTP_POOL_SIZE = 20
+# (connect, read) timeout for requests that don't pass their own
+HTTP_TIMEOUT = (3.05, 30)
+# Idempotent requests (GET/HEAD) are retried on transient errors; POSTs are never replayed
+HTTP_RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies HTTP_TIMEOUT to requests made without an explicit timeout"""
+    
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = HTTP_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+SESSION = requests.Session()
+SESSION.mount('https://', TimeoutHTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY))
+SESSION.mount('http://', TimeoutHTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY))
+
+
+def _loads(response):
+    """Decode a Todoist JSON response body, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _load_json_file(path):
+    """Read a JSON config file, using orjson when available"""
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace bulk Todoist API calls"""
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate: Tokens refilled per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self):
+        """Take one token, blocking only while the bucket is empty"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+# Todoist allows ~450 requests per 15 minutes; burst up to 50, then refill at 0.5 req/s
+TODOIST_BUCKET = TokenBucket(rate=0.5, capacity=50)
+
+# Concurrent pipeline runs - each task is dominated by URL fetches and GPT calls
+PIPELINE_MAX_WORKERS = 8
+
+# Concurrent AI fallback calls in legacy processing (gpt_fallback "concurrency" overrides)
+GPT_MAX_WORKERS = 4
+
+
+def _worker_count(value, default, setting):
+    """Return value as a worker count, or default if it is unset or not a positive integer"""
+    if value is None:
+        return default
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        count = 0
+    if count < 1:
+        log_warning(f"Ignoring {setting}={value!r}: expected a positive integer, using {default}")
+        return default
+    return count
+
+
+# Concurrent page title fetches when prefetching link titles (FETCH_WORKERS overrides)
+TITLE_PREFETCH_WORKERS = _worker_count(os.getenv("FETCH_WORKERS"), 16, "FETCH_WORKERS")
+
+# Concurrent title fetches allowed against any single site during a prefetch
+TITLE_FETCHES_PER_HOST = 4
+
+# Concurrent task list requests when processing several projects
+PROJECT_FETCH_WORKERS = 4
+
+
+class SyncCommandBuffer:
+    """
+    Collects Todoist Sync API commands and sends them in batches.
+    
+    Per-task updates and section moves are queued during the task loop and
+    sent with flush(), so N tasks cost ceil(N / 100) requests instead of N.
+    """
+    
+    MAX_COMMANDS_PER_REQUEST = 100  # Sync API limit per request
+    
+    # Task action logged for a command that the Sync API rejected
+    FAILED_ACTIONS = {
+        "item_update": "FAILED",
+        "item_move": "MOVE_FAILED",
+        "note_add": "COMMENT_FAILED"
+    }
+    
+    def __init__(self, task_logger=None, bulk_mode=False, summary=None):
+        self.task_logger = task_logger
+        self.bulk_mode = bulk_mode
+        self.summary = summary  # Optional TaskSummary to record rejected commands on
+        self.commands = []
+        self.task_contents = {}  # command uuid -> task content, for per-task failure logs
+    
+    def __len__(self):
+        return len(self.commands)
+    
+    def queue(self, command_type, args, task_content=None):
+        """Queue a Sync API command and return its uuid"""
+        command = {
+            "type": command_type,
+            "uuid": str(uuid.uuid4()),
+            "args": args
+        }
+        self.commands.append(command)
+        if task_content is not None:
+            self.task_contents[command["uuid"]] = task_content
+        return command["uuid"]
+    
+    def queue_update(self, task_id, task_content=None, **fields):
+        """Queue an item_update for a task (content, description, labels, ...)"""
+        return self.queue("item_update", {"id": task_id, **fields}, task_content)
+    
+    def queue_move(self, task_id, section_id, task_content=None):
+        """Queue an item_move of a task into a section"""
+        return self.queue("item_move", {"id": task_id, "section_id": section_id}, task_content)
+    
+    def queue_move_to_project(self, task_id, project_id, task_content=None):
+        """Queue an item_move of a task to the project root (out of any section)"""
+        return self.queue("item_move", {"id": task_id, "project_id": project_id}, task_content)
+    
+    def queue_comment(self, task_id, content, task_content=None):
+        """Queue a note_add (task comment)"""
+        return self.queue("note_add", {"item_id": task_id, "content": content}, task_content)
+    
+    def flush(self):
+        """
+        Send all queued commands in chunks of MAX_COMMANDS_PER_REQUEST.
+        
+        Returns:
+            dict: Mapping of command uuid to True (ok) or False (failed)
+        """
+        pending, self.commands = self.commands, []
+        results = {}
         
-        # Add mode information
-        if 'mode' in ts_data:
-            log_parts.append(f"Mode: {ts_data['mode']}")
+        for start in range(0, len(pending), self.MAX_COMMANDS_PER_REQUEST):
+            chunk = pending[start:start + self.MAX_COMMANDS_PER_REQUEST]
+            sync_status = {}
+            
+            if self.bulk_mode:
+                TODOIST_BUCKET.acquire()
+            
+            try:
+                response = SESSION.post(TODOIST_SYNC_API, headers=HEADERS, json={"commands": chunk})
+                
+                if response.status_code == 200:
+                    sync_status = _loads(response).get("sync_status", {})
+                elif response.status_code == 429:
+                    if self.task_logger:
+                        self.task_logger.warning(f"SYNC_BATCH_RATE_LIMITED: Hit rate limit (429), {len(chunk)} commands skipped for next run")
+                else:
+                    if self.task_logger:
+                        self.task_logger.error(f"SYNC_BATCH_HTTP_ERROR: Status: {response.status_code} | Response: {response.text[:300]}")
+            except Exception as e:
+                if self.task_logger:
+                    self.task_logger.error(f"SYNC_BATCH_EXCEPTION: {len(chunk)} commands failed | Exception: {str(e)}")
+                log_warning(f"Failed to send batched Sync API commands: {e}")
+            
+            for command in chunk:
+                status = sync_status.get(command["uuid"])
+                results[command["uuid"]] = status == "ok"
+                if status != "ok" and self.summary:
+                    self.summary.failed(f"Sync API {command['type']} rejected")
+                if status != "ok" and self.task_logger:
+                    # Map the failed command back to its task for the per-task action log
+                    task_id = command['args'].get('id') or command['args'].get('item_id')
+                    log_task_action(self.task_logger, task_id, self.task_contents.get(command["uuid"], ""),
+                                    self.FAILED_ACTIONS.get(command["type"], "FAILED"),
+                                    error=f"Sync API {command['type']}: {status or 'no response'}")
         
-        # Add version tracking
-        if 'version' in ts_data:
-            log_parts.append(f"Version: {ts_data['version']}")
-    
-    log_message = " | ".join(log_parts)
-    task_logger.info(log_message)
-
-# Using REST API v2 for basic operations (projects, tasks, labels, sections)
-# Sync API v9 is used for task movement operations
-TODOIST_API = "https://api.todoist.com/rest/v2"
-
-# Check if API token is available
-if not os.environ.get('TODOIST_API_TOKEN'):
-    print("❌ TODOIST_API_TOKEN environment variable is not set!")
-    print("Please set your Todoist API token in your environment variables.")
-    exit(1)
+        self.task_contents.clear()
+        
+        if pending and self.task_logger:
+            succeeded = sum(1 for ok in results.values() if ok)
+            self.task_logger.info(f"SYNC_BATCH_COMPLETE: {succeeded}/{len(pending)} commands succeeded")
+        
+        return results
 
-HEADERS = {"Authorization": f"Bearer {os.environ['TODOIST_API_TOKEN'].strip()}",
-           "Content-Type": "application/json"}
 
 # Domain-to-label mapping for platform-specific tagging
 DOMAIN_LABELS = {
@@ -1443,57 +2153,77 @@ DOMAIN_LABELS = {
 
 def resolve_redirect(url):
     try:
-        r = requests.head(url, allow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+        r = SESSION.head(url, allow_redirects=True, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
         return r.url
     except Exception:
         return url
 
 
+# Authority part of an absolute URL ("scheme://<netloc>/..."), same as urlparse().netloc
+NETLOC_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://([^/?#]*)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _domain_of(url):
+    """Return the lowercased domain of a URL without any www. prefix (cached per URL)"""
+    # Slice the authority out directly; only fall back to urlparse for scheme-less input
+    match = NETLOC_RE.match(url)
+    domain = (match.group(1) if match else urlparse(url).netloc).lower()
+    
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
 def get_domain_label(url):
     """Extract domain from URL and return corresponding label if it exists"""
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
         # Check if we have a label for this domain
-        return DOMAIN_LABELS.get(domain)
+        return DOMAIN_LABELS.get(_domain_of(url))
     except Exception:
         return None
 
 
+# Markdown links [text](url) or plain URLs, in one alternation so content is scanned once.
+# Markdown links are tried first at each position, so their URLs are never reported again as plain URLs.
+COMBINED_URL_RE = re.compile(r'\[(?P<text>[^\]]*)\]\((?P<murl>https?://[^\)]+)\)|(?P<purl>https?://[^\s\]\)]+)')
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_all_urls(content):
-    """Extract all URLs from task content, handling both plain URLs and markdown links"""
-    urls = []
-    
-    # First, extract markdown links [text](url)
-    markdown_links = re.findall(r'\[([^\]]*)\]\((https?://[^\)]+)\)', content)
-    for text, url in markdown_links:
-        urls.append({
-            'url': url,
-            'original_text': f'[{text}]({url})',
-            'link_text': text,
-            'type': 'markdown'
-        })
-    
-    # Then find plain URLs that aren't already in markdown links
-    # Remove markdown links from content first to avoid duplicates
-    content_without_markdown = re.sub(r'\[([^\]]*)\]\((https?://[^\)]+)\)', '', content)
-    plain_urls = re.findall(r'https?://[^\s\]\)]+', content_without_markdown)
-    
-    for url in plain_urls:
-        urls.append({
-            'url': url,
-            'original_text': url,
-            'link_text': None,
-            'type': 'plain'
-        })
-    
-    return urls
+    """
+    Extract all URLs from task content, handling both plain URLs and markdown links.
+    
+    Results are cached per content string because the filter, domain count,
+    title prefetch and labeling passes all parse the same tasks. The returned
+    list is shared between callers and must not be modified.
+    """
+    markdown_urls = []
+    plain_urls = []
+    
+    # Single pass: each match is either a markdown link [text](url) or a plain URL
+    for match in COMBINED_URL_RE.finditer(content):
+        url = match.group('murl')
+        if url:
+            markdown_urls.append({
+                'url': url,
+                'original_text': match.group(0),
+                'link_text': match.group('text'),
+                'type': 'markdown'
+            })
+        else:
+            url = match.group('purl')
+            plain_urls.append({
+                'url': url,
+                'original_text': url,
+                'link_text': None,
+                'type': 'plain'
+            })
+    
+    # Markdown links first, then plain URLs
+    markdown_urls.extend(plain_urls)
+    return markdown_urls
 
 
 def process_multiple_links(content, task_logger=None, task_id=None):
@@ -1503,10 +2233,15 @@ def process_multiple_links(content, task_logger=None, task_id=None):
     if not urls:
         return content, []
     
-    updated_content = content
+    # Replacement text for each link, keyed by its original text, applied in one pass at the end
+    replacements = {}
     all_labels = set(['link'])  # Always include the basic link label
     
-    # Process each URL and replace with titled version
+    # Fetch all of this task's titles concurrently (no-op for URLs prefetched for the whole batch)
+    if len(urls) > 1:
+        prefetch_page_titles(url_info['url'] for url_info in urls)
+    
+    # Work out the titled version of each URL
     for url_info in urls:
         url = url_info['url']
         original_text = url_info['original_text']
@@ -1520,27 +2255,23 @@ def process_multiple_links(content, task_logger=None, task_id=None):
         if title:
             # Create markdown link with title
             new_link = f"[{title}]({url})"
-            updated_content = updated_content.replace(original_text, new_link)
+            replacements[original_text] = new_link
             
             if task_logger and task_id:
-                title_preview = title[:60] + "..." if len(title) > 60 else title
+                title_preview = truncate_text(title, 60)
                 task_logger.info(f"Task {task_id} | SUCCESS: Replaced '{original_text[:50]}...' with titled link: {title_preview}")
         else:
             # Log the failed URL for debugging
             if task_logger and task_id:
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc
+                domain = _domain_of(url)
                 task_logger.info(f"Task {task_id} | FAILED: No title found for {domain} - {url[:100]}")
             
             # If no title found, convert plain URL to markdown link with domain as title
             if url_info['type'] == 'plain':
                 try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-                    if domain.startswith('www.'):
-                        domain = domain[4:]
+                    domain = _domain_of(url)
                     fallback_link = f"[{domain}]({url})"
-                    updated_content = updated_content.replace(original_text, fallback_link)
+                    replacements[original_text] = fallback_link
                     
                     if task_logger and task_id:
                         task_logger.info(f"Task {task_id} | FALLBACK: Used domain fallback: {domain}")
@@ -1552,12 +2283,41 @@ def process_multiple_links(content, task_logger=None, task_id=None):
         if domain_label:
             all_labels.add(domain_label)
     
+    # Rewrite every link in a single scan; text inside a rewritten link is never matched again
+    if not replacements:
+        return content, list(all_labels)
+    updated_content = COMBINED_URL_RE.sub(lambda match: replacements.get(match.group(0), match.group(0)), content)
     return updated_content, list(all_labels)
 
 def is_plain_url(text):
     # Normalize line breaks and spaces
     text = text.strip().replace("\n", "").replace(" ", "")
-    return re.fullmatch(r'https?://\S+', text) is not None
+    return URL_RE.fullmatch(text) is not None
+
+
+# Substrings that mark a fetched title as an error, block or placeholder page
+BAD_TITLE_PATTERNS = (
+    "page not found", "404", "403", "500", "error",
+    "twitter / x", "attention required", "just a moment",
+    "loading", "please wait", "redirecting",
+    "access denied", "forbidden", "not found",
+    "untitled", "no title", "blocked", "unavailable"
+)
+
+# All bad patterns in one automaton, so a title is checked in a single pass when pyahocorasick is available
+BAD_TITLE_AUTOMATON = None
+if HAS_AHOCORASICK:
+    BAD_TITLE_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in BAD_TITLE_PATTERNS:
+        BAD_TITLE_AUTOMATON.add_word(_pattern, _pattern)
+    BAD_TITLE_AUTOMATON.make_automaton()
+
+# Overly generic titles: bare site names or "<anything> - <site>"
+GENERIC_TITLE_RE = re.compile(
+    r"^(home|welcome|index)$"
+    r"|^(github|youtube|medium|twitter|facebook|linkedin)$"
+    r"|^.*\s*-\s*(github|youtube|medium|twitter|facebook|linkedin)$"
+)
 
 
 def is_good_title(title):
@@ -1566,60 +2326,41 @@ def is_good_title(title):
         return False
     
     title_lower = title.lower()
-    bad_patterns = [
-        "page not found", "404", "403", "500", "error",
-        "twitter / x", "attention required", "just a moment",
-        "loading", "please wait", "redirecting",
-        "access denied", "forbidden", "not found",
-        "untitled", "no title", "blocked", "unavailable"
-    ]
     
     # Check for bad patterns
-    if any(bad in title_lower for bad in bad_patterns):
+    if BAD_TITLE_AUTOMATON is not None:
+        if next(BAD_TITLE_AUTOMATON.iter(title_lower), None) is not None:
+            return False
+    elif any(bad in title_lower for bad in BAD_TITLE_PATTERNS):
         return False
     
     # Check for overly generic titles
-    generic_patterns = [
-        r"^(home|welcome|index)$",
-        r"^(github|youtube|medium|twitter|facebook|linkedin)$",
-        r"^.*\s*-\s*(github|youtube|medium|twitter|facebook|linkedin)$"
-    ]
-    
-    for pattern in generic_patterns:
-        if re.match(pattern, title_lower):
-            return False
+    if GENERIC_TITLE_RE.match(title_lower):
+        return False
     
     return True
 
 
+# Natural break points (sentence/clause punctuation or spaced separators) for title truncation
+TITLE_BREAK_RE = re.compile(r'[.!?:;]| - | \| ')
+
+# Site-name suffixes that add noise, e.g. "Some video - YouTube" or "repo | GitHub"
+TITLE_SUFFIX_RE = re.compile(r'\s+[-|]\s+(?:YouTube|Hacker News|GitHub|Medium|LinkedIn|Facebook|Twitter)$')
+
+
 def clean_title(title):
     """Clean up and truncate titles to reasonable length"""
     title = title.strip()
     
     # Remove common suffixes that add noise
-    suffixes_to_remove = [
-        " - YouTube", " | YouTube", 
-        " | Hacker News", " - Hacker News",
-        " | GitHub", " - GitHub",
-        " | Medium", " - Medium",
-        " | LinkedIn", " - LinkedIn",
-        " | Facebook", " - Facebook",
-        " | Twitter", " - Twitter"
-    ]
-    
-    for suffix in suffixes_to_remove:
-        if title.endswith(suffix):
-            title = title[:-len(suffix)].strip()
-            break
+    title = TITLE_SUFFIX_RE.sub('', title, count=1)
     
     # Truncate very long titles
     if len(title) > 100:
-        # Try to break at a natural point (sentence, clause)
-        for break_char in ['.', '!', '?', ':', ';', ' - ', ' | ']:
-            idx = title.find(break_char, 50)  # Look for break after 50 chars
-            if idx > 0 and idx < 90:  # But before 90 chars
-                title = title[:idx].strip()
-                break
+        # Try to break at a natural point (sentence, clause) after 50 chars but before 90
+        match = TITLE_BREAK_RE.search(title, 50, 90)
+        if match:
+            title = title[:match.start()].strip()
         else:
             # No natural break found, truncate at word boundary
             title = title[:97].rsplit(' ', 1)[0] + "..."
@@ -1627,22 +2368,196 @@ def clean_title(title):
     return title
 
 
+@functools.lru_cache(maxsize=None)
 def get_inbox_project_id():
-    r = requests.get(f"{TODOIST_API}/projects", headers=HEADERS)
+    """Return the Inbox project ID (looked up once per process; project IDs don't change)"""
+    r = SESSION.get(TODOIST_PROJECTS_URL, headers=HEADERS)
     r.raise_for_status()
-    for project in r.json():
+    for project in _loads(r):
         if project['name'].lower() == 'inbox':
             return project['id']
     raise Exception("Inbox project not found")
 
 
 def fetch_tasks(project_id):
-    r = requests.get(f"{TODOIST_API}/tasks?project_id={project_id}", headers=HEADERS)
+    r = SESSION.get(f"{TODOIST_TASKS_URL}?project_id={project_id}", headers=HEADERS)
     r.raise_for_status()
-    return r.json()
+    return _loads(r)
+
+
+def iter_tasks(project_ids):
+    """Yield tasks project by project, so callers can filter without holding every project's tasks at once"""
+    project_ids = list(project_ids)
+    if len(project_ids) <= 1:
+        for project_id in project_ids:
+            yield from fetch_tasks(project_id)
+        return
+    
+    # Overlap the per-project requests, submitting the next one as each project is yielded so at most
+    # PROJECT_FETCH_WORKERS task lists are held at once; results are still yielded in project order
+    with ThreadPoolExecutor(max_workers=min(PROJECT_FETCH_WORKERS, len(project_ids))) as executor:
+        pending = deque(executor.submit(fetch_tasks, project_id) for project_id in project_ids[:PROJECT_FETCH_WORKERS])
+        for project_id in project_ids[PROJECT_FETCH_WORKERS:]:
+            project_tasks = pending.popleft().result()
+            pending.append(executor.submit(fetch_tasks, project_id))
+            yield from project_tasks
+        while pending:
+            yield from pending.popleft().result()
+
+
+# Titles live in the page head, so only the start of each page is downloaded and parsed
+TITLE_SCAN_BYTES = 128 * 1024
+TITLE_CHUNK_BYTES = 8 * 1024
+HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+OG_TITLE_RE = re.compile(
+    r'<meta\b(?=[^>]*\bproperty\s*=\s*["\']og:title["\'])[^>]*?\bcontent\s*=\s*(["\'])(.*?)\1',
+    re.IGNORECASE | re.DOTALL)
+HTML_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+TWITTER_TITLE_RE = re.compile(
+    r'<meta\b(?=[^>]*\bname\s*=\s*["\']twitter:title["\'])[^>]*?\bcontent\s*=\s*(["\'])(.*?)\1',
+    re.IGNORECASE | re.DOTALL)
+
+
+def read_page_head(resp, limit=TITLE_SCAN_BYTES):
+    """Read a streamed response up to its </head> (at most limit bytes) and decode it as text"""
+    page_head = bytearray()
+    try:
+        for chunk in resp.iter_content(TITLE_CHUNK_BYTES):
+            # Only the new chunk (plus enough overlap for a tag split across chunks) needs searching
+            search_from = max(0, len(page_head) - 8)
+            page_head += chunk
+            if len(page_head) >= limit or HEAD_END_RE.search(page_head, search_from):
+                break
+    finally:
+        resp.close()
+    return bytes(page_head[:limit]).decode(resp.encoding or 'utf-8', errors='replace')
+
+
+def extract_title_fast(page_html):
+    """
+    Return the Open Graph, <title> or Twitter card title from raw HTML using regexes, or None.
+    
+    Mirrors the preference order of the BeautifulSoup path (og:title, <title>, twitter:title);
+    callers fall back to the full parse only when none gives a usable title.
+    """
+    for pattern, group in ((OG_TITLE_RE, 2), (HTML_TITLE_RE, 1), (TWITTER_TITLE_RE, 2)):
+        match = pattern.search(page_html)
+        if match:
+            title = ' '.join(html.unescape(match.group(group)).split())
+            if is_good_title(title):
+                return title
+    return None
+
+
+# Reddit share links (/r/<sub>/s/<id>) and regular comment permalinks
+REDDIT_SHARE_RE = re.compile(r'https?://(?:www\.)?reddit\.com/r/([^/]+)/s/([^/?#]+)')
+REDDIT_COMMENTS_RE = re.compile(r'https?://(?:www\.)?reddit\.com/r/([^/]+)/comments/([^/]+)/')
+
+
+# Titles fetched in earlier runs, reused for TITLE_CACHE_TTL before they are fetched again.
+# Defaults to the directory holding main.py; TITLE_CACHE_PATH overrides it.
+TITLE_CACHE_FILE = os.getenv('TITLE_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'title_cache.db'))
+TITLE_CACHE_TTL = timedelta(days=30)
+
+
+class TitleCache:
+    """
+    Persistent URL → title store backed by SQLite.
+    
+    The database is opened on first use and shared by the title prefetch threads.
+    Writes are committed together by close() at the end of a run rather than per URL.
+    """
+    
+    def __init__(self, path=TITLE_CACHE_FILE, ttl=TITLE_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.conn = None
+        self.lock = threading.Lock()
+    
+    def _connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute('CREATE TABLE IF NOT EXISTS titles (url TEXT PRIMARY KEY, title TEXT, fetched_at REAL)')
+        return self.conn
+    
+    def get(self, url):
+        """Return the stored title for url if it is younger than the TTL, else None"""
+        min_fetched_at = time.time() - self.ttl.total_seconds()
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    'SELECT title FROM titles WHERE url = ? AND fetched_at > ?', (url, min_fetched_at)).fetchone()
+        except sqlite3.Error as e:
+            log_warning(f"Title cache unavailable: {e}")
+            return None
+        return row[0] if row else None
+    
+    def put(self, url, title):
+        """Store a freshly fetched title (committed on close)"""
+        try:
+            with self.lock:
+                self._connect().execute(
+                    'INSERT OR REPLACE INTO titles (url, title, fetched_at) VALUES (?, ?, ?)', (url, title, time.time()))
+        except sqlite3.Error as e:
+            log_warning(f"Failed to cache title for {url}: {e}")
+    
+    def close(self):
+        """Commit pending titles and close the database"""
+        with self.lock:
+            if self.conn is None:
+                return
+            try:
+                self.conn.commit()
+                self.conn.close()
+            except sqlite3.Error as e:
+                log_warning(f"Failed to save title cache: {e}")
+            self.conn = None
+
+
+TITLE_CACHE = TitleCache()
 
 
+@functools.lru_cache(maxsize=None)
 def fetch_page_title(url):
+    """Return the title for url, from the on-disk title cache when a recent one exists"""
+    # Results are cached per URL so prefetch_page_titles() can warm them concurrently
+    title = TITLE_CACHE.get(url)
+    if title is None:
+        title = _fetch_page_title(url)
+        # Failures are often transient (rate limits, blocks), so only real titles are kept
+        if title:
+            TITLE_CACHE.put(url, title)
+    return title
+
+
+# YouTube videos (watch, shorts and youtu.be links) have a ~1 KB oEmbed record with the title
+YOUTUBE_VIDEO_RE = re.compile(
+    r'https?://(?:(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#\s]*&)?v=|shorts/)|youtu\.be/)([A-Za-z0-9_-]{11})')
+YOUTUBE_OEMBED_URL = "https://www.youtube.com/oembed"
+
+
+def fetch_youtube_title(video_id):
+    """Return a YouTube video's title from its oEmbed record, or None"""
+    try:
+        resp = SESSION.get(YOUTUBE_OEMBED_URL, timeout=10,
+                           params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"})
+        if resp.status_code == 200:
+            title = (_loads(resp).get("title") or "").strip()
+            if is_good_title(title):
+                return clean_title(title)
+    except Exception:
+        pass
+    return None
+
+
+def _fetch_page_title(url):
+    # Known URL shapes answered by a small API record instead of the page (no redirect lookup needed)
+    youtube_match = YOUTUBE_VIDEO_RE.match(url)
+    if youtube_match:
+        title = fetch_youtube_title(youtube_match.group(1))
+        if title:
+            return title
+    
     # Fixed variable scope and Reddit blocking issues - v3
     url = resolve_redirect(url)  # Handle shortlink redirects (e.g. Reddit /s/)
     try:
@@ -1653,11 +2568,11 @@ def fetch_page_title(url):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
             
-            m = re.match(r'https?://(?:www\.)?reddit\.com/r/([^/]+)/s/([^/?#]+)', url)
+            m = REDDIT_SHARE_RE.match(url)
             if m:
                 subreddit, postid = m.groups()
             else:
-                m2 = re.match(r'https?://(?:www\.)?reddit\.com/r/([^/]+)/comments/([^/]+)/', url)
+                m2 = REDDIT_COMMENTS_RE.match(url)
                 if m2:
                     subreddit, postid = m2.groups()
                 else:
@@ -1669,11 +2584,9 @@ def fetch_page_title(url):
                 
                 # 1) Try old Reddit with better headers and session
                 try:
-                    session = requests.Session()
-                    session.headers.update(reddit_headers)
                     html_url = f"https://old.reddit.com/r/{subreddit}/comments/{postid}"
-                    resp = session.get(html_url, timeout=15)
-                    soup = BeautifulSoup(resp.text, "html.parser")
+                    resp = SESSION.get(html_url, headers=reddit_headers, timeout=15, stream=True)
+                    soup = BeautifulSoup(read_page_head(resp), HTML_PARSER)
                     if soup.title and soup.title.string:
                         title = soup.title.string.split(" : ")[0].strip()
                         if title.lower() not in ["blocked", "page not found", "reddit"]:
@@ -1685,8 +2598,8 @@ def fetch_page_title(url):
                 # 2) Try alternative old reddit approach without www
                 try:
                     no_www_url = url.replace("www.reddit.com", "reddit.com").replace("reddit.com", "old.reddit.com")
-                    resp = requests.get(no_www_url, headers=reddit_headers, timeout=15)
-                    soup = BeautifulSoup(resp.text, "html.parser")
+                    resp = SESSION.get(no_www_url, headers=reddit_headers, timeout=15, stream=True)
+                    soup = BeautifulSoup(read_page_head(resp), HTML_PARSER)
                     if soup.title and soup.title.string:
                         title = soup.title.string.split(" : ")[0].strip()
                         if title.lower() not in ["blocked", "page not found", "reddit"]:
@@ -1699,8 +2612,8 @@ def fetch_page_title(url):
 
         # Special handling for Instagram links
         if "instagram.com" in url:
-            resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = SESSION.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10, stream=True)
+            soup = BeautifulSoup(read_page_head(resp), HTML_PARSER)
             
             # Try Open Graph title first (often contains the caption)
             og = soup.find("meta", property="og:title")
@@ -1735,8 +2648,15 @@ def fetch_page_title(url):
                 return "Instagram Post"
 
         # Generic fallback: HTML <title>
-        resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        resp = SESSION.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10, stream=True)
+        page_head = read_page_head(resp)
+        
+        # Fast path: pull the og:title / <title> straight out of the page head
+        title = extract_title_fast(page_head)
+        if title:
+            return clean_title(title)
+        
+        soup = BeautifulSoup(page_head, HTML_PARSER)
         
         # Try Open Graph title first (often cleaner than HTML title)
         og = soup.find("meta", property="og:title")
@@ -1760,7 +2680,6 @@ def fetch_page_title(url):
 
     except Exception as e:
         # Only log unexpected errors, not common blocking issues
-        from urllib.parse import urlparse
         try:
             domain = urlparse(url).netloc
             error_str = str(e).lower()
@@ -1772,22 +2691,46 @@ def fetch_page_title(url):
     return None
 
 
+def prefetch_page_titles(urls, max_workers=TITLE_PREFETCH_WORKERS):
+    """Fetch titles for all URLs concurrently so later fetch_page_title calls hit the cache"""
+    urls = set(urls)
+    if not urls:
+        return
+    
+    # Interleave hosts (one URL per domain per round) so concurrent workers spread out over
+    # sites instead of hitting the same one with a burst of simultaneous requests
+    urls_by_domain = {}
+    for url in urls:
+        urls_by_domain.setdefault(_domain_of(url), []).append(url)
+    ordered_urls = [url for round_urls in itertools.zip_longest(*urls_by_domain.values()) for url in round_urls if url]
+    
+    # Cap in-flight requests per site, so a batch dominated by one domain doesn't hammer it
+    host_slots = {domain: threading.BoundedSemaphore(TITLE_FETCHES_PER_HOST) for domain in urls_by_domain}
+    
+    def fetch_with_host_limit(url):
+        with host_slots[_domain_of(url)]:
+            return fetch_page_title(url)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        # fetch_page_title handles its own errors; consume results to surface anything unexpected
+        list(executor.map(fetch_with_host_limit, ordered_urls))
+
+
 def get_label_id(label_name="link"):
-    r = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
-    r.raise_for_status()
-    for label in r.json():
-        if label['name'].lower() == label_name:
-            return label['id']
+    existing_labels = get_existing_labels()
+    if label_name in existing_labels:
+        return existing_labels[label_name]
     # Create the label if not found
-    create_resp = requests.post(f"{TODOIST_API}/labels", headers=HEADERS, json={"name": label_name})
+    create_resp = SESSION.post(TODOIST_LABELS_URL, headers=HEADERS, json={"name": label_name})
     if create_resp.status_code in (200, 201):
-        label_data = create_resp.json()
+        label_data = _loads(create_resp)
+        existing_labels[label_name.lower()] = label_data['id']
         return label_data['id']
     else:
         return None
 
 
-def update_task(task, title=None, url=None, labels_to_add=None, summary=None, dry_run=False, new_content=None):
+def update_task(task, title=None, url=None, labels_to_add=None, summary=None, dry_run=False, new_content=None, command_buffer=None):
     payload = {}
     
     # Ensure labels_to_add is a list
@@ -1810,16 +2753,26 @@ def update_task(task, title=None, url=None, labels_to_add=None, summary=None, dr
 
     if labels_to_add:
         existing_labels = task.get("labels", [])
+        existing_set = frozenset(existing_labels)
         # Only add labels that don't already exist
-        new_labels = [label for label in labels_to_add if label not in existing_labels]
+        new_labels = [label for label in labels_to_add if label not in existing_set]
         if new_labels:
-            payload["labels"] = list(set(existing_labels + new_labels))
+            payload["labels"] = list(existing_set.union(new_labels))
 
     if not payload:
         if summary:
             summary.skipped("empty payload")
         return False
 
+    # Skip the API call entirely if the payload wouldn't change anything on the task
+    current_labels = task.get("labels", [])
+    if (set(payload.get("labels", current_labels)) == set(current_labels)
+            and payload.get("content", task["content"]) == task["content"]
+            and payload.get("description", task.get("description", "")) == task.get("description", "")):
+        if summary:
+            summary.skipped("no-op update")
+        return True
+
     # In dry run mode, just preview the changes
     if dry_run:
         log_info("🔍 DRY RUN - Would update task:", "cyan")
@@ -1836,8 +2789,13 @@ def update_task(task, title=None, url=None, labels_to_add=None, summary=None, dr
                 log_info(f"   Labels: {current_labels} → {new_labels_result}", "blue")
         return True
 
+    # Defer the update to a batched Sync API request if a command buffer is provided
+    if command_buffer is not None:
+        command_buffer.queue_update(task['id'], task.get('content'), **payload)
+        return True
+
     # Actually make the API call
-    r = requests.post(f"{TODOIST_API}/tasks/{task['id']}", headers=HEADERS, json=payload)
+    r = SESSION.post(f"{TODOIST_TASKS_URL}/{task['id']}", headers=HEADERS, json=payload)
     if r.status_code in (200, 204):
         return True
 
@@ -1896,7 +2854,7 @@ def ensure_today_section_exists(project_id, config, task_logger=None):
         return None
 
 
-def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, bulk_mode=False):
+def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, bulk_mode=False, today_date=None, command_buffer=None):
     """
     Apply today markers to ranked tasks (due date = today + optional label).
     
@@ -1906,6 +2864,8 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
         task_logger: Logger for task operations
         dry_run: If True, only simulate marker application
         bulk_mode: Enable bulk processing rate limiting
+        today_date: Today's date as 'YYYY-MM-DD' (computed if not provided)
+        command_buffer: Optional SyncCommandBuffer to queue the updates on
         
     Returns:
         int: Number of tasks successfully marked
@@ -1919,17 +2879,14 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
         return 0
     
     marked_count = 0
-    today_date = datetime.now().strftime('%Y-%m-%d')
+    if today_date is None:
+        today_date = datetime.now().strftime('%Y-%m-%d')
     
     try:
         # Get today label ID if we're using labels
         today_label_id = None
         if use_label:
-            labels_response = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
-            labels_response.raise_for_status()
-            existing_labels = {label['name']: label['id'] for label in labels_response.json()}
-            
-            today_label_id = existing_labels.get(today_marker)
+            today_label_id = get_existing_labels(task_logger).get(today_marker.lower())
             if not today_label_id and not dry_run:
                 today_label_id = create_label_if_missing(today_marker, task_logger)
                 if not today_label_id:
@@ -1937,11 +2894,13 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
                         task_logger.error(f"TODAY_LABEL_CREATE_FAILED: Failed to create '{today_marker}' label")
                     use_label = False  # Continue without labels
         
+        # Task labels are compared as strings, so normalize the label ID once
+        today_label_key = str(today_label_id) if today_label_id else None
+        
         # Apply today markers to each ranked task
         for ranked_task in ranked_tasks:
             task_data = ranked_task['task']
             task_id = task_data.get('id')
-            task_content = task_data.get('content', 'No content')[:50]
             
             if not task_id:
                 continue
@@ -1961,7 +2920,7 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
                 actions_taken.append('due_date')
             
             # 2. Add @today label if enabled and not already present
-            if use_label and today_label_id and str(today_label_id) not in current_labels:
+            if use_label and today_label_key and today_label_key not in current_labels:
                 updates_needed['labels'] = list(current_labels) + [today_label_id]
                 actions_taken.append('label')
             
@@ -1976,24 +2935,34 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
                     actions_str = '+'.join(actions_taken)
                     task_logger.info(f"TODAY_MARKER_DRY_RUN: Would apply {actions_str} to task {task_id}")
                 marked_count += 1
+            elif command_buffer is not None:
+                # Queue for the batched Sync API request (Sync uses a due object instead of due_string)
+                sync_updates = dict(updates_needed)
+                if 'due_string' in sync_updates:
+                    sync_updates['due'] = {'string': sync_updates.pop('due_string')}
+                command_buffer.queue_update(task_id, task_data.get('content'), **sync_updates)
+                marked_count += 1
+                if task_logger:
+                    task_logger.info("TODAY_MARKER_QUEUED: Queued %s for task %s | Content: %.50s",
+                                     '+'.join(actions_taken), task_id, task_data.get('content', 'No content'))
             else:
                 # Apply updates via API
                 try:
-                    response = requests.post(f"{TODOIST_API}/tasks/{task_id}", headers=HEADERS, json=updates_needed)
+                    response = SESSION.post(f"{TODOIST_TASKS_URL}/{task_id}", headers=HEADERS, json=updates_needed)
                     
                     if response.status_code == 200:
                         marked_count += 1
                         actions_str = '+'.join(actions_taken)
                         if task_logger:
-                            task_logger.info(f"TODAY_MARKER_APPLIED: Applied {actions_str} to task {task_id} | Content: {task_content}")
+                            task_logger.info("TODAY_MARKER_APPLIED: Applied %s to task %s | Content: %.50s",
+                                             actions_str, task_id, task_data.get('content', 'No content'))
                     else:
                         if task_logger:
                             task_logger.error(f"TODAY_MARKER_FAILED: Failed to apply today markers to task {task_id} (HTTP {response.status_code})")
                             
                     # Rate limiting for bulk mode
                     if bulk_mode:
-                        import time
-                        time.sleep(0.1)
+                        TODOIST_BUCKET.acquire()
                         
                 except Exception as e:
                     if task_logger:
@@ -2007,7 +2976,7 @@ def apply_today_markers(ranked_tasks, config, task_logger=None, dry_run=False, b
     return marked_count
 
 
-def refresh_today_section_dates(project_id, section_id, config, task_logger=None, dry_run=False, bulk_mode=False):
+def refresh_today_section_dates(project_id, section_id, config, task_logger=None, dry_run=False, bulk_mode=False, today_date=None, command_buffer=None):
     """
     Update due dates to today for all tasks in Today section.
     
@@ -2018,6 +2987,8 @@ def refresh_today_section_dates(project_id, section_id, config, task_logger=None
         task_logger: Logger for task operations
         dry_run: If True, only simulate date updates
         bulk_mode: Enable bulk processing rate limiting
+        today_date: Today's date as 'YYYY-MM-DD' (computed if not provided)
+        command_buffer: Optional SyncCommandBuffer to queue the due date updates on
         
     Returns:
         int: Number of tasks with updated due dates
@@ -2026,13 +2997,14 @@ def refresh_today_section_dates(project_id, section_id, config, task_logger=None
         return 0
     
     updated_count = 0
-    today_date = datetime.now().strftime('%Y-%m-%d')
+    if today_date is None:
+        today_date = datetime.now().strftime('%Y-%m-%d')
     
     try:
         # Get all tasks in Today section
-        response = requests.get(f"{TODOIST_API}/tasks?project_id={project_id}&section_id={section_id}", headers=HEADERS)
+        response = SESSION.get(f"{TODOIST_TASKS_URL}?project_id={project_id}&section_id={section_id}", headers=HEADERS)
         response.raise_for_status()
-        today_tasks = response.json()
+        today_tasks = _loads(response)
         
         if not today_tasks:
             if task_logger:
@@ -2066,11 +3038,18 @@ def refresh_today_section_dates(project_id, section_id, config, task_logger=None
                     task_logger.info(f"TODAY_DATE_DRY_RUN: Would update task {task_id} from '{old_date_str}' to '{today_date}'")
                 log_info(f"🧪 Would update: {task_content} → due today")
                 updated_count += 1
+            elif command_buffer is not None:
+                # Queue for the batched Sync API request (Sync uses a due object instead of due_string)
+                command_buffer.queue_update(task_id, task.get('content'), due={'string': 'today'})
+                updated_count += 1
+                if task_logger:
+                    task_logger.info("TODAY_DATE_QUEUED: Queued due date update to today for task %s | Content: %s",
+                                     task_id, task_content)
             else:
                 # Update due date to today
                 try:
                     update_data = {"due_string": "today"}
-                    response = requests.post(f"{TODOIST_API}/tasks/{task_id}", headers=HEADERS, json=update_data)
+                    response = SESSION.post(f"{TODOIST_TASKS_URL}/{task_id}", headers=HEADERS, json=update_data)
                     
                     if response.status_code == 200:
                         updated_count += 1
@@ -2085,8 +3064,7 @@ def refresh_today_section_dates(project_id, section_id, config, task_logger=None
                         
                     # Rate limiting for bulk mode
                     if bulk_mode:
-                        import time
-                        time.sleep(0.1)
+                        TODOIST_BUCKET.acquire()
                         
                 except Exception as e:
                     if task_logger:
@@ -2101,7 +3079,7 @@ def refresh_today_section_dates(project_id, section_id, config, task_logger=None
     return updated_count
 
 
-def clear_today_section(project_id, section_id, config, task_logger=None, dry_run=False, bulk_mode=False):
+def clear_today_section(project_id, section_id, config, task_logger=None, dry_run=False, bulk_mode=False, command_buffer=None):
     """
     Clear tasks from Today section by removing @today labels and moving back to backlog.
     
@@ -2112,6 +3090,7 @@ def clear_today_section(project_id, section_id, config, task_logger=None, dry_ru
         task_logger: Logger for task operations
         dry_run: If True, only simulate clearing
         bulk_mode: Enable bulk processing rate limiting
+        command_buffer: Optional SyncCommandBuffer to queue the moves and label removals on
         
     Returns:
         int: Number of tasks cleared from Today section
@@ -2123,9 +3102,9 @@ def clear_today_section(project_id, section_id, config, task_logger=None, dry_ru
     
     try:
         # Get all tasks in Today section
-        response = requests.get(f"{TODOIST_API}/tasks?project_id={project_id}&section_id={section_id}", headers=HEADERS)
+        response = SESSION.get(f"{TODOIST_TASKS_URL}?project_id={project_id}&section_id={section_id}", headers=HEADERS)
         response.raise_for_status()
-        today_tasks = response.json()
+        today_tasks = _loads(response)
         
         if not today_tasks:
             if task_logger:
@@ -2136,51 +3115,54 @@ def clear_today_section(project_id, section_id, config, task_logger=None, dry_ru
         today_marker = label_config.get('today_marker', '@today')
         
         # Get @today label ID
-        labels_response = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
-        labels_response.raise_for_status()
-        existing_labels = {label['name']: label['id'] for label in labels_response.json()}
-        today_label_id = existing_labels.get(today_marker)
+        today_label_id = get_existing_labels(task_logger).get(today_marker.lower())
+        today_label_key = str(today_label_id) if today_label_id else None
         
         for task in today_tasks:
             task_id = task.get('id')
-            task_content = task.get('content', 'No content')[:50]
             
             if not task_id:
                 continue
             
             if dry_run:
                 if task_logger:
-                    task_logger.info(f"TODAY_CLEAR_DRY_RUN: Would clear task {task_id} from Today section | Content: {task_content}")
+                    task_logger.info("TODAY_CLEAR_DRY_RUN: Would clear task %s from Today section | Content: %.50s",
+                                     task_id, task.get('content', 'No content'))
                 cleared_count += 1
+            elif command_buffer is not None:
+                # Queue the move back to the backlog and the @today label removal for one batched request
+                command_buffer.queue_move_to_project(task_id, project_id, task.get('content'))
+                current_labels = set(task.get('labels', []))
+                if today_label_key and today_label_key in current_labels:
+                    command_buffer.queue_update(task_id, task.get('content'),
+                                                labels=[label for label in current_labels if str(label) != today_label_key])
+                cleared_count += 1
+                if task_logger:
+                    task_logger.info("TODAY_CLEAR_QUEUED: Queued clearing task %s from Today section | Content: %.50s",
+                                     task_id, task.get('content', 'No content'))
             else:
                 try:
-                    # Remove @today label if present
+                    # Move task out of Today section (back to no section/backlog) and
+                    # remove @today label if present, in a single update
+                    update_data = {"section_id": None}
                     current_labels = set(task.get('labels', []))
-                    if today_label_id and str(today_label_id) in current_labels:
-                        new_labels = [label for label in current_labels if str(label) != str(today_label_id)]
-                        update_data = {"labels": new_labels}
-                        label_response = requests.post(f"{TODOIST_API}/tasks/{task_id}", headers=HEADERS, json=update_data)
-                        
-                        if label_response.status_code != 200:
-                            if task_logger:
-                                task_logger.error(f"TODAY_CLEAR_LABEL_FAILED: Failed to remove @today label from task {task_id}")
+                    if today_label_key and today_label_key in current_labels:
+                        update_data["labels"] = [label for label in current_labels if str(label) != today_label_key]
                     
-                    # Move task out of Today section (back to no section/backlog)
-                    move_data = {"section_id": None}
-                    move_response = requests.post(f"{TODOIST_API}/tasks/{task_id}", headers=HEADERS, json=move_data)
+                    response = SESSION.post(f"{TODOIST_TASKS_URL}/{task_id}", headers=HEADERS, json=update_data)
                     
-                    if move_response.status_code == 200:
+                    if response.status_code == 200:
                         cleared_count += 1
                         if task_logger:
-                            task_logger.info(f"TODAY_CLEAR_SUCCESS: Cleared task {task_id} from Today section | Content: {task_content}")
+                            task_logger.info("TODAY_CLEAR_SUCCESS: Cleared task %s from Today section | Content: %.50s",
+                                             task_id, task.get('content', 'No content'))
                     else:
                         if task_logger:
-                            task_logger.error(f"TODAY_CLEAR_MOVE_FAILED: Failed to move task {task_id} out of Today section")
+                            task_logger.error(f"TODAY_CLEAR_FAILED: Failed to clear task {task_id} from Today section (HTTP {response.status_code})")
                     
                     # Rate limiting for bulk mode
                     if bulk_mode:
-                        import time
-                        time.sleep(0.1)
+                        TODOIST_BUCKET.acquire()
                         
                 except Exception as e:
                     if task_logger:
@@ -2253,7 +3235,7 @@ def format_reranker_comment(ranked_task, ranking_mode=None):
     return '\n'.join(comment_lines)
 
 
-def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logger=None, dry_run=False, bulk_mode=False, add_comments=True, ranking_mode=None):
+def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logger=None, dry_run=False, bulk_mode=False, add_comments=True, ranking_mode=None, command_buffer=None):
     """
     Move ranked tasks to Today section.
     
@@ -2266,6 +3248,7 @@ def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logge
         bulk_mode: Enable bulk processing rate limiting
         add_comments: If True, add explanation comments to tasks (default: True)
         ranking_mode: Current ranking mode for comment context
+        command_buffer: Optional SyncCommandBuffer to queue the moves and comments on
         
     Returns:
         int: Number of tasks successfully moved
@@ -2278,7 +3261,7 @@ def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logge
     for ranked_task in ranked_tasks:
         task_data = ranked_task['task']
         task_id = task_data.get('id')
-        task_content = task_data.get('content', 'No content')[:50]
+        task_content = task_data.get('content', 'No content')
         current_section = task_data.get('section_id')
         
         if not task_id:
@@ -2292,7 +3275,7 @@ def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logge
         
         if dry_run:
             if task_logger:
-                task_logger.info(f"TODAY_MOVE_DRY_RUN: Would move task {task_id} to Today section | Content: {task_content}")
+                task_logger.info("TODAY_MOVE_DRY_RUN: Would move task %s to Today section | Content: %.50s", task_id, task_content)
             
             # Show comment that would be added in dry run
             if add_comments and 'gpt_explanation' in ranked_task:
@@ -2303,16 +3286,19 @@ def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logge
             moved_count += 1
         else:
             # Move task to Today section
-            success = move_task_to_section(task_id, section_id, task_logger, task_content, bulk_mode)
+            success = move_task_to_section(task_id, section_id, task_logger, task_content, bulk_mode, command_buffer)
             if success:
                 moved_count += 1
                 if task_logger:
-                    task_logger.info(f"TODAY_MOVE_SUCCESS: Moved task {task_id} to Today section | Content: {task_content}")
+                    task_logger.info("TODAY_MOVE_SUCCESS: Moved task %s to Today section | Content: %.50s", task_id, task_content)
                 
                 # Add explanation comment if enabled and GPT explanation is available
                 if add_comments and 'gpt_explanation' in ranked_task:
                     comment_text = format_reranker_comment(ranked_task, ranking_mode)
-                    add_task_comment(task_id, comment_text, task_logger, dry_run=False)
+                    if command_buffer is not None:
+                        command_buffer.queue_comment(task_id, comment_text, task_content)
+                    else:
+                        add_task_comment(task_id, comment_text, task_logger, dry_run=False)
                     
             else:
                 if task_logger:
@@ -2322,18 +3308,13 @@ def move_tasks_to_today_section(ranked_tasks, project_id, section_id, task_logge
 
 
 def main(test_mode=False):
-    # Clear section cache at start of each run
-    clear_section_cache()
-    
-    summary = TaskSummary()
-    task_logger = setup_task_logging()
-    
-    # Parse CLI arguments first
+    # Parse CLI arguments first so --help exits before any config or logging setup
     parser = argparse.ArgumentParser()
     parser.add_argument("--project", type=str, help="Comma-separated list of project names to process")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     parser.add_argument("--debug-labels", action="store_true", help="Debug mode: Show all labels and their mappings")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without modifying any tasks")
+    parser.add_argument("--dry-run-with-network", action="store_true", help="Include TaskSense/GPT labeling and link title fetches in --dry-run previews (makes network calls)")
     parser.add_argument("--full-scan", action="store_true", help="Process all tasks, ignoring last run timestamp")
     parser.add_argument("--ignore-last-run", action="store_true", help="Bypass last run timestamp check (useful for cloud environments)")
     parser.add_argument("--mode", type=str, choices=['personal', 'work', 'weekend', 'evening', 'auto'], 
@@ -2356,13 +3337,19 @@ def main(test_mode=False):
     
     args, _ = parser.parse_known_args()
     
+    # Clear section and label caches at start of each run
+    clear_section_cache()
+    clear_label_cache()
+    
+    summary = TaskSummary()
+    
     # Handle debug-labels mode immediately
     if args.debug_labels:
         log_info("🏷️ Fetching label mappings...")
         try:
-            response = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
+            response = SESSION.get(TODOIST_LABELS_URL, headers=HEADERS)
             response.raise_for_status()
-            labels = response.json()
+            labels = _loads(response)
             
             log_info(f"\n📋 Found {len(labels)} labels:")
             for label in labels:
@@ -2370,17 +3357,15 @@ def main(test_mode=False):
             
             # Also show sample tasks with their labels
             log_info("\n📝 Sample tasks with labels:")
-            tasks_response = requests.get(f"{TODOIST_API}/tasks", headers=HEADERS, params={'limit': 10})
+            tasks_response = SESSION.get(TODOIST_TASKS_URL, headers=HEADERS, params={'limit': 10})
             tasks_response.raise_for_status()
-            tasks = tasks_response.json()
+            tasks = _loads(tasks_response)
             
             for task in tasks[:5]:
                 if task.get('labels'):
                     label_names = [next((l['name'] for l in labels if l['id'] == lid), f"Unknown({lid})") 
                                   for lid in task['labels']]
-                    task_content = task['content'][:50]
-                    if len(task['content']) > 50:
-                        task_content += "..."
+                    task_content = truncate_text(task['content'], 50)
                     print(f"  • {task_content:50} → {label_names}")
             
             log_info("\n✅ Debug labels complete")
@@ -2454,6 +3439,9 @@ def main(test_mode=False):
         
         return
 
+    # Standalone labeling above doesn't write task logs, so set up file logging only from here on
+    task_logger = setup_task_logging()
+
     # Handle --refresh-today-dates flag (standalone operation)
     if args.refresh_today_dates:
         from datetime import datetime
@@ -2465,7 +3453,6 @@ def main(test_mode=False):
         try:
             # Initialize TaskSense for configuration
             task_sense = TaskSense()
-            task_logger = setup_task_logging()
             
             log_info("📅 Refreshing due dates for Today section tasks")
             task_logger.info("=== TODAY DATES REFRESH START ===")
@@ -2480,9 +3467,9 @@ def main(test_mode=False):
                 project_names = ["inbox"]
             
             # Get projects from API
-            projects_response = requests.get(f"{TODOIST_API}/projects", headers=HEADERS)
+            projects_response = SESSION.get(TODOIST_PROJECTS_URL, headers=HEADERS)
             projects_response.raise_for_status()
-            all_projects = projects_response.json()
+            all_projects = _loads(projects_response)
             
             target_projects = []
             for project in all_projects:
@@ -2494,6 +3481,9 @@ def main(test_mode=False):
                 return
             
             total_updated = 0
+            today_date = datetime.now().strftime('%Y-%m-%d')
+            # Due date updates for every project go out together in batched Sync requests
+            dates_buffer = SyncCommandBuffer(task_logger, args.bulk_mode)
             
             # Process each project's Today section
             for project in target_projects:
@@ -2507,12 +3497,18 @@ def main(test_mode=False):
                     log_info(f"📂 Processing Today section in project: {project_name}")
                     updated_count = refresh_today_section_dates(
                         project_id, today_section_id, task_sense.ranking_config,
-                        task_logger, args.dry_run, args.bulk_mode
+                        task_logger, args.dry_run, args.bulk_mode, today_date, dates_buffer
                     )
                     total_updated += updated_count
                 else:
                     log_warning(f"⚠️  No Today section found in project: {project_name}")
             
+            if len(dates_buffer):
+                failed_updates = sum(1 for ok in dates_buffer.flush().values() if not ok)
+                total_updated -= failed_updates
+                if failed_updates:
+                    log_warning(f"⚠️  {failed_updates} due date updates failed (see task log)")
+            
             # Summary
             if total_updated > 0:
                 if args.dry_run:
@@ -2542,14 +3538,14 @@ def main(test_mode=False):
         project_names = ["inbox"]
     
     try:
-        projects_response = requests.get(f"{TODOIST_API}/projects", headers=HEADERS)
+        projects_response = SESSION.get(TODOIST_PROJECTS_URL, headers=HEADERS)
         task_logger.info(f"API Response Status: {projects_response.status_code}")
         task_logger.info(f"API Response Headers: {dict(projects_response.headers)}")
         task_logger.info(f"API Response Content (first 500 chars): {projects_response.text[:500]}")
         
         projects_response.raise_for_status()
-        all_projects = projects_response.json()
-    except requests.exceptions.JSONDecodeError:
+        all_projects = _loads(projects_response)
+    except (requests.exceptions.JSONDecodeError, json.JSONDecodeError):
         log_error("❌ Failed to parse Todoist API response. Check your TODOIST_API_TOKEN.")
         log_error(f"Response status: {projects_response.status_code}")
         log_error(f"Response content: {projects_response.text[:500]}")
@@ -2568,10 +3564,15 @@ def main(test_mode=False):
         task_logger.error(f"API Error: {e}")
         return
     
+    project_name_by_id = {p["id"]: p["name"] for p in all_projects}
     project_ids = [p["id"] for p in all_projects if p["name"].strip().lower() in project_names]
     if not project_ids:
         log_warning("No matching projects found")
         return
+    
+    # Labels and sections don't change under us during a run; read them all in one request
+    if not test_mode:
+        prime_caches_from_sync(project_name_by_id, task_logger)
 
     # Get last run timestamp for incremental processing
     last_run_time = None
@@ -2603,14 +3604,14 @@ def main(test_mode=False):
     # Log masked token for debugging (show first 8 and last 4 chars)
     token = os.environ.get('TODOIST_API_TOKEN', '')
     masked_token = f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "TOKEN_TOO_SHORT"
-    task_logger.info(f"=== SESSION START {mode_str} ===")
-    task_logger.info(f"Using API token: {masked_token}")
-    task_logger.info(f"Token length: {len(token)}")
-    task_logger.info(f"Token has whitespace: {token != token.strip()}")
-    task_logger.info(f"Authorization header: Bearer {token[:8]}...{token[-4:] if len(token) > 12 else 'SHORT'}")
+    task_logger.info("=== SESSION START %s ===", mode_str)
+    task_logger.info("Using API token: %s", masked_token)
+    task_logger.info("Token length: %d", len(token))
+    task_logger.info("Token has whitespace: %s", token != token.strip())
+    task_logger.info("Authorization header: Bearer %s...%s", token[:8], token[-4:] if len(token) > 12 else 'SHORT')
     
     if last_run_time:
-        task_logger.info(f"Last run timestamp: {last_run_time}")
+        task_logger.info("Last run timestamp: %s", last_run_time)
         log_info(f"🕒 Processing tasks created after: {last_run_time.strftime('%Y-%m-%d %H:%M:%S UTC')}", "cyan")
 
     if test_mode:
@@ -2620,6 +3621,7 @@ def main(test_mode=False):
             "https://www.toughtongueai.com/",
             "https://open.substack.com/pub/thegeneralist/p/the-generalists-productivity-stack"
         ]
+        prefetch_page_titles(test_links)
         for url in test_links:
             title = fetch_page_title(url)
             log_info(f"🔗 {url} → {title or 'Failed to fetch title'}")
@@ -2628,26 +3630,19 @@ def main(test_mode=False):
         return  # Exit after test mode
 
     if not test_mode:
-        tasks = []
-        for pid in project_ids:
-            tasks.extend(fetch_tasks(pid))
-
-        if not tasks:
-            log_info("ℹ️  No tasks found in specified projects")
-            return
-
-        # Add dry run header
-        if args.dry_run:
-            log_info("🧪 DRY RUN MODE - No changes will be made to your tasks", "yellow")
-            log_info("=" * 60, "yellow")
-
-        # Filter tasks based on incremental processing logic
+        # Fetch and filter tasks in one pass based on incremental processing logic
         tasks_to_process = []
+        total_task_count = 0
         skipped_count = 0
+        section_rule_labels = get_section_rule_labels(rules)
+        
+        # Taken before fetching so tasks created while the run is in progress are picked up next time
+        run_time = datetime.now(timezone.utc)
         
-        for task in tasks:
+        for task in iter_tasks(project_ids):
+            total_task_count += 1
             if last_run_time:
-                should_process, reason = should_process_task(task, last_run_time, task_logger, args.fix_sections, rules)
+                should_process, reason = should_process_task(task, last_run_time, task_logger, args.fix_sections, rules, section_rule_labels)
                 if should_process:
                     tasks_to_process.append(task)
                 else:
@@ -2655,32 +3650,41 @@ def main(test_mode=False):
                     summary.skipped(reason)
             else:
                 tasks_to_process.append(task)
+
+        if not total_task_count:
+            log_info("ℹ️  No tasks found in specified projects")
+            return
+
+        # Add dry run header
+        if args.dry_run:
+            log_info("🧪 DRY RUN MODE - No changes will be made to your tasks", "yellow")
+            if not args.dry_run_with_network:
+                log_info("🧪 AI labeling and link titles skipped - previewing rule matches only (use --dry-run-with-network to include it)", "yellow")
+            log_info("=" * 60, "yellow")
         
-        log_info(f"🔍 Found {len(tasks)} total tasks, processing {len(tasks_to_process)} tasks from {len(project_ids)} project(s)...")
+        log_info(f"🔍 Found {total_task_count} total tasks, processing {len(tasks_to_process)} tasks from {len(project_ids)} project(s)...")
         if skipped_count > 0:
             log_info(f"⏭️  Skipped {skipped_count} tasks (already processed or no changes needed)", "yellow")
         
         # Count domains being processed
-        domain_count = {}
+        domain_count = Counter()
         for task in tasks_to_process:
             urls = extract_all_urls(task['content'])
             for url_info in urls:
                 try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(url_info['url']).netloc.lower()
-                    if domain.startswith('www.'):
-                        domain = domain[4:]
-                    domain_count[domain] = domain_count.get(domain, 0) + 1
-                except:
+                    domain_count[_domain_of(url_info['url'])] += 1
+                except ValueError:
                     pass
         
         if domain_count:
-            top_domains = sorted(domain_count.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_domains = domain_count.most_common(5)
             domain_summary = ", ".join([f"{domain}({count})" for domain, count in top_domains])
             log_info(f"🌐 Top domains: {domain_summary}")
         
-        task_logger.info(f"Processing {len(tasks_to_process)}/{len(tasks)} tasks from projects: {[p['name'] for p in all_projects if p['id'] in project_ids]}")
-        task_logger.info(f"Domain breakdown: {domain_count}")
+        if task_logger.isEnabledFor(logging.INFO):
+            task_logger.info("Processing %d/%d tasks from projects: %s", len(tasks_to_process), total_task_count,
+                             [project_name_by_id[pid] for pid in project_ids])
+            task_logger.info("Domain breakdown: %s", dict(domain_count))
 
         # Determine TaskSense mode for this session
         current_mode = None
@@ -2724,9 +3728,9 @@ def main(test_mode=False):
                     # Fetch label mappings for proper filtering
                     label_map = {}
                     try:
-                        response = requests.get(f"{TODOIST_API}/labels", headers=HEADERS)
+                        response = SESSION.get(TODOIST_LABELS_URL, headers=HEADERS)
                         response.raise_for_status()
-                        labels = response.json()
+                        labels = _loads(response)
                         label_map = {label['id']: label['name'] for label in labels}
                         task_logger.info(f"LABEL_MAP: Loaded {len(label_map)} labels for filtering")
                     except Exception as e:
@@ -2754,9 +3758,7 @@ def main(test_mode=False):
                         # Display ranked results
                         for i, ranked_task in enumerate(ranked_tasks, 1):
                             task_data = ranked_task['task']
-                            task_content = task_data.get('content', 'No content')[:60]
-                            if len(task_data.get('content', '')) > 60:
-                                task_content += "..."
+                            task_content = truncate_text(task_data.get('content', 'No content'), 60)
                             
                             # Handle both regular and GPT-enhanced ranking results
                             if (args.gpt_enhanced_ranking or args.gpt_rerank) and 'final_score' in ranked_task:
@@ -2834,11 +3836,14 @@ def main(test_mode=False):
                                 today_section_id = ensure_today_section_exists(project_id, task_sense.ranking_config, task_logger)
                                 
                                 if today_section_id:
+                                    # Clearing, moves, comments and markers all go out in one batched Sync request
+                                    today_buffer = SyncCommandBuffer(task_logger, args.bulk_mode)
+                                    
                                     # Clear Today section if refresh requested
                                     if args.refresh_today:
                                         cleared_count = clear_today_section(
                                             project_id, today_section_id, task_sense.ranking_config,
-                                            task_logger, args.dry_run, args.bulk_mode
+                                            task_logger, args.dry_run, args.bulk_mode, today_buffer
                                         )
                                         if cleared_count > 0:
                                             if args.dry_run:
@@ -2854,14 +3859,21 @@ def main(test_mode=False):
                                     moved_count = move_tasks_to_today_section(
                                         ranked_tasks, project_id, today_section_id, 
                                         task_logger, args.dry_run, args.bulk_mode,
-                                        add_comments, ranking_mode
+                                        add_comments, ranking_mode, today_buffer
                                     )
                                     
                                     # Apply today markers (due date + optional label)
                                     labeled_count = apply_today_markers(
                                         ranked_tasks, task_sense.ranking_config,
-                                        task_logger, args.dry_run, args.bulk_mode
+                                        task_logger, args.dry_run, args.bulk_mode,
+                                        command_buffer=today_buffer
                                     )
+                                    
+                                    if len(today_buffer):
+                                        today_results = today_buffer.flush()
+                                        failed_commands = sum(1 for ok in today_results.values() if not ok)
+                                        if failed_commands:
+                                            log_warning(f"⚠️  {failed_commands} Today list updates failed (see task log)")
                                 else:
                                     log_warning("⚠️  Could not create/find Today section, skipping section management")
                                     task_logger.warning("TODAY_SECTION_UNAVAILABLE: Skipping section and label management")
@@ -2907,6 +3919,13 @@ def main(test_mode=False):
                 task_logger.error("RANKING_ERROR: TaskSense not available")
                 return
 
+        # Queue label updates and section moves so they go out as batched Sync API requests
+        command_buffer = SyncCommandBuffer(task_logger, args.bulk_mode, summary)
+        # Tasks already routed by rule matches, so the universal routing pass can skip them
+        routed_task_ids = set()
+        # Flags read for every task, bound once as locals for the loops below
+        dry_run, verbose, bulk_mode, fix_sections = args.dry_run, args.verbose, args.bulk_mode, args.fix_sections
+        
         # Create labeling pipeline
         if PIPELINE_AVAILABLE:
             pipeline = PipelineFactory.create_from_config(
@@ -2914,31 +3933,36 @@ def main(test_mode=False):
                 gpt_fallback=gpt_fallback,
                 tasksense_config=tasksense_config,
                 cli_args=args,
-                logger=task_logger
+                logger=task_logger,
+                command_buffer=command_buffer
             )
             
             log_info(f"📋 Using LabelingPipeline for task processing")
             
             # Process tasks using pipeline
-            pipeline_results = []
             total_tasks = len(tasks_to_process)
             
-            for i, task in enumerate(tasks_to_process, 1):
+            # Run the pipeline concurrently (I/O-bound); interactive feedback prompts need a single thread
+            max_workers = 1 if pipeline.interactive_feedback else PIPELINE_MAX_WORKERS
+            if verbose and total_tasks > 1:
+                log_info(f"⚡ Running pipeline on {total_tasks} tasks with {min(max_workers, total_tasks)} workers")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pipeline_results = list(executor.map(pipeline.run, tasks_to_process))
+            
+            # Section routing and summary bookkeeping stay on the main thread, in task order
+            log_actions = task_logger.isEnabledFor(logging.INFO)
+            for i, (task, result) in enumerate(zip(tasks_to_process, pipeline_results), 1):
                 # Show progress for bulk processing
                 if total_tasks > 10:
-                    log_info(f"📋 Processing task {i}/{total_tasks}: {task['content'][:40]}{'...' if len(task['content']) > 40 else ''}")
-                elif args.verbose:
-                    log_info(f"📋 Processing: {task['content'][:50]}{'...' if len(task['content']) > 50 else ''}")
-                
-                # Run pipeline
-                result = pipeline.run(task)
-                pipeline_results.append(result)
+                    log_info(f"📋 Processing task {i}/{total_tasks}: {truncate_text(task['content'], 40)}")
+                elif verbose:
+                    log_info(f"📋 Processing: {truncate_text(task['content'], 50)}")
                 
                 # Handle pre-labeled task routing in fix-sections mode
-                if args.fix_sections and not result.labels_applied:
+                if fix_sections and not result.labels_applied:
                     # Task didn't get new labels from pipeline, but might need section routing for existing labels
-                    route_success = route_pre_labeled_task(task, rules, task_logger, args.dry_run, args.bulk_mode)
-                    if route_success and args.verbose:
+                    route_success = route_pre_labeled_task(task, rules, task_logger, dry_run, bulk_mode, command_buffer)
+                    if route_success and verbose:
                         log_success(f"🔄 Routed pre-labeled task to correct section")
                 
                 # Update summary based on pipeline results
@@ -2950,38 +3974,39 @@ def main(test_mode=False):
                         else:
                             summary.labeled()  # Rule-based or GPT label
                     
-                    if args.verbose and not args.dry_run:
+                    if verbose and not dry_run:
                         log_success(f"🏷️  Tagged task with labels: {result.labels_applied}")
                     
-                    # Enhanced logging with TaskSense data
-                    action = "LABELED_DRY_RUN" if args.dry_run else "LABELED"
-                    first_url = result.urls_found[0]['url'] if result.urls_found else None
-                    label_sources = result.get_label_sources()
-                    
-                    # Prepare TaskSense data for logging
-                    tasksense_data = {
-                        'confidence_scores': result.confidence_scores,
-                        'explanations': result.explanations,
-                        'processing_time': result.processing_time,
-                        'mode': current_mode,
-                        'version': 'pipeline_v1.0'
-                    }
-                    
-                    log_task_action(task_logger, task['id'], task['content'], action, 
-                                  labels=result.labels_applied, 
-                                  url=first_url, 
-                                  source=','.join(set(label_sources.values())),
-                                  tasksense_data=tasksense_data)
+                    # Enhanced logging with TaskSense data (skipped if INFO logging is off)
+                    if log_actions:
+                        action = "LABELED_DRY_RUN" if dry_run else "LABELED"
+                        first_url = result.urls_found[0]['url'] if result.urls_found else None
+                        
+                        # Prepare TaskSense data for logging
+                        tasksense_data = {
+                            'confidence_scores': result.confidence_scores,
+                            'explanations': result.explanations,
+                            'processing_time': result.processing_time,
+                            'mode': current_mode,
+                            'version': 'pipeline_v1.0'
+                        }
+                        
+                        log_task_action(task_logger, task['id'], task['content'], action, 
+                                      labels=result.labels_applied, 
+                                      url=first_url, 
+                                      source=result.get_source_summary(),
+                                      tasksense_data=tasksense_data)
                 elif not result.success:
                     # Log failure with TaskSense data
-                    tasksense_data = {
-                        'processing_time': result.processing_time,
-                        'mode': current_mode,
-                        'version': 'pipeline_v1.0'
-                    }
-                    log_task_action(task_logger, task['id'], task['content'], "FAILED",
-                                  error=result.error, tasksense_data=tasksense_data)
-                else:
+                    if log_actions:
+                        tasksense_data = {
+                            'processing_time': result.processing_time,
+                            'mode': current_mode,
+                            'version': 'pipeline_v1.0'
+                        }
+                        log_task_action(task_logger, task['id'], task['content'], "FAILED",
+                                      error=result.error, tasksense_data=tasksense_data)
+                elif log_actions:
                     # Log no labels with TaskSense data
                     tasksense_data = {
                         'confidence_scores': result.confidence_scores,
@@ -2999,99 +4024,13 @@ def main(test_mode=False):
                                       reason="no rules matched and no GPT suggestions", tasksense_data=tasksense_data)
                 
                 # Handle section routing for this task using priority-based selection
-                if result.sections_to_move and not args.dry_run:
-                    # Extract labels from applied rules for priority selection
-                    task_labels = set()
-                    for rule_info in result.applied_rules:
-                        if rule_info.get('label'):
-                            task_labels.add(rule_info['label'])
-                    
-                    project_id = task.get('project_id')
-                    if project_id and task_labels:
-                        # Use priority-based section selection
-                        selected_section = select_priority_section(task_labels, rules, project_id, task_logger)
-                        
-                        if selected_section:
-                            section_name = selected_section['section_name']
-                            
-                            # Get or create section
-                            section_id = None
-                            if selected_section['create_if_missing']:
-                                section_id = create_section_if_missing_sync(section_name, project_id, task_logger)
-                            else:
-                                sections = get_project_sections(project_id, task_logger)
-                                section_id = sections.get(section_name)
-                            
-                            # Move task to section
-                            if section_id:
-                                # Check if task is already in target section to avoid duplicate moves
-                                current_section = task.get('section_id')
-                                if current_section == section_id:
-                                    if task_logger:
-                                        task_logger.info(f"SECTION_SKIP: Task {task['id']} already in target section {section_name} | Content: {task['content'][:60]}...")
-                                    if args.verbose:
-                                        log_info(f"⚠️  Task already in correct section: {section_name}")
-                                else:
-                                    # Check if task is in Today section - if so, don't move it
-                                    sections = get_project_sections(project_id, task_logger)
-                                    today_section_id = sections.get('Today')
-                                    if today_section_id and current_section == today_section_id:
-                                        if task_logger:
-                                            task_logger.info(f"TODAY_SECTION_PROTECTED: Task {task['id']} is in Today section, skipping move to {section_name}")
-                                        log_task_action(task_logger, task['id'], task['content'], "TODAY_SECTION_PROTECTED",
-                                                      section=section_name, note="Task in Today section, move skipped")
-                                    else:
-                                        move_success = move_task_to_section(task['id'], section_id, task_logger, task['content'], args.bulk_mode)
-                                        if move_success:
-                                            if args.verbose:
-                                                log_success(f"📁 Moved task to section: {section_name}")
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVED_TO_SECTION",
-                                                          section=section_name, priority=selected_section['priority'], 
-                                                          rule_source=selected_section['label'])
-                                        else:
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVE_FAILED",
-                                                          error=f"Failed to move to section: {section_name}")
-                            else:
-                                log_task_action(task_logger, task['id'], task['content'], "SECTION_NOT_FOUND",
-                                              error=f"Section '{section_name}' not found or could not be created")
-                        else:
-                            log_task_action(task_logger, task['id'], task['content'], "NO_VIABLE_SECTION",
-                                          error="No viable section found from candidates")
-                    else:
-                        log_task_action(task_logger, task['id'], task['content'], "NO_PROJECT_ID",
-                                      error="Cannot move task without project_id")
-                elif result.sections_to_move and args.dry_run:
-                    # Use priority-based section selection for dry run preview
-                    task_labels = set()
-                    for rule_info in result.applied_rules:
-                        if rule_info.get('label'):
-                            task_labels.add(rule_info['label'])
-                    
-                    project_id = task.get('project_id')
-                    if project_id and task_labels:
-                        selected_section = select_priority_section(task_labels, rules, project_id, task_logger)
-                        
-                        if selected_section:
-                            section_name = selected_section['section_name']
-                            if args.verbose:
-                                log_info(f"📂 Would move task to section: {section_name} (priority: {selected_section['priority']})", "cyan")
-                            log_task_action(task_logger, task['id'], task['content'], "WOULD_MOVE_TO_SECTION",
-                                          section=section_name, priority=selected_section['priority'], 
-                                          rule_source=selected_section['label'])
-                        else:
-                            log_task_action(task_logger, task['id'], task['content'], "NO_VIABLE_SECTION",
-                                          error="No viable section found from candidates")
-                    else:
-                        # Fallback to old behavior if no labels
-                        section_info = result.sections_to_move[0]
-                        section_name = section_info['section_name']
-                        if args.verbose:
-                            log_info(f"📂 Would move task to section: {section_name}", "cyan")
-                        log_task_action(task_logger, task['id'], task['content'], "WOULD_MOVE_TO_SECTION",
-                                      section=section_name, rule_source=section_info['rule_source'])
+                if result.sections_to_move:
+                    if route_task_by_rule_sections(task, result.applied_rule_labels, rules, result.sections_to_move,
+                                                   task_logger, dry_run, bulk_mode, verbose, command_buffer):
+                        routed_task_ids.add(task['id'])
             
             # Show pipeline statistics
-            if args.verbose:
+            if verbose:
                 stats = pipeline.get_statistics()
                 log_info(f"📊 Pipeline stats: {stats['tasks_processed']} tasks, {stats['labels_applied']} labels applied")
                 if stats['tasksense_used'] > 0:
@@ -3101,39 +4040,74 @@ def main(test_mode=False):
             
             # Universal section routing: Ensure ALL tasks with existing labels are properly routed
             # This catches tasks that already had labels but weren't processed for section routing
-            if args.verbose:
-                log_info(f"🔄 Running universal section routing check on {len(tasks_to_process)} tasks")
+            if verbose:
+                log_info(f"🔄 Running universal section routing check on {len(tasks_to_process) - len(routed_task_ids)} tasks")
             
             for task in tasks_to_process:
-                existing_labels = set(task.get('labels', []))
-                current_section_id = task.get('section_id')
-                
-                # Only route backlog tasks (no section assigned) with labels
-                if existing_labels and current_section_id is None:
+                # Only route backlog tasks (no section assigned) with labels that the loop above did not route
+                if task.get('labels') and get_current_section_id(task) is None and task['id'] not in routed_task_ids:
                     # Route any backlog task with existing labels to ensure proper section placement
-                    route_task_to_section(task, rules, task_logger, args.dry_run, args.bulk_mode, context="UNIVERSAL")
+                    route_task_to_section(task, rules, task_logger, dry_run, bulk_mode, context="UNIVERSAL", command_buffer=command_buffer)
         else:
             # Fallback to original processing if pipeline not available
             log_warning("⚠️ LabelingPipeline not available, using legacy processing")
             
-            for task in tasks_to_process:
-                if args.verbose:
-                    log_info(f"📋 Processing: {task['content'][:50]}{'...' if len(task['content']) > 50 else ''}")
+            # Dry runs preview rule matches only, unless network calls were explicitly requested
+            skip_network = dry_run and not args.dry_run_with_network
+            labeling_gpt_fallback = None if skip_network else gpt_fallback
+            
+            # Fetch every link title up front in one concurrent burst instead of one GET at a time
+            all_urls = {url_info['url'] for task in tasks_to_process for url_info in extract_all_urls(task['content'])}
+            if all_urls and not skip_network:
+                if verbose:
+                    log_info(f"🔗 Prefetching titles for {len(all_urls)} URLs")
+                prefetch_page_titles(all_urls)
+            
+            # Apply rule-based labeling to ALL tasks up front
+            labeling_results = [apply_rules_to_task(task, rules, task_logger=task_logger) for task in tasks_to_process]
+            
+            # Only tasks no rule matched need the AI fallback
+            if labeling_gpt_fallback and labeling_gpt_fallback.get('enabled'):
+                unmatched = [i for i, (rule_labels, _) in enumerate(labeling_results) if not rule_labels]
+                
+                # Label them with batched TaskSense requests first
+                tasksense_results = None
+                if TASKSENSE_AVAILABLE and unmatched:
+                    tasksense_results = prelabel_with_tasksense((tasks_to_process[i]['content'] for i in unmatched),
+                                                                tasksense_config, current_mode, task_logger)
+                
+                # Any remaining fallback call is one network round-trip per task, so those run concurrently
+                def label_task(i):
+                    return apply_ai_fallback(tasks_to_process[i], labeling_gpt_fallback, task_logger, current_mode,
+                                             tasksense_config, tasksense_results)
+                
+                if len(unmatched) > 1:
+                    gpt_workers = _worker_count(labeling_gpt_fallback.get('concurrency'), GPT_MAX_WORKERS, "gpt_fallback concurrency")
+                    with ThreadPoolExecutor(max_workers=min(gpt_workers, len(unmatched))) as executor:
+                        fallback_results = list(executor.map(label_task, unmatched))
+                else:
+                    fallback_results = [label_task(i) for i in unmatched]
+                
+                for i, result in zip(unmatched, fallback_results):
+                    labeling_results[i] = result
+            
+            for task, (rule_labels, applied_rules) in zip(tasks_to_process, labeling_results):
+                if verbose:
+                    log_info(f"📋 Processing: {truncate_text(task['content'], 50)}")
                 
                 content = task['content']
                 
-                # Apply rule-based labeling with GPT fallback to ALL tasks
-                rule_labels, applied_rules = apply_rules_to_task(task, rules, gpt_fallback, task_logger, current_mode, tasksense_config)
+                # Every applied rule contributes its label, so this is the label set for labeling and routing
+                applied_label_set = frozenset(rule_labels)
                 
                 # Check if task contains any links for URL processing
-                has_any_link = re.search(r'https?://\S+', content)
+                urls = extract_all_urls(content)
+                has_any_link = bool(urls)
                 
                 # Collect domain labels from URLs (if any)
                 domain_labels = set()
                 if has_any_link:
-                    urls = extract_all_urls(content)
-                    
-                    if args.verbose:
+                    if verbose:
                         url_count = len(urls)
                         log_info(f"🔗 Found {url_count} URL{'s' if url_count != 1 else ''} in task")
                     
@@ -3143,21 +4117,22 @@ def main(test_mode=False):
                             domain_labels.add(domain_label)
                 
                 # Combine all labels (rule-based/GPT + domain-specific)
-                all_labels = set(rule_labels) | domain_labels
+                all_labels = applied_label_set | domain_labels
                 
                 # Apply labels if we have any
                 if all_labels:
-                    existing_labels = task.get("labels", [])
-                    new_labels = [label for label in all_labels if label not in existing_labels]
+                    # One C-level set difference; the set also serves the membership checks below
+                    new_label_set = all_labels.difference(task.get("labels", []))
+                    new_labels = list(new_label_set)
                     
                     # Handle label creation for rules that require it
-                    for rule_info in applied_rules:
-                        if rule_info.get('create_if_missing', False) and rule_info['label'] in new_labels:
-                            if not args.dry_run:
-                                create_label_if_missing(rule_info['label'], task_logger)
+                    if not dry_run:
+                        ensure_labels_exist((rule_info['label'] for rule_info in applied_rules
+                                             if rule_info.get('create_if_missing', False) and rule_info['label'] in new_label_set),
+                                            task_logger)
                     
                     if new_labels:
-                        success = update_task(task, None, None, new_labels, summary, args.dry_run)
+                        success = update_task(task, None, None, new_labels, summary, dry_run, command_buffer=command_buffer)
                         if success:
                             # Track labels for summary
                             for label in new_labels:
@@ -3166,15 +4141,15 @@ def main(test_mode=False):
                                 else:
                                     summary.labeled()  # Rule-based or GPT label
                             
-                            if args.verbose and not args.dry_run:
+                            if verbose and not dry_run:
                                 log_success(f"🏷️  Tagged task with labels: {new_labels}")
                             
                             # Log the labeling action
-                            action = "LABELED_DRY_RUN" if args.dry_run else "LABELED"
-                            first_url = urls[0]['url'] if has_any_link and 'urls' in locals() else None
-                            label_sources = [rule['source'] for rule in applied_rules if rule['label'] in new_labels]
+                            action = "LABELED_DRY_RUN" if dry_run else "LABELED"
+                            first_url = urls[0]['url'] if urls else None
+                            label_sources = {rule['source'] for rule in applied_rules if rule['label'] in new_label_set}
                             log_task_action(task_logger, task['id'], task['content'], action, 
-                                          labels=new_labels, url=first_url, source=','.join(set(label_sources)))
+                                          labels=new_labels, url=first_url, source=','.join(label_sources))
                         else:
                             log_task_action(task_logger, task['id'], task['content'], "FAILED",
                                           error="Failed to apply labels")
@@ -3198,143 +4173,15 @@ def main(test_mode=False):
                         })
                 
                 # Move to section if specified in rules using priority-based selection
-                if sections_to_move and not args.dry_run:
-                    # Extract labels from applied rules for priority selection
-                    task_labels = set()
-                    for rule_info in applied_rules:
-                        if rule_info.get('label'):
-                            task_labels.add(rule_info['label'])
-                    
-                    project_id = task.get('project_id')
-                    if project_id and task_labels:
-                        # Use priority-based section selection
-                        selected_section = select_priority_section(task_labels, rules, project_id, task_logger)
-                        
-                        if selected_section:
-                            section_name = selected_section['section_name']
-                            
-                            # Get or create section
-                            section_id = None
-                            if selected_section['create_if_missing']:
-                                section_id = create_section_if_missing_sync(section_name, project_id, task_logger)
-                            else:
-                                sections = get_project_sections(project_id, task_logger)
-                                section_id = sections.get(section_name)
-                            
-                            # Move task to section
-                            if section_id:
-                                # Check if task is already in target section to avoid duplicate moves
-                                current_section = task.get('section_id')
-                                if current_section == section_id:
-                                    if task_logger:
-                                        task_logger.info(f"SECTION_SKIP: Task {task['id']} already in target section {section_name} | Content: {task['content'][:60]}...")
-                                    if args.verbose:
-                                        log_info(f"⚠️  Task already in correct section: {section_name}")
-                                else:
-                                    # Check if task is in Today section - if so, don't move it
-                                    sections = get_project_sections(project_id, task_logger)
-                                    today_section_id = sections.get('Today')
-                                    if today_section_id and current_section == today_section_id:
-                                        if task_logger:
-                                            task_logger.info(f"TODAY_SECTION_PROTECTED: Task {task['id']} is in Today section, skipping move to {section_name}")
-                                        log_task_action(task_logger, task['id'], task['content'], "TODAY_SECTION_PROTECTED",
-                                                      section=section_name, note="Task in Today section, move skipped")
-                                    else:
-                                        move_success = move_task_to_section(task['id'], section_id, task_logger, task['content'], args.bulk_mode)
-                                        if move_success:
-                                            if args.verbose:
-                                                log_success(f"📂 Moved task to section: {section_name}")
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVED_TO_SECTION",
-                                                          section=section_name, priority=selected_section['priority'], 
-                                                          rule_source=selected_section['label'])
-                                        else:
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVE_FAILED",
-                                                          error=f"Failed to move to section: {section_name}")
-                            else:
-                                log_task_action(task_logger, task['id'], task['content'], "SECTION_NOT_FOUND",
-                                              error=f"Section '{section_name}' not found or could not be created")
-                        else:
-                            log_task_action(task_logger, task['id'], task['content'], "NO_VIABLE_SECTION",
-                                          error="No viable section found from candidates")
-                    else:
-                        # Fallback to old behavior if no labels
-                        section_info = sections_to_move[0]
-                        section_name = section_info['section_name']
-                        
-                        if project_id:
-                            # Get or create section
-                            section_id = None
-                            if section_info['create_if_missing']:
-                                section_id = create_section_if_missing_sync(section_name, project_id, task_logger)
-                            else:
-                                sections = get_project_sections(project_id, task_logger)
-                                section_id = sections.get(section_name)
-                            
-                            # Move task to section
-                            if section_id:
-                                # Check if task is already in target section to avoid duplicate moves
-                                current_section = task.get('section_id')
-                                if current_section == section_id:
-                                    if task_logger:
-                                        task_logger.info(f"SECTION_SKIP: Task {task['id']} already in target section {section_name} | Content: {task['content'][:60]}...")
-                                    if args.verbose:
-                                        log_info(f"⚠️  Task already in correct section: {section_name}")
-                                else:
-                                    # Check if task is in Today section - if so, don't move it
-                                    sections = get_project_sections(project_id, task_logger)
-                                    today_section_id = sections.get('Today')
-                                    if today_section_id and current_section == today_section_id:
-                                        if task_logger:
-                                            task_logger.info(f"TODAY_SECTION_PROTECTED: Task {task['id']} is in Today section, skipping move to {section_name}")
-                                        log_task_action(task_logger, task['id'], task['content'], "TODAY_SECTION_PROTECTED",
-                                                      section=section_name, note="Task in Today section, move skipped")
-                                    else:
-                                        move_success = move_task_to_section(task['id'], section_id, task_logger, task['content'], args.bulk_mode)
-                                        if move_success:
-                                            if args.verbose:
-                                                log_success(f"📂 Moved task to section: {section_name}")
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVED_TO_SECTION",
-                                                          section=section_name, rule_source=section_info['rule_source'])
-                                        else:
-                                            log_task_action(task_logger, task['id'], task['content'], "MOVE_FAILED",
-                                                          error=f"Failed to move to section {section_name}")
-                            else:
-                                log_task_action(task_logger, task['id'], task['content'], "SECTION_NOT_FOUND",
-                                              reason=f"Section '{section_name}' not found and create_if_missing=False")
-                        else:
-                            log_task_action(task_logger, task['id'], task['content'], "NO_PROJECT_ID",
-                                          reason="Cannot move to section without project_id")
-                elif sections_to_move and args.dry_run:
-                    # Use priority-based section selection for dry run preview in legacy mode
-                    task_labels = set()
-                    for rule_info in applied_rules:
-                        if rule_info.get('label'):
-                            task_labels.add(rule_info['label'])
-                    
-                    project_id = task.get('project_id')
-                    if project_id and task_labels:
-                        selected_section = select_priority_section(task_labels, rules, project_id, task_logger)
-                        
-                        if selected_section:
-                            section_name = selected_section['section_name']
-                            log_info(f"📂 Would move task to section: {section_name} (priority: {selected_section['priority']})", "cyan")
-                            log_task_action(task_logger, task['id'], task['content'], "WOULD_MOVE_TO_SECTION",
-                                          section=section_name, priority=selected_section['priority'], 
-                                          rule_source=selected_section['label'])
-                        else:
-                            log_task_action(task_logger, task['id'], task['content'], "NO_VIABLE_SECTION",
-                                          error="No viable section found from candidates")
-                    else:
-                        # Fallback to old behavior if no labels
-                        section_name = sections_to_move[0]['section_name']
-                        log_info(f"📂 Would move task to section: {section_name}", "cyan")
-                        log_task_action(task_logger, task['id'], task['content'], "WOULD_MOVE_TO_SECTION",
-                                      section=section_name, rule_source=sections_to_move[0]['rule_source'])
+                if sections_to_move:
+                    if route_task_by_rule_sections(task, applied_label_set, rules, sections_to_move, task_logger,
+                                                   dry_run, bulk_mode, verbose or dry_run, command_buffer):
+                        routed_task_ids.add(task['id'])
 
             # Separate URL processing for link formatting (independent of labeling)
-            if has_any_link:
+            if has_any_link and not skip_network:
                 # Process multiple links and update content with titles
-                if args.verbose:
+                if verbose:
                     log_info(f"🌐 Processing {len(urls)} URL{'s' if len(urls) != 1 else ''} for titles...")
                 
                 updated_content, content_labels = process_multiple_links(content, task_logger, task['id'])
@@ -3342,20 +4189,20 @@ def main(test_mode=False):
                 # Check if content was actually updated with new titles
                 if updated_content != content:
                     # Content was updated with new titles
-                    success = update_task(task, None, None, content_labels, summary, args.dry_run, new_content=updated_content)
+                    success = update_task(task, None, None, content_labels, summary, dry_run, new_content=updated_content, command_buffer=command_buffer)
                     if success:
                         summary.updated()
                         
                         # Count URLs that got titles
                         urls_with_titles = len(urls)
                         
-                        if not args.dry_run:
+                        if not dry_run:
                             log_success(f"✅ Updated task with {urls_with_titles} titled link{'s' if urls_with_titles != 1 else ''}")
                         else:
                             log_info(f"📋 Would update task with {urls_with_titles} titled link{'s' if urls_with_titles != 1 else ''}", "cyan")
                         
                         # Log the update action
-                        action = "MULTI_LINK_UPDATE_DRY_RUN" if args.dry_run else "MULTI_LINK_UPDATE"
+                        action = "MULTI_LINK_UPDATE_DRY_RUN" if dry_run else "MULTI_LINK_UPDATE"
                         log_task_action(task_logger, task['id'], task['content'], action,
                                       title=f"Updated {len(urls)} URLs with titles", 
                                       labels=content_labels, url=f"{len(urls)} URLs processed")
@@ -3365,11 +4212,11 @@ def main(test_mode=False):
                                       error="API error during multi-link update")
                 else:
                     # Content didn't change - check if it already has valid titles
-                    existing_markdown_links = len([u for u in urls if u['type'] == 'markdown'])
+                    existing_markdown_links = sum(1 for u in urls if u['type'] == 'markdown')
                     if existing_markdown_links > 0:
                         # Task already has properly formatted markdown links
                         summary.skipped("already has titled links")
-                        if args.verbose:
+                        if verbose:
                             log_info(f"✅ Task already has {existing_markdown_links} properly titled link{'s' if existing_markdown_links != 1 else ''}")
                         
                         log_task_action(task_logger, task['id'], task['content'], "ALREADY_TITLED",
@@ -3377,7 +4224,7 @@ def main(test_mode=False):
                     else:
                         # No titles could be fetched for plain URLs
                         summary.skipped("no valid titles")
-                        if args.verbose:
+                        if verbose:
                             log_warning(f"⚠️  Skipped: Could not fetch valid titles for any URLs")
                         
                         # Log skipped task
@@ -3386,37 +4233,52 @@ def main(test_mode=False):
                                       url=first_url, reason="no valid titles found")
                 
                 # Handle pre-labeled task routing in fix-sections mode (legacy processing)
-                if args.fix_sections and not rule_labels:
+                if fix_sections and not rule_labels:
                     # Task didn't get new labels from rules, but might need section routing for existing labels
-                    route_success = route_pre_labeled_task(task, rules, task_logger, args.dry_run, args.bulk_mode)
-                    if route_success and args.verbose:
+                    route_success = route_pre_labeled_task(task, rules, task_logger, dry_run, bulk_mode, command_buffer)
+                    if route_success and verbose:
                         log_success(f"🔄 Routed pre-labeled task to correct section")
             
             # Universal section routing for legacy processing: Ensure ALL tasks with existing labels are properly routed
             # This catches any labeled tasks that weren't processed in the main loop
-            if args.verbose:
-                log_info(f"🔄 Running universal section routing check on {len(tasks_to_process)} tasks (legacy mode)")
+            if verbose:
+                log_info(f"🔄 Running universal section routing check on {len(tasks_to_process) - len(routed_task_ids)} tasks (legacy mode)")
             
             for task in tasks_to_process:
-                existing_labels = set(task.get('labels', []))
-                current_section_id = task.get('section_id')
-                
-                # Only route backlog tasks (no section assigned) with labels
-                if existing_labels and current_section_id is None:
+                # Only route backlog tasks (no section assigned) with labels that the loop above did not route
+                if task.get('labels') and get_current_section_id(task) is None and task['id'] not in routed_task_ids:
                     # Route any backlog task with existing labels to ensure proper section placement
-                    route_task_to_section(task, rules, task_logger, args.dry_run, args.bulk_mode, context="UNIVERSAL_LEGACY")
+                    route_task_to_section(task, rules, task_logger, dry_run, bulk_mode, context="UNIVERSAL_LEGACY", command_buffer=command_buffer)
 
-        # Save timestamp for next incremental run (only if not dry run and not test mode)
+        # Send all queued label updates and section moves
+        failed_updates = 0
+        if len(command_buffer):
+            if args.verbose:
+                log_info(f"📤 Sending {len(command_buffer)} queued Todoist updates")
+            failed_updates = sum(1 for ok in command_buffer.flush().values() if not ok)
+        
+        # Save timestamp for next incremental run (only if not dry run and not test mode).
+        # If any update was rejected, keep the old timestamp so those tasks are retried.
         if not args.dry_run and not test_mode and not force_full_scan:
-            save_last_run_timestamp()
-            task_logger.info("Saved timestamp for next incremental run")
+            if failed_updates:
+                log_warning(f"{failed_updates} Todoist update(s) failed; keeping the previous run timestamp so they are retried")
+                task_logger.warning("TIMESTAMP_NOT_SAVED: %d queued updates failed", failed_updates)
+            else:
+                save_last_run_timestamp(run_time)
+                task_logger.info("Saved timestamp for next incremental run")
         
         # Log session end with summary
         task_logger.info(f"=== SESSION END | Updated: {summary.tasks_updated} | Labeled: {summary.tasks_labeled} | Skipped: {summary.tasks_skipped} | Failed: {summary.tasks_failed} ===")
+        for handler in task_logger.handlers:
+            handler.flush()
         
         # Print final summary
         summary.print_summary(args.dry_run)
 
 if __name__ == "__main__":
     test_mode = "--test" in sys.argv
-    main(test_mode=test_mode)
\ No newline at end of file
+    try:
+        main(test_mode=test_mode)
+    finally:
+        # Persist titles fetched during this run, even if it returned early or failed
+        TITLE_CACHE.close()
\ No newline at end of file
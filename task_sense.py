@@ -7,10 +7,18 @@ user profile awareness, mode-based prompting, and structured output.
 
 import os
 import json
+import hashlib
+import heapq
 import logging
-from datetime import datetime
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Union, Any
 import requests
+from requests.adapters import HTTPAdapter
 
 # Import OpenAI with fallback handling (matching main.py pattern)
 try:
@@ -19,6 +27,20 @@ try:
 except Exception:
     OPENAI_AVAILABLE = False
 
+# orjson import - faster config parsing, fallback to json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyahocorasick import - single-pass mock keyword matching, fallback to per-keyword scans
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # Import task_sense_prompts for mode-aware prompting
 try:
     from task_sense_prompts import TaskSensePrompts
@@ -26,6 +48,57 @@ try:
 except ImportError:
     PROMPTS_AVAILABLE = False
 
+# Fields of a plain-text GPT ranking response, parsed when the reply isn't valid JSON
+RANKING_EXPLANATION_RE = re.compile(r'EXPLANATION:\s*(.+?)(?=CONFIDENCE:|RERANK_SCORE:|$)', re.DOTALL)
+RANKING_CONFIDENCE_RE = re.compile(r'CONFIDENCE:\s*([0-9]*\.?[0-9]+)')
+RANKING_SCORE_RE = re.compile(r'RERANK_SCORE:\s*([0-9]*\.?[0-9]+)')
+
+# Confidence phrasings in a plain-text GPT labeling response, like "confidence: 0.8" or "0.85 confidence"
+CONFIDENCE_PATTERNS = (
+    re.compile(r'confidence:\s*([0-9]\.[0-9]+)'),
+    re.compile(r'([0-9]\.[0-9]+)\s*confidence'),
+    re.compile(r'confidence\s*([0-9]\.[0-9]+)'),
+)
+
+# Mock mode heuristics without a configured response, checked in order: (keywords, label, explanation)
+MOCK_HEURISTICS = (
+    (('clean', 'organize', 'house', 'home', 'garage'), 'home', "Task involves home maintenance and organization"),
+    (('work', 'meeting', 'project', 'deadline'), 'work', "Task is work-related and involves professional activities"),
+    (('doctor', 'appointment', 'pay', 'tax', 'bill'), 'admin', "Task involves administrative or financial responsibilities"),
+    (('urgent', '!', 'asap', 'immediately'), 'urgent', "Task has urgent priority indicators"),
+)
+
+# All mock keywords in one automaton (keyword -> heuristic index), so a task is scanned once
+MOCK_AUTOMATON = None
+if HAS_AHOCORASICK:
+    MOCK_AUTOMATON = ahocorasick.Automaton()
+    for _index, (_keywords, _, _) in enumerate(MOCK_HEURISTICS):
+        for _keyword in _keywords:
+            if _keyword not in MOCK_AUTOMATON:
+                MOCK_AUTOMATON.add_word(_keyword, _index)
+    MOCK_AUTOMATON.make_automaton()
+
+# GPT label results are reused for identical tasks for this long; the file sits beside
+# task_sense.py unless LABEL_CACHE_PATH points elsewhere
+LABEL_CACHE_TTL = timedelta(days=7)
+LABEL_CACHE_FILE = os.getenv('LABEL_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'label_cache.db'))
+
+# GPT ranking results are keyed on the base score, whose due date and age parts move daily,
+# so older entries can no longer be hit and are dropped when the cache is saved
+RANKING_CACHE_TTL = timedelta(days=1)
+
+# Direct HTTP fallback for chat completions; one pooled keep-alive session shared by batch threads
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_SESSION = requests.Session()
+OPENAI_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+
+def _read_json_config(path: str) -> Dict[str, Any]:
+    """Read and parse a JSON config file, with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
 
 class TaskSense:
     """
@@ -35,13 +108,16 @@ class TaskSense:
     configurable reasoning levels with structured output.
     """
     
-    def __init__(self, config_path: str = "task_sense_config.json", ranking_config_path: str = "ranking_config.json"):
+    def __init__(self, config_path: str = "task_sense_config.json", ranking_config_path: str = "ranking_config.json",
+                 ranking_cache_path: str = "ranking_cache.json", label_cache_path: Optional[str] = LABEL_CACHE_FILE):
         """
         Initialize TaskSense engine with configuration.
         
         Args:
             config_path: Path to TaskSense configuration file
             ranking_config_path: Path to ranking configuration file
+            ranking_cache_path: Path to the persisted GPT ranking result cache
+            label_cache_path: Path to the persisted GPT label result cache (None disables it)
         """
         # Initialize logger first
         self.logger = logging.getLogger('task_sense')
@@ -61,6 +137,15 @@ class TaskSense:
         self.ranking_config = self._load_ranking_config(ranking_config_path)
         self.prompts = TaskSensePrompts() if PROMPTS_AVAILABLE else None
         
+        # GPT ranking results, loaded lazily on first GPT-enhanced ranking
+        self.ranking_cache_path = ranking_cache_path
+        self._ranking_cache = None
+        
+        # GPT label results, opened lazily on the first result written (shared by batch threads)
+        self.label_cache_path = label_cache_path
+        self._label_cache = None
+        self._label_cache_lock = threading.Lock()
+        
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load TaskSense configuration from JSON file."""
         # Handle None config_path (fallback to default config)
@@ -70,9 +155,7 @@ class TaskSense:
             return self._get_default_config()
             
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            return config
+            return _read_json_config(config_path)
         except FileNotFoundError:
             # Return default configuration if file doesn't exist
             return {
@@ -110,8 +193,7 @@ class TaskSense:
             return self._get_default_ranking_config()
             
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _read_json_config(config_path)
             if self.logger:
                 self.logger.info(f"Loaded ranking config from {config_path}")
             return config
@@ -211,13 +293,164 @@ class TaskSense:
         if os.environ.get('GPT_MOCK_MODE') or self.config.get("mock_mode", {}).get("enabled", False):
             return self._get_mock_response(task_content, available_labels, mode)
         
+        # Reuse the answer from an earlier run for an unchanged task
+        cache_key = self._label_cache_key(task_content, available_labels, mode)
+        cached_result = self._get_cached_label(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
         # Attempt GPT labeling
         try:
-            return self._get_gpt_labels(task_content, available_labels, mode)
+            result = self._get_gpt_labels(task_content, available_labels, mode)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"TaskSense GPT error: {e}")
             return self._get_fallback_response(task_content, available_labels, mode, str(e))
+        
+        if result.get('labels'):
+            self._cache_label(cache_key, result)
+        return result
+    
+    def label_batch(self,
+                    task_contents: List[str],
+                    available_labels: Optional[List[str]] = None,
+                    dry_run: bool = False,
+                    mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Label several tasks, sending up to `batch_size` tasks per GPT request.
+        
+        The user profile and label list are sent once per batch instead of once per
+        task. Tasks missing from a batch reply are labeled individually with label().
+        
+        Args:
+            task_contents: Task contents to label
+            available_labels: List of available labels (uses config default if None)
+            dry_run: If True, return mock responses without API calls
+            mode: Work mode (personal, work, weekend, etc.)
+            
+        Returns:
+            One label() style result per task, in the same order
+        """
+        if available_labels is None:
+            available_labels = self.config.get("available_labels", ["work", "personal"])
+        if mode is None:
+            mode = self.config.get("default_mode", "personal")
+        
+        # Dry runs and mock mode don't call the API, so there is nothing to batch
+        if dry_run or os.environ.get('GPT_MOCK_MODE') or self.config.get("mock_mode", {}).get("enabled", False):
+            return [self.label(content, available_labels, dry_run, mode) for content in task_contents]
+        
+        # Only tasks without a cached answer go to GPT
+        results = [self._get_cached_label(self._label_cache_key(content, available_labels, mode)) for content in task_contents]
+        uncached = [content for content, result in zip(task_contents, results) if result is None]
+        
+        batch_size = max(1, self.config.get("batch_size", 10))
+        chunks = [uncached[start:start + batch_size] for start in range(0, len(uncached), batch_size)]
+        
+        # Each batch is one network round-trip, so send up to max_concurrency at once
+        max_concurrency = max(1, self.config.get("max_concurrency", 4))
+        if len(chunks) > 1 and max_concurrency > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as executor:
+                chunk_results = list(executor.map(lambda chunk: self._label_chunk(chunk, available_labels, mode), chunks))
+        else:
+            chunk_results = [self._label_chunk(chunk, available_labels, mode) for chunk in chunks]
+        
+        labeled = iter([result for chunk_result in chunk_results for result in chunk_result])
+        return [result if result is not None else next(labeled) for result in results]
+    
+    def _label_chunk(self, task_contents: List[str], available_labels: List[str], mode: str) -> List[Dict[str, Any]]:
+        """Label one batch of tasks with a single GPT request."""
+        if len(task_contents) == 1:
+            return [self.label(task_contents[0], available_labels, mode=mode)]
+        
+        parsed = {}
+        try:
+            if not os.environ.get('OPENAI_API_KEY'):
+                raise Exception("OPENAI_API_KEY not set")
+            
+            user_profile = self.config.get("user_profile", "")
+            full_prompt = self._construct_batch_prompt(self._get_base_prompt(mode), user_profile, task_contents, available_labels)
+            # Room for a short JSON entry per task
+            response_data = self._call_openai_api(full_prompt, max_tokens=50 + 60 * len(task_contents))
+            if response_data:
+                parsed = self._parse_gpt_batch_response(response_data, len(task_contents), available_labels, mode)
+                for i, result in parsed.items():
+                    if result['labels']:
+                        self._cache_label(self._label_cache_key(task_contents[i], available_labels, mode), result)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"TaskSense batch GPT error: {e}, labeling {len(task_contents)} tasks individually")
+        
+        return [parsed[i] if i in parsed else self.label(content, available_labels, mode=mode)
+                for i, content in enumerate(task_contents)]
+    
+    def _label_cache_key(self, task_content: str, available_labels: List[str], mode: str) -> str:
+        """
+        Build the GPT label cache key for a task.
+        
+        The key covers everything the labeling prompt and model are chosen from, so
+        changing the model, prompt version, profile or label list invalidates it.
+        """
+        key_parts = "|".join([
+            task_content,
+            mode,
+            ",".join(sorted(available_labels)),
+            self.config.get("model", "gpt-3.5-turbo"),
+            self.config.get("prompt_version", "v1.0"),
+            self.config.get("reasoning_level", "light"),
+            self.config.get("user_profile", "")
+        ])
+        return hashlib.blake2b(key_parts.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _label_cache_enabled(self) -> bool:
+        """Whether GPT label results are read from and written to the label cache"""
+        return self.label_cache_path is not None and self.config.get("label_cache_enabled", True)
+    
+    def _connect_label_cache(self) -> sqlite3.Connection:
+        """Open the label cache database (once per instance); call with the lock held"""
+        if self._label_cache is None:
+            self._label_cache = sqlite3.connect(self.label_cache_path, check_same_thread=False)
+            self._label_cache.execute('CREATE TABLE IF NOT EXISTS labels (key TEXT PRIMARY KEY, result TEXT, labeled_at REAL)')
+        return self._label_cache
+    
+    def _get_cached_label(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached GPT label result if it is younger than LABEL_CACHE_TTL, else None"""
+        if not self._label_cache_enabled():
+            return None
+        # Nothing has been cached yet; don't create the database just to look something up
+        if self._label_cache is None and not os.path.exists(self.label_cache_path):
+            return None
+        min_labeled_at = time.time() - LABEL_CACHE_TTL.total_seconds()
+        try:
+            with self._label_cache_lock:
+                row = self._connect_label_cache().execute(
+                    'SELECT result FROM labels WHERE key = ? AND labeled_at > ?', (cache_key, min_labeled_at)).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            if self.logger:
+                self.logger.warning(f"TASKSENSE_CACHE_ERROR: Could not read {self.label_cache_path}: {e}")
+            return None
+    
+    def _cache_label(self, cache_key: str, result: Dict[str, Any]):
+        """Persist a GPT label result"""
+        if not self._label_cache_enabled():
+            return
+        try:
+            with self._label_cache_lock:
+                conn = self._connect_label_cache()
+                conn.execute('INSERT OR REPLACE INTO labels (key, result, labeled_at) VALUES (?, ?, ?)',
+                             (cache_key, json.dumps(result), time.time()))
+                conn.commit()
+        except sqlite3.Error as e:
+            if self.logger:
+                self.logger.warning(f"TASKSENSE_CACHE_ERROR: Could not write {self.label_cache_path}: {e}")
+    
+    def _get_base_prompt(self, mode: str) -> str:
+        """Get the mode prompt from the template system, or the built-in fallback."""
+        if self.prompts:
+            reasoning_level = self.config.get("reasoning_level", "light")
+            return self.prompts.get_prompt(mode, reasoning_level)
+        return self._get_fallback_prompt(mode)
     
     def _get_gpt_labels(self, task_content: str, available_labels: List[str], mode: str) -> Dict[str, Any]:
         """Get labels from GPT API with structured output."""
@@ -226,11 +459,7 @@ class TaskSense:
             raise Exception("OPENAI_API_KEY not set")
         
         # Get prompt from template system or use fallback
-        if self.prompts:
-            reasoning_level = self.config.get("reasoning_level", "light")
-            prompt = self.prompts.get_prompt(mode, reasoning_level)
-        else:
-            prompt = self._get_fallback_prompt(mode)
+        prompt = self._get_base_prompt(mode)
         
         # Construct full prompt
         user_profile = self.config.get("user_profile", "")
@@ -266,7 +495,35 @@ Please respond with one or two relevant labels from the available labels list.""
         
         return prompt
     
-    def _call_openai_api(self, prompt: str) -> Optional[str]:
+    def _construct_batch_prompt(self, base_prompt: str, user_profile: str, task_contents: List[str], available_labels: List[str]) -> str:
+        """Construct one prompt asking GPT to label a numbered list of tasks."""
+        labels_str = ", ".join(available_labels)
+        tasks_str = "\n".join(f"{i}. {content}" for i, content in enumerate(task_contents, 1))
+        
+        prompt = f"""{base_prompt}
+
+User Profile: {user_profile}
+
+Available Labels: {labels_str}
+
+Tasks:
+{tasks_str}
+
+For each task, choose one or two relevant labels from the available labels list."""
+        
+        reasoning_level = self.config.get("reasoning_level", "light")
+        if reasoning_level == "deep":
+            prompt += " Give detailed reasoning and a confidence level (0.0-1.0) for each task."
+        else:
+            prompt += " Briefly explain your reasoning in one sentence per task."
+        
+        prompt += """
+
+Respond ONLY with JSON in this format, one entry per task:
+{"results": [{"i": 1, "labels": ["label"], "explanation": "...", "confidence": 0.8}]}"""
+        return prompt
+    
+    def _call_openai_api(self, prompt: str, max_tokens: int = 150) -> Optional[str]:
         """Call OpenAI API with fallback to direct HTTP."""
         model = self.config.get("model", "gpt-3.5-turbo")
         
@@ -282,7 +539,7 @@ Please respond with one or two relevant labels from the available labels list.""
                 response = client.chat.completions.create(
                     model=model,
                     messages=[{"role": "user", "content": prompt}],
-                    max_tokens=150,
+                    max_tokens=max_tokens,
                     temperature=0.3
                 )
                 
@@ -302,12 +559,10 @@ Please respond with one or two relevant labels from the available labels list.""
                     self.logger.error(f"OpenAI package error: {e}, falling back to HTTP")
         
         # Fallback to direct HTTP
-        return self._call_openai_http(prompt, model)
+        return self._call_openai_http(prompt, model, max_tokens)
     
-    def _call_openai_http(self, prompt: str, model: str) -> Optional[str]:
+    def _call_openai_http(self, prompt: str, model: str, max_tokens: int = 150) -> Optional[str]:
         """Direct HTTP call to OpenAI API."""
-        url = "https://api.openai.com/v1/chat/completions"
-        
         # Get cleaned API key
         api_key_raw = os.environ.get('OPENAI_API_KEY')
         api_key_cleaned = api_key_raw.strip() if api_key_raw else None
@@ -319,12 +574,12 @@ Please respond with one or two relevant labels from the available labels list.""
         data = {
             "model": model,
             "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 150,
+            "max_tokens": max_tokens,
             "temperature": 0.3
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = OPENAI_SESSION.post(OPENAI_CHAT_URL, headers=headers, json=data, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -348,8 +603,9 @@ Please respond with one or two relevant labels from the available labels list.""
         labels_line = lines[0] if lines else ""
         raw_labels = [label.strip().lower() for label in labels_line.split(',')]
         
-        # Filter to only available labels
-        valid_labels = [label for label in raw_labels if label in [l.lower() for l in available_labels]]
+        # Filter to only available labels (lowercased once, not once per candidate)
+        allowed = frozenset(label.lower() for label in available_labels)
+        valid_labels = [label for label in raw_labels if label in allowed]
         
         # Extract explanation if available
         explanation = ""
@@ -364,8 +620,50 @@ Please respond with one or two relevant labels from the available labels list.""
                 if confidence_match:
                     confidence = confidence_match
         
+        return self._gpt_result(valid_labels, explanation, confidence, mode)
+    
+    def _parse_gpt_batch_response(self, response_text: str, task_count: int, available_labels: List[str], mode: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Parse a batched GPT reply into {task index: result}.
+        
+        Entries that are malformed or out of range are dropped, so the caller can
+        label those tasks individually.
+        """
+        text = response_text.strip()
+        # Tolerate a ```json fenced reply
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            if self.logger:
+                self.logger.warning(f"TaskSense batch response was not valid JSON: {e}")
+            return {}
+        
+        entries = data.get("results", []) if isinstance(data, dict) else data
+        allowed = frozenset(label.lower() for label in available_labels)
+        parsed = {}
+        for entry in entries if isinstance(entries, list) else []:
+            try:
+                index = int(entry["i"]) - 1
+                raw_labels = entry.get("labels", [])
+                if isinstance(raw_labels, str):
+                    raw_labels = raw_labels.split(',')
+                valid_labels = [label for label in (str(l).strip().lower() for l in raw_labels) if label in allowed]
+                confidence = float(entry.get("confidence", 0.8))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            if 0 <= index < task_count:
+                parsed[index] = self._gpt_result(valid_labels, str(entry.get("explanation", "")).strip(), confidence, mode)
+        return parsed
+    
+    def _gpt_result(self, labels: List[str], explanation: str, confidence: float, mode: str) -> Dict[str, Any]:
+        """Build the structured result for labels suggested by GPT."""
         return {
-            "labels": valid_labels[:2],  # Limit to 2 labels
+            "labels": labels[:2],  # Limit to 2 labels
             "explanation": explanation,
             "confidence": confidence,
             "source": self.source,
@@ -379,16 +677,9 @@ Please respond with one or two relevant labels from the available labels list.""
     
     def _extract_confidence(self, text: str) -> Optional[float]:
         """Extract confidence score from text."""
-        import re
-        # Look for patterns like "confidence: 0.8" or "0.85 confidence"
-        patterns = [
-            r'confidence:\s*([0-9]\.[0-9]+)',
-            r'([0-9]\.[0-9]+)\s*confidence',
-            r'confidence\s*([0-9]\.[0-9]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        text_lower = text.lower()
+        for pattern in CONFIDENCE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 try:
                     return float(match.group(1))
@@ -449,19 +740,16 @@ Please respond with one or two relevant labels from the available labels list.""
                 }
             }
         
-        # Fallback heuristics if no config
-        if any(word in content_lower for word in ['clean', 'organize', 'house', 'home', 'garage']):
-            labels = ['home']
-            explanation = "Task involves home maintenance and organization"
-        elif any(word in content_lower for word in ['work', 'meeting', 'project', 'deadline']):
-            labels = ['work']
-            explanation = "Task is work-related and involves professional activities"
-        elif any(word in content_lower for word in ['doctor', 'appointment', 'pay', 'tax', 'bill']):
-            labels = ['admin']
-            explanation = "Task involves administrative or financial responsibilities"
-        elif any(word in content_lower for word in ['urgent', '!', 'asap', 'immediately']):
-            labels = ['urgent']
-            explanation = "Task has urgent priority indicators"
+        # Fallback heuristics if no config; the earliest heuristic with a keyword in the task wins
+        if MOCK_AUTOMATON is not None:
+            match_index = min((index for _, index in MOCK_AUTOMATON.iter(content_lower)), default=None)
+        else:
+            match_index = next((index for index, (keywords, _, _) in enumerate(MOCK_HEURISTICS)
+                                if any(word in content_lower for word in keywords)), None)
+        
+        if match_index is not None:
+            _, label, explanation = MOCK_HEURISTICS[match_index]
+            labels = [label]
         else:
             labels = ['personal']
             explanation = "Task appears to be personal in nature"
@@ -536,18 +824,17 @@ Please respond with one or two relevant labels from the available labels list.""
             # Use fallback weight for missing priority
             return fallback_weights.get('no_priority', 0.3)
     
-    def calculate_due_date_score(self, task: Dict[str, Any]) -> float:
+    def calculate_due_date_score(self, task: Dict[str, Any], now: Optional[datetime] = None) -> float:
         """
         Calculate due date proximity score for a task.
         
         Args:
             task: Task dictionary from Todoist API
+            now: Current UTC time, shared across a ranking pass (read from the clock if None)
             
         Returns:
             float: Due date score (0.0-1.0)
         """
-        from datetime import datetime, timezone
-        
         due_info = task.get('due')
         if not due_info or not due_info.get('date'):
             # Use fallback weight for no due date
@@ -563,12 +850,12 @@ Please respond with one or two relevant labels from the available labels list.""
                 # Full datetime
                 due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
             else:
-                # Date only - assume end of day
-                due_date = datetime.strptime(due_date_str, '%Y-%m-%d')
-                due_date = due_date.replace(hour=23, minute=59, second=59)
+                # Date only - assume end of day (fromisoformat is much cheaper than strptime)
+                due_date = datetime.fromisoformat(due_date_str).replace(hour=23, minute=59, second=59)
             
             # Get current time
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             if due_date.tzinfo is None:
                 due_date = due_date.replace(tzinfo=timezone.utc)
             
@@ -592,18 +879,17 @@ Please respond with one or two relevant labels from the available labels list.""
             fallback_weights = self.ranking_config.get('fallback_weights', {})
             return fallback_weights.get('no_due_date', 0.2)
     
-    def calculate_age_score(self, task: Dict[str, Any]) -> float:
+    def calculate_age_score(self, task: Dict[str, Any], now: Optional[datetime] = None) -> float:
         """
         Calculate age score for a task (older tasks get slight boost).
         
         Args:
             task: Task dictionary from Todoist API
+            now: Current UTC time, shared across a ranking pass (read from the clock if None)
             
         Returns:
             float: Age score (0.0-1.0)
         """
-        from datetime import datetime, timezone
-        
         created_at = task.get('created_at')
         if not created_at:
             return 0.1  # Default for missing creation date
@@ -616,7 +902,8 @@ Please respond with one or two relevant labels from the available labels list.""
                 created_date = created_at
             
             # Get current time
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             if created_date.tzinfo is None:
                 created_date = created_date.replace(tzinfo=timezone.utc)
             
@@ -670,7 +957,8 @@ Please respond with one or two relevant labels from the available labels list.""
         # Neutral score for non-preferred, non-excluded labels
         return 0.5
     
-    def calculate_composite_score(self, task: Dict[str, Any], mode: str, config_override: Optional[Dict] = None) -> Dict[str, Any]:
+    def calculate_composite_score(self, task: Dict[str, Any], mode: str, config_override: Optional[Dict] = None,
+                                  now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Calculate composite score for a task combining all scoring components.
         
@@ -678,6 +966,7 @@ Please respond with one or two relevant labels from the available labels list.""
             task: Task dictionary from Todoist API
             mode: Current mode (work, personal, weekend, evening)
             config_override: Optional config override
+            now: Current UTC time, shared across a ranking pass (read from the clock if None)
             
         Returns:
             dict: Score result with components and explanation
@@ -691,9 +980,11 @@ Please respond with one or two relevant labels from the available labels list.""
         weights = current_mode.get('weights') or config.get('scoring_weights', {})
         
         # Calculate individual component scores
+        if now is None:
+            now = datetime.now(timezone.utc)
         priority_score = self.calculate_priority_score(task)
-        due_date_score = self.calculate_due_date_score(task)
-        age_score = self.calculate_age_score(task)
+        due_date_score = self.calculate_due_date_score(task, now)
+        age_score = self.calculate_age_score(task, now)
         label_score = self.calculate_label_preference_score(task, mode)
         
         # Calculate weighted composite score
@@ -874,11 +1165,12 @@ Please respond with one or two relevant labels from the available labels list.""
                 self.logger.info("RANK_NO_CANDIDATES: No rankable tasks found (all completed, in Today section, or excluded)")
             return []
         
-        # Score all tasks
+        # Score all tasks against one clock reading
         scored_tasks = []
+        now = datetime.now(timezone.utc)
         for task in rankable_tasks:
             try:
-                score_result = self.calculate_composite_score(task, mode, config)
+                score_result = self.calculate_composite_score(task, mode, config, now)
                 
                 scored_task = {
                     'task': task,
@@ -900,11 +1192,8 @@ Please respond with one or two relevant labels from the available labels list.""
                     self.logger.error(f"Error scoring task {task.get('id', 'unknown')}: {e}")
                 continue
         
-        # Sort by score (descending)
-        scored_tasks.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Apply limit
-        ranked_tasks = scored_tasks[:limit]
+        # Select the top `limit` tasks by score (descending) without sorting every candidate
+        ranked_tasks = heapq.nlargest(limit, scored_tasks, key=lambda x: x['score'])
         
         # Log ranking summary
         if ranked_tasks and self.logger:
@@ -972,6 +1261,10 @@ Please respond with one or two relevant labels from the available labels list.""
             self.logger.info(f"GPT_RANK_START: Processing {len(candidates_to_process)} candidates for GPT-enhanced ranking (mode: {mode})")
             self.logger.info(f"GPT_RANK_CONFIG: Model={gpt_config.get('model', 'gpt-3.5-turbo')}, Max tokens={gpt_config.get('max_tokens', 1000)}, Cost limit=${cost_limit:.3f}")
         
+        # Reuse GPT results for tasks whose definition and base score haven't changed
+        use_cache = gpt_config.get('cache_enabled', False)
+        cache_updated = False
+        
         # Get GPT explanations for top candidates
         gpt_enhanced_tasks = []
         for i, ranked_task in enumerate(candidates_to_process):
@@ -979,20 +1272,34 @@ Please respond with one or two relevant labels from the available labels list.""
             base_score = ranked_task['score']
             base_explanation = ranked_task['explanation']
             
-            # Check cost limit before making API call
-            estimated_request_cost = self._estimate_gpt_request_cost(task, gpt_config)
-            if estimated_cost + estimated_request_cost > cost_limit:
-                if self.logger:
-                    task_id = task.get('id', 'unknown')
-                    self.logger.warning(f"GPT_RANK_COST_LIMIT: Stopping at task {task_id} | Estimated cost: ${estimated_cost + estimated_request_cost:.4f} > limit: ${cost_limit:.3f}")
-                break
+            cache_key = self._ranking_cache_key(task, base_score, mode) if use_cache else None
+            cached_result = self._get_cached_ranking(cache_key) if use_cache else None
             
-            # Get GPT explanation with cost tracking
-            gpt_result = self._get_gpt_ranking_explanation(task, base_score, base_explanation, mode, gpt_config)
-            
-            # Update actual cost
-            actual_cost = gpt_result.get('cost', estimated_request_cost)
-            estimated_cost += actual_cost
+            if cached_result:
+                gpt_result = dict(cached_result, cost=0.0)
+                actual_cost = 0.0
+                if self.logger:
+                    self.logger.info(f"GPT_RANK_CACHE_HIT: Task {task.get('id', 'unknown')} | Reusing previous GPT result")
+            else:
+                # Check cost limit before making API call
+                estimated_request_cost = self._estimate_gpt_request_cost(task, gpt_config)
+                if estimated_cost + estimated_request_cost > cost_limit:
+                    if self.logger:
+                        task_id = task.get('id', 'unknown')
+                        self.logger.warning(f"GPT_RANK_COST_LIMIT: Stopping at task {task_id} | Estimated cost: ${estimated_cost + estimated_request_cost:.4f} > limit: ${cost_limit:.3f}")
+                    break
+                
+                # Get GPT explanation with cost tracking
+                gpt_result = self._get_gpt_ranking_explanation(task, base_score, base_explanation, mode, gpt_config)
+                
+                # Update actual cost
+                actual_cost = gpt_result.get('cost', estimated_request_cost)
+                estimated_cost += actual_cost
+                
+                # Only cache real GPT answers, not fallbacks or mock responses
+                if use_cache and gpt_result.get('source') in ('gpt_enhanced', 'gpt_reranked') and gpt_result.get('model') != 'mock':
+                    self._ranking_cache[cache_key] = {'cached_at': time.time(), 'result': gpt_result}
+                    cache_updated = True
             
             # Apply confidence threshold filtering
             confidence_threshold = gpt_config.get('confidence_threshold', 0.7)
@@ -1043,6 +1350,9 @@ Please respond with one or two relevant labels from the available labels list.""
                 if gpt_result.get('recommendation') != 'standard':
                     self.logger.info(f"GPT_RANK_RECOMMENDATION: Task {task_id} | {gpt_result.get('recommendation', 'standard').upper()}: {gpt_result.get('reasoning', '')}")
         
+        if cache_updated:
+            self._save_ranking_cache()
+        
         # Sort by final score (which may include GPT reranking)
         gpt_enhanced_tasks.sort(key=lambda x: x['final_score'], reverse=True)
         
@@ -1072,6 +1382,58 @@ Please respond with one or two relevant labels from the available labels list.""
         
         return final_ranking
     
+    def _ranking_cache_key(self, task: Dict[str, Any], base_score: float, mode: str) -> str:
+        """
+        Build the GPT ranking cache key for a task.
+        
+        The key covers everything the ranking prompt is built from: the task
+        definition, the mode, and the base score (which carries the time-dependent
+        due date and age components).
+        """
+        task_definition = json.dumps([
+            task.get('content', ''),
+            task.get('description', ''),
+            task.get('priority'),
+            task.get('due'),
+            sorted(task.get('labels', []))
+        ], sort_keys=True, default=str)
+        content_hash = hashlib.sha1(task_definition.encode('utf-8')).hexdigest()
+        return f"{task.get('id', 'unknown')}:{content_hash}:{mode}:{base_score}"
+    
+    def _load_ranking_cache(self) -> Dict[str, Any]:
+        """Load the persisted GPT ranking cache (once per instance)"""
+        if self._ranking_cache is None:
+            try:
+                with open(self.ranking_cache_path, 'r') as f:
+                    self._ranking_cache = json.load(f)
+            except FileNotFoundError:
+                self._ranking_cache = {}
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"GPT_RANK_CACHE_ERROR: Could not read {self.ranking_cache_path}: {e}")
+                self._ranking_cache = {}
+        return self._ranking_cache
+    
+    def _get_cached_ranking(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached GPT ranking result if it is younger than RANKING_CACHE_TTL, else None"""
+        entry = self._load_ranking_cache().get(cache_key)
+        # Entries written before expiry was tracked have no cached_at and are treated as expired
+        if isinstance(entry, dict) and entry.get('cached_at', 0) > time.time() - RANKING_CACHE_TTL.total_seconds():
+            return entry.get('result')
+        return None
+    
+    def _save_ranking_cache(self):
+        """Persist the GPT ranking cache, dropping expired entries"""
+        min_cached_at = time.time() - RANKING_CACHE_TTL.total_seconds()
+        self._ranking_cache = {key: entry for key, entry in self._ranking_cache.items()
+                               if isinstance(entry, dict) and entry.get('cached_at', 0) > min_cached_at}
+        try:
+            with open(self.ranking_cache_path, 'w') as f:
+                json.dump(self._ranking_cache, f)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"GPT_RANK_CACHE_ERROR: Could not write {self.ranking_cache_path}: {e}")
+    
     def _get_gpt_ranking_explanation(self, task: Dict[str, Any], base_score: float, base_explanation: str, mode: str, gpt_config: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Get GPT explanation and potential reranking for a task.
@@ -1280,8 +1642,6 @@ Respond ONLY with valid JSON. Do not include any text before or after the JSON r
     
     def _parse_gpt_ranking_response_regex_fallback(self, response: str, task: Dict[str, Any], base_score: float, base_explanation: str) -> Dict[str, Any]:
         """Fallback regex-based parsing for non-JSON GPT responses."""
-        import re
-        
         # Default values
         result = {
             'explanation': base_explanation,
@@ -1297,18 +1657,18 @@ Respond ONLY with valid JSON. Do not include any text before or after the JSON r
         
         try:
             # Extract explanation
-            explanation_match = re.search(r'EXPLANATION:\s*(.+?)(?=CONFIDENCE:|RERANK_SCORE:|$)', response, re.DOTALL)
+            explanation_match = RANKING_EXPLANATION_RE.search(response)
             if explanation_match:
                 result['explanation'] = explanation_match.group(1).strip()
                 result['source'] = 'gpt_enhanced'
             
             # Extract confidence
-            confidence_match = re.search(r'CONFIDENCE:\s*([0-9]*\.?[0-9]+)', response)
+            confidence_match = RANKING_CONFIDENCE_RE.search(response)
             if confidence_match:
                 result['confidence'] = float(confidence_match.group(1))
             
             # Extract rerank score
-            rerank_match = re.search(r'RERANK_SCORE:\s*([0-9]*\.?[0-9]+)', response)
+            rerank_match = RANKING_SCORE_RE.search(response)
             if rerank_match:
                 new_score = float(rerank_match.group(1))
                 # Only accept reasonable score adjustments (within 0.0-1.0 range)
@@ -1443,4 +1803,58 @@ Respond ONLY with valid JSON. Do not include any text before or after the JSON r
         estimated_cost = (total_input_tokens * model_pricing['input'] + 
                          estimated_output_tokens * model_pricing['output'])
         
-        return estimated_cost
\ No newline at end of file
+        return estimated_cost
+
+
+class TaskSenseBatcher:
+    """
+    Coalesce label() calls made concurrently from worker threads into label_batch requests.
+    
+    The first caller to arrive waits up to `max_wait_ms` for other callers (or until
+    `max_batch` tasks are queued), then labels the whole group in one batch and hands
+    each caller its own result. Callers use it exactly like TaskSense.label().
+    """
+    
+    def __init__(self, task_sense: TaskSense, max_batch: int = 16, max_wait_ms: int = 50):
+        self.task_sense = task_sense
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._ready = threading.Condition()
+        self._pending = {}  # (mode, labels) -> [(task_content, future)]
+    
+    def label(self,
+              task_content: str,
+              available_labels: Optional[List[str]] = None,
+              dry_run: bool = False,
+              mode: Optional[str] = None) -> Dict[str, Any]:
+        """Label a task, sharing one GPT request with any concurrent callers."""
+        if dry_run:
+            return self.task_sense.label(task_content, available_labels, dry_run, mode)
+        
+        key = (mode, tuple(available_labels) if available_labels is not None else None)
+        future = Future()
+        with self._ready:
+            queue = self._pending.setdefault(key, [])
+            queue.append((task_content, future))
+            leader = len(queue) == 1
+            if len(queue) >= self.max_batch:
+                self._ready.notify_all()
+        
+        if leader:
+            with self._ready:
+                self._ready.wait_for(lambda: len(self._pending[key]) >= self.max_batch, timeout=self.max_wait)
+                batch = self._pending.pop(key)
+            self._run_batch(batch, available_labels, mode)
+        
+        return future.result()
+    
+    def _run_batch(self, batch: List[tuple], available_labels: Optional[List[str]], mode: Optional[str]):
+        """Label a collected batch and resolve each caller's future."""
+        try:
+            results = self.task_sense.label_batch([content for content, _ in batch], available_labels, mode=mode)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)